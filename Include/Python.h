@@ -85,6 +85,7 @@
 #include "complexobject.h"
 #include "rangeobject.h"
 #include "memoryobject.h"
+#include "picklebufobject.h"
 #include "tupleobject.h"
 #include "listobject.h"
 #include "dictobject.h"
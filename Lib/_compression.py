@@ -1,6 +1,8 @@
 """Internal classes used by the gzip, lzma and bz2 modules"""
 
+import collections
 import io
+import os
 
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
@@ -150,3 +152,88 @@ class DecompressReader(io.RawIOBase):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ParallelCompressor:
+    """Compresses written data in blocks on a thread pool.
+
+    compress_block(block, previous) is called on a worker thread for each
+    block, with the block before it (or b'' for the first one), and must
+    return the compressed data for that block.  The results are written to
+    fp in order, on the calling thread.  The compressors release the GIL,
+    so the blocks are compressed concurrently.
+    """
+
+    def __init__(self, fp, compress_block, block_size, threads):
+        from concurrent.futures import ThreadPoolExecutor
+        self._fp = fp
+        self._compress_block = compress_block
+        self._block_size = block_size
+        self._executor = ThreadPoolExecutor(threads)
+        # Bound the memory used by blocks waiting to be compressed or written.
+        self._max_pending = 2 * threads
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self._previous = b''
+        self.blocks = 0
+
+    def write(self, data):
+        buffer = self._buffer
+        buffer += data
+        block_size = self._block_size
+        if len(buffer) >= block_size:
+            start = 0
+            while len(buffer) - start >= block_size:
+                self._submit(bytes(buffer[start:start + block_size]))
+                start += block_size
+            del buffer[:start]
+
+    def _submit(self, block):
+        self._pending.append(self._executor.submit(self._compress_block,
+                                                   block, self._previous))
+        self._previous = block
+        self.blocks += 1
+        while len(self._pending) > self._max_pending:
+            self._fp.write(self._pending.popleft().result())
+
+    def flush(self, reset=False):
+        """Compress the buffered data and write out all pending blocks.
+
+        If reset is true, the next block is compressed without the previous
+        one, so that the data written after this point can be decompressed
+        on its own.
+        """
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        if reset:
+            self._previous = b''
+        while self._pending:
+            self._fp.write(self._pending.popleft().result())
+
+    def close(self):
+        """Flush, compressing an empty block if no data was written at all,
+        and shut the thread pool down.
+        """
+        try:
+            if not self.blocks and not self._buffer:
+                self._submit(b'')
+            self.flush()
+        finally:
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._executor.shutdown()
+
+
+def check_threads(threads, writing):
+    """Validate the threads argument of a compressed file and return the
+    number of compression threads, None meaning the number of CPUs.
+    """
+    if threads is None:
+        threads = os.cpu_count() or 1
+    elif threads < 1:
+        raise ValueError("threads must be at least 1")
+    if threads > 1 and not writing:
+        raise ValueError("threads is only supported for writing")
+    return threads
@@ -9,6 +9,8 @@ __all__ = 'BaseSelectorEventLoop',
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -28,6 +30,20 @@ from . import transports
 from .log import logger
 
 
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+if _HAS_SENDMSG:
+    try:
+        _IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        # Fallback to send()
+        _HAS_SENDMSG = False
+    else:
+        if _IOV_MAX <= 0:
+            # No definite limit: use the POSIX minimum (_XOPEN_IOV_MAX).
+            _IOV_MAX = 16
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -716,8 +732,18 @@ class _SelectorTransport(transports._FlowControlMixin,
         self._loop._add_reader(fd, callback, *args)
 
 
+def _own_buffer(data):
+    # The write buffer keeps a reference to read-only data, but copies
+    # anything the caller is free to modify once write() returns.
+    view = memoryview(data)
+    if view.readonly:
+        return view.cast('B')
+    return memoryview(bytes(view))
+
+
 class _SelectorSocketTransport(_SelectorTransport):
 
+    _buffer_factory = collections.deque
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
 
@@ -872,43 +898,107 @@ class _SelectorSocketTransport(_SelectorTransport):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
+                data = memoryview(data).cast('B')[n:]
                 if not data:
                     return
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        self._buffer.append(_own_buffer(data))
         self._maybe_pause_protocol()
 
-    def _write_ready(self):
+    def writelines(self, list_of_data):
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to writelines; sendfile is in progress')
+        # Unlike the default implementation, don't join the buffers: they
+        # are queued as they are and sent with a single sendmsg() call.
+        buffers = [_own_buffer(data) for data in list_of_data]
+        buffers = [buf for buf in buffers if buf]
+        if not buffers:
+            return
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        if self._buffer:
+            self._buffer.extend(buffers)
+        else:
+            # Optimization: try to send now.
+            self._buffer.extend(buffers)
+            self._write_ready()
+            if self._buffer:
+                # Not all was written; register write handler.
+                self._loop._add_writer(self._sock_fd, self._write_ready)
+        self._maybe_pause_protocol()
+
+    def _write_sendmsg(self):
+        assert self._buffer, 'Data should not be empty'
+
+        if self._conn_lost:
+            return
+        try:
+            n = self._sock.sendmsg(itertools.islice(self._buffer, _IOV_MAX))
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception as exc:
+            self._write_error(exc)
+        else:
+            self._consume_buffer(n)
+            self._write_done()
+
+    def _write_send(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
         try:
-            n = self._sock.send(self._buffer)
+            n = self._sock.send(self._buffer[0])
         except (BlockingIOError, InterruptedError):
             pass
         except Exception as exc:
+            self._write_error(exc)
+        else:
+            self._consume_buffer(n)
+            self._write_done()
+
+    if _HAS_SENDMSG:
+        _write_ready = _write_sendmsg
+    else:
+        _write_ready = _write_send
+
+    def _consume_buffer(self, n):
+        # Drop the first n bytes, which have been sent, from the buffer.
+        buffer = self._buffer
+        while n:
+            data = buffer.popleft()
+            if len(data) > n:
+                buffer.appendleft(data[n:])
+                break
+            n -= len(data)
+
+    def _write_error(self, exc):
+        self._loop._remove_writer(self._sock_fd)
+        self._buffer.clear()
+        self._fatal_error(exc, 'Fatal write error on socket transport')
+        if self._empty_waiter is not None:
+            self._empty_waiter.set_exception(exc)
+
+    def _write_done(self):
+        self._maybe_resume_protocol()  # May append to buffer.
+        if not self._buffer:
             self._loop._remove_writer(self._sock_fd)
-            self._buffer.clear()
-            self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
-                self._empty_waiter.set_exception(exc)
-        else:
-            if n:
-                del self._buffer[:n]
-            self._maybe_resume_protocol()  # May append to buffer.
-            if not self._buffer:
-                self._loop._remove_writer(self._sock_fd)
-                if self._empty_waiter is not None:
-                    self._empty_waiter.set_result(None)
-                if self._closing:
-                    self._call_connection_lost(None)
-                elif self._eof:
-                    self._sock.shutdown(socket.SHUT_WR)
+                self._empty_waiter.set_result(None)
+            if self._closing:
+                self._call_connection_lost(None)
+            elif self._eof:
+                self._sock.shutdown(socket.SHUT_WR)
 
     def write_eof(self):
         if self._closing or self._eof:
@@ -920,6 +1010,9 @@ class _SelectorSocketTransport(_SelectorTransport):
     def can_write_eof(self):
         return True
 
+    def get_write_buffer_size(self):
+        return sum(map(len, self._buffer))
+
     def _call_connection_lost(self, exc):
         super()._call_connection_lost(exc)
         if self._empty_waiter is not None:
@@ -1,5 +1,6 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
+    'BufferedStreamReaderProtocol',
     'open_connection', 'start_server',
     'IncompleteReadError', 'LimitOverrunError',
 )
@@ -17,6 +18,7 @@ from .tasks import sleep
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 2 ** 16  # 64 KiB
 
 
 class IncompleteReadError(EOFError):
@@ -72,7 +74,7 @@ async def open_connection(host=None, port=None, *,
     if loop is None:
         loop = events.get_event_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -107,8 +109,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -123,7 +125,7 @@ if hasattr(socket, 'AF_UNIX'):
         if loop is None:
             loop = events.get_event_loop()
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -137,8 +139,9 @@ if hasattr(socket, 'AF_UNIX'):
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = BufferedStreamReaderProtocol(reader,
+                                                    client_connected_cb,
+                                                    loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -273,6 +276,33 @@ class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
             closed.exception()
 
 
+class BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                   protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data with the BufferedProtocol API.
+
+    Transports which support it read incoming data directly into a receive
+    buffer allocated once per connection, instead of allocating a new bytes
+    object for every chunk of data.  Other transports keep calling
+    data_received().
+    """
+
+    def __init__(self, stream_reader, client_connected_cb=None, loop=None):
+        super().__init__(stream_reader, client_connected_cb, loop=loop)
+        self._recv_buffer = None
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        self._recv_buffer = None
+
+    def get_buffer(self, sizehint):
+        if self._recv_buffer is None:
+            self._recv_buffer = memoryview(bytearray(_RECV_BUFFER_SIZE))
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        self._stream_reader.feed_data(self._recv_buffer[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -411,6 +441,12 @@ class StreamReader:
         assert self._transport is None, 'Transport already set'
         self._transport = transport
 
+    def _consume(self, n):
+        """Remove up to n bytes from the buffer and return them."""
+        data = bytes(memoryview(self._buffer)[:n])
+        del self._buffer[:n]
+        return data
+
     def _maybe_resume_transport(self):
         if self._paused and len(self._buffer) <= self._limit:
             self._paused = False
@@ -591,10 +627,9 @@ class StreamReader:
             raise LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
+        chunk = self._consume(isep + seplen)
         self._maybe_resume_transport()
-        return bytes(chunk)
+        return chunk
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -640,12 +675,46 @@ class StreamReader:
             await self._wait_for_data('read')
 
         # This will work right even if buffer is less than n bytes
-        data = bytes(self._buffer[:n])
-        del self._buffer[:n]
+        data = self._consume(n)
 
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read.  Like read(), this function waits
+        for at least one byte to be available, unless the EOF was received
+        and the internal buffer is empty, in which case it returns 0.
+
+        The data is copied from the internal buffer straight into *buffer*,
+        which must be a writable bytes-like object, without creating an
+        intermediate bytes object.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        view = memoryview(buffer).cast('B')
+        if view.readonly:
+            raise TypeError('readinto() argument must be a writable '
+                            'bytes-like object')
+
+        if self._exception is not None:
+            raise self._exception
+
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data('readinto')
+
+        n = min(len(view), len(self._buffer))
+        view[:n] = memoryview(self._buffer)[:n]
+        del self._buffer[:n]
+
+        self._maybe_resume_transport()
+        return n
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
@@ -682,8 +751,7 @@ class StreamReader:
             data = bytes(self._buffer)
             self._buffer.clear()
         else:
-            data = bytes(self._buffer[:n])
-            del self._buffer[:n]
+            data = self._consume(n)
         self._maybe_resume_transport()
         return data
 
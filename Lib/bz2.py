@@ -10,6 +10,7 @@ __all__ = ["BZ2File", "BZ2Compressor", "BZ2Decompressor",
 __author__ = "Nadeem Vawda <nadeem.vawda@gmail.com>"
 
 from builtins import open as _builtin_open
+import functools
 import io
 import os
 import warnings
@@ -36,7 +37,8 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", buffering=None, compresslevel=9):
+    def __init__(self, filename, mode="r", buffering=None, compresslevel=9,
+                 *, threads=1):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -55,6 +57,12 @@ class BZ2File(_compression.BaseStream):
 
         If mode is 'r', the input file may be the concatenation of
         multiple compressed streams.
+
+        If mode is 'w', 'x' or 'a', threads can be greater than 1 (or None
+        for the number of CPUs) to compress blocks of 100k times
+        compresslevel bytes concurrently. Each block is written as an
+        independent bzip2 stream, so the file can be read by any
+        decompressor that supports concatenated streams.
         """
         # This lock must be recursive, so that BufferedIOBase's
         # writelines() does not deadlock.
@@ -62,6 +70,7 @@ class BZ2File(_compression.BaseStream):
         self._fp = None
         self._closefp = False
         self._mode = _MODE_CLOSED
+        self._parallel = None
 
         if buffering is not None:
             warnings.warn("Use of 'buffering' argument is deprecated",
@@ -87,6 +96,8 @@ class BZ2File(_compression.BaseStream):
             self._compressor = BZ2Compressor(compresslevel)
         else:
             raise ValueError("Invalid mode: %r" % (mode,))
+        threads = _compression.check_threads(threads,
+                                             mode_code == _MODE_WRITE)
 
         if isinstance(filename, (str, bytes, os.PathLike)):
             self._fp = _builtin_open(filename, mode)
@@ -104,6 +115,10 @@ class BZ2File(_compression.BaseStream):
             self._buffer = io.BufferedReader(raw)
         else:
             self._pos = 0
+            if threads > 1:
+                self._parallel = _compression.ParallelCompressor(
+                    self._fp, functools.partial(_compress_block, compresslevel),
+                    compresslevel * _BLOCK_SIZE_UNIT, threads)
 
     def close(self):
         """Flush and close the file.
@@ -117,6 +132,9 @@ class BZ2File(_compression.BaseStream):
             try:
                 if self._mode == _MODE_READ:
                     self._buffer.close()
+                elif self._parallel is not None:
+                    self._parallel.close()
+                    self._compressor = None
                 elif self._mode == _MODE_WRITE:
                     self._fp.write(self._compressor.flush())
                     self._compressor = None
@@ -129,6 +147,7 @@ class BZ2File(_compression.BaseStream):
                     self._closefp = False
                     self._mode = _MODE_CLOSED
                     self._buffer = None
+                    self._parallel = None
 
     @property
     def closed(self):
@@ -238,8 +257,11 @@ class BZ2File(_compression.BaseStream):
         """
         with self._lock:
             self._check_can_write()
-            compressed = self._compressor.compress(data)
-            self._fp.write(compressed)
+            if self._parallel is not None:
+                self._parallel.write(data)
+            else:
+                compressed = self._compressor.compress(data)
+                self._fp.write(compressed)
             self._pos += len(data)
             return len(data)
 
@@ -283,7 +305,7 @@ class BZ2File(_compression.BaseStream):
 
 
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1):
     """Open a bzip2-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str, bytes, or
@@ -295,8 +317,9 @@ def open(filename, mode="rb", compresslevel=9,
     The default mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the BZ2File
-    constructor: BZ2File(filename, mode, compresslevel). In this case,
-    the encoding, errors and newline arguments must not be provided.
+    constructor: BZ2File(filename, mode, compresslevel, threads=threads).
+    In this case, the encoding, errors and newline arguments must not be
+    provided.
 
     For text mode, a BZ2File object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error
@@ -315,7 +338,8 @@ def open(filename, mode="rb", compresslevel=9,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel)
+    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel,
+                          threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -323,6 +347,14 @@ def open(filename, mode="rb", compresslevel=9,
         return binary_file
 
 
+# bzip2 compresses its input in blocks of compresslevel * 100k bytes.
+_BLOCK_SIZE_UNIT = 100000
+
+
+def _compress_block(compresslevel, block, previous):
+    return compress(block, compresslevel)
+
+
 def compress(data, compresslevel=9):
     """Compress a block of data.
 
@@ -63,7 +63,8 @@ class _WorkItem(object):
             self.future.set_result(result)
 
 
-def _worker(executor_reference, work_queue, initializer, initargs):
+def _worker(executor_reference, work_queue, initializer, initargs,
+            idle_timeout=None):
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -75,11 +76,26 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             return
     try:
         while True:
-            work_item = work_queue.get(block=True)
+            try:
+                work_item = work_queue.get(block=True, timeout=idle_timeout)
+            except queue.Empty:
+                # The worker has been idle for idle_timeout seconds: retire
+                # it unless a submitter has already counted on it.
+                executor = executor_reference()
+                if executor is not None and executor._retire_worker():
+                    return
+                del executor
+                continue
             if work_item is not None:
                 work_item.run()
                 # Delete references to object. See issue16284
                 del work_item
+
+                # attempt to increment idle count
+                executor = executor_reference()
+                if executor is not None:
+                    executor._idle_semaphore.release()
+                del executor
                 continue
             executor = executor_reference()
             # Exit if:
@@ -111,7 +127,7 @@ class ThreadPoolExecutor(_base.Executor):
     _counter = itertools.count().__next__
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), idle_timeout=None):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -120,6 +136,9 @@ class ThreadPoolExecutor(_base.Executor):
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: An callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            idle_timeout: The number of seconds a worker thread may stay
+                idle before it exits. If None, idle threads are kept until
+                the executor is shut down.
         """
         if max_workers is None:
             # Use this number because ThreadPoolExecutor is often
@@ -131,9 +150,15 @@ class ThreadPoolExecutor(_base.Executor):
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
 
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+
         self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
         self._work_queue = queue.SimpleQueue()
+        self._idle_semaphore = threading.Semaphore(0)
         self._threads = set()
+        self._thread_counter = itertools.count().__next__
         self._broken = False
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
@@ -166,22 +191,40 @@ class ThreadPoolExecutor(_base.Executor):
         # the worker threads.
         def weakref_cb(_, q=self._work_queue):
             q.put(None)
-        # TODO(bquinlan): Should avoid creating new threads if there are more
-        # idle threads than items in the work queue.
+
+        # if idle threads are available, don't spin new threads
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
-                                     num_threads)
+                                     self._thread_counter())
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._work_queue,
                                        self._initializer,
-                                       self._initargs))
+                                       self._initargs,
+                                       self._idle_timeout))
             t.daemon = True
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    def _retire_worker(self):
+        # Called by a worker thread that timed out waiting for work.  The
+        # worker may only exit if it can take back its idle token; otherwise
+        # a submit() call has already relied on it to run a queued item.
+        with self._shutdown_lock:
+            if self._shutdown or _shutdown:
+                return False
+            if not self._idle_semaphore.acquire(timeout=0):
+                return False
+            t = threading.current_thread()
+            self._threads.discard(t)
+            _threads_queues.pop(t, None)
+            return True
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
@@ -200,6 +243,6 @@ class ThreadPoolExecutor(_base.Executor):
             self._shutdown = True
             self._work_queue.put(None)
         if wait:
-            for t in self._threads:
+            for t in list(self._threads):
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
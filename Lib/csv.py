@@ -9,9 +9,8 @@ from _csv import Error, __version__, writer, reader, register_dialect, \
                  field_size_limit, \
                  QUOTE_MINIMAL, QUOTE_ALL, QUOTE_NONNUMERIC, QUOTE_NONE, \
                  __doc__
-from _csv import Dialect as _Dialect
+from _csv import Dialect as _Dialect, dictreader as _dictreader
 
-from collections import OrderedDict
 from io import StringIO
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
@@ -80,13 +79,15 @@ register_dialect("unix", unix_dialect)
 
 class DictReader:
     def __init__(self, f, fieldnames=None, restkey=None, restval=None,
-                 dialect="excel", *args, **kwds):
+                 dialect="excel", *args, converters=None, **kwds):
         self._fieldnames = fieldnames   # list of keys for the dict
         self.restkey = restkey          # key to catch long rows
         self.restval = restval          # default value for short rows
+        self.converters = converters    # sequence or dict of converters
         self.reader = reader(f, dialect, *args, **kwds)
         self.dialect = dialect
         self.line_num = 0
+        self._rows = None               # C iterator doing the work
 
     def __iter__(self):
         return self
@@ -104,28 +105,36 @@ class DictReader:
     @fieldnames.setter
     def fieldnames(self, value):
         self._fieldnames = value
+        self._rows = None
+
+    def _get_rows(self):
+        if self._rows is None:
+            fieldnames = self.fieldnames
+            if fieldnames is None:
+                return _dictreader(self.reader, ())
+            # The converters only apply to the rows after the header.
+            converters = self.converters
+            if isinstance(converters, dict):
+                converters = [converters.get(name) for name in fieldnames]
+            self.reader.converters = converters
+            self._rows = _dictreader(self.reader, fieldnames,
+                                     self.restkey, self.restval)
+        return self._rows
 
     def __next__(self):
-        if self.line_num == 0:
-            # Used only for its side effect.
-            self.fieldnames
-        row = next(self.reader)
-        self.line_num = self.reader.line_num
+        try:
+            return next(self._get_rows())
+        finally:
+            self.line_num = self.reader.line_num
 
-        # unlike the basic reader, we prefer not to return blanks,
-        # because we will typically wind up with a dict full of None
-        # values
-        while row == []:
-            row = next(self.reader)
-        d = OrderedDict(zip(self.fieldnames, row))
-        lf = len(self.fieldnames)
-        lr = len(row)
-        if lf < lr:
-            d[self.restkey] = row[lf:]
-        elif lf > lr:
-            for key in self.fieldnames[lr:]:
-                d[key] = self.restval
-        return d
+    def readrows(self, n=-1):
+        """Return a list of up to n rows, or of all remaining rows if n
+        is negative or None.
+        """
+        try:
+            return self._get_rows().readrows(n)
+        finally:
+            self.line_num = self.reader.line_num
 
 
 class DictWriter:
@@ -8,20 +8,21 @@ XXX TO DO:
 
 - seems to contain a bug when updating...
 
-- reclaim free space (currently, space once occupied by deleted or expanded
-items is never reused)
+- reuse free space (currently, space once occupied by deleted or expanded
+items is only reclaimed by reorganize())
 
 - support concurrent access (currently, if two processes take turns making
 updates, they can mess up the index)
 
 - support efficient access to large databases (currently, the whole index
-is read when the database is opened, and some updates rewrite the whole index)
+is read when the database is opened)
 
 - support opening for read-only (flag = 'm')
 
 """
 
 import ast as _ast
+import contextlib as _contextlib
 import io as _io
 import os as _os
 import collections.abc
@@ -34,10 +35,10 @@ error = OSError
 
 class _Database(collections.abc.MutableMapping):
 
-    # The on-disk directory and data files can remain in mutually
-    # inconsistent states for an arbitrarily long time (see comments
-    # at the end of __setitem__).  This is only repaired when _commit()
-    # gets called.  One place _commit() gets called is from __del__(),
+    # Within batch(), the on-disk directory file can lag behind the
+    # in-memory index for an arbitrarily long time, and stale lines
+    # accumulate in it until it is compacted.  This is only repaired when
+    # _commit() gets called.  One place _commit() gets called is from __del__(),
     # and if that occurs at program shutdown time, module globals may
     # already have gotten rebound to None.  Since it's crucial that
     # _commit() finish successfully, we can't ignore shutdown races
@@ -53,7 +54,11 @@ class _Database(collections.abc.MutableMapping):
         #    "%r, (%d, %d)\n" % (key, pos, siz)
         # where key is the string key, pos is the offset into the dat
         # file of the associated value's first byte, and siz is the number
-        # of bytes in the associated value.
+        # of bytes in the associated value.  Lines are appended as keys
+        # are added, changed and deleted (deletions are written as
+        #    "%r, None\n" % key
+        # lines), and the last line for a key wins; the file is rewritten
+        # with one line per key when too many lines are stale.
         self._dirfile = filebasename + '.dir'
 
         # The data file is a binary file pointed into by the directory
@@ -63,20 +68,33 @@ class _Database(collections.abc.MutableMapping):
         self._datfile = filebasename + '.dat'
         self._bakfile = filebasename + '.bak'
 
+        # reorganize() writes the new files under these names first.
+        self._dattmpfile = self._datfile + '.tmp'
+        self._dirtmpfile = self._dirfile + '.tmp'
+
         # The index is an in-memory dict, mirroring the directory file.
         self._index = None  # maps keys to (pos, siz) pairs
 
+        # Within batch(), the data file is kept open and the lines to
+        # append to the directory file are collected in _pending.
+        self._batch_depth = 0
+        self._datf = None
+        self._pending = []
+
         # Handle the creation
         self._create(flag)
         self._update(flag)
 
     def _create(self, flag):
         if flag == 'n':
-            for filename in (self._datfile, self._bakfile, self._dirfile):
+            for filename in (self._datfile, self._bakfile, self._dirfile,
+                             self._dattmpfile, self._dirtmpfile):
                 try:
                     _os.remove(filename)
                 except OSError:
                     pass
+        else:
+            self._recover()
         # Mod by Jack: create data file if needed
         try:
             f = _io.open(self._datfile, 'r', encoding="Latin-1")
@@ -88,10 +106,31 @@ class _Database(collections.abc.MutableMapping):
         else:
             f.close()
 
+    # Finish or undo a reorganize() which was interrupted.
+    def _recover(self):
+        if not _os.path.exists(self._dirtmpfile):
+            if _os.path.exists(self._dattmpfile) and not self._readonly:
+                _os.remove(self._dattmpfile)
+        elif _os.path.exists(self._dattmpfile):
+            # The data file was not replaced yet: the database is unchanged.
+            if not self._readonly:
+                _os.remove(self._dattmpfile)
+                _os.remove(self._dirtmpfile)
+        elif self._readonly:
+            # The data file was replaced, but not the directory file.
+            self._dirfile = self._dirtmpfile
+        else:
+            _os.replace(self._dirtmpfile, self._dirfile)
+
     # Read directory file into the in-memory index dict.
     def _update(self, flag):
+        # _modified is set when the directory file must be rewritten on
+        # close: it is missing, or it holds deletion lines, which older
+        # versions can't read.
         self._modified = False
         self._index = {}
+        # The number of lines in the directory file.
+        self._loglen = 0
         try:
             f = _io.open(self._dirfile, 'r', encoding="Latin-1")
         except OSError:
@@ -104,18 +143,34 @@ class _Database(collections.abc.MutableMapping):
                     line = line.rstrip()
                     key, pos_and_siz_pair = _ast.literal_eval(line)
                     key = key.encode('Latin-1')
-                    self._index[key] = pos_and_siz_pair
-
-    # Write the index dict to the directory file.  The original directory
-    # file (if any) is renamed with a .bak extension first.  If a .bak
-    # file currently exists, it's deleted.
-    def _commit(self):
+                    if pos_and_siz_pair is None:
+                        self._index.pop(key, None)
+                        self._modified = True
+                    else:
+                        self._index[key] = pos_and_siz_pair
+                    self._loglen += 1
+
+    # Write the pending lines, and rewrite the directory file if it holds
+    # more than twice as many lines as there are keys (or if it must be
+    # rewritten and the database is being closed).
+    def _commit(self, closing=False):
         # CAUTION:  It's vital that _commit() succeed, and _commit() can
         # be called from __del__().  Therefore we must never reference a
         # global in this routine.
-        if self._index is None or not self._modified:
+        if self._index is None or self._readonly:
             return  # nothing to do
-
+        self._flush()
+        if not ((closing and self._modified) or
+                self._loglen > 2 * len(self._index) + self._COMPACT_SLACK):
+            return  # nothing to do
+        self._write_index()
+
+    # Rewrite the directory file with one line per key.  The original
+    # directory file (if any) is renamed with a .bak extension first.  If a
+    # .bak file currently exists, it's deleted.
+    def _write_index(self):
+        # CAUTION:  This is called from _commit(), so it must never reference
+        # a global.
         try:
             self._os.unlink(self._bakfile)
         except OSError:
@@ -133,8 +188,61 @@ class _Database(collections.abc.MutableMapping):
                 # position; UTF-8, though, does care sometimes.
                 entry = "%r, %r\n" % (key.decode('Latin-1'), pos_and_siz_pair)
                 f.write(entry)
+        self._loglen = len(self._index)
+        self._modified = False
 
-    sync = _commit
+    # Don't rewrite the directory file for a handful of stale lines.
+    _COMPACT_SLACK = 100
+
+    def sync(self):
+        self._commit()
+
+    # Append the pending lines to the directory file.
+    def _flush(self):
+        # CAUTION:  This is called from _commit(), so it must never reference
+        # a global.
+        if self._datf is not None:
+            # Values must be on disk before the index refers to them.
+            self._datf.flush()
+        if self._pending:
+            with self._io.open(self._dirfile, 'a', encoding="Latin-1") as f:
+                self._chmod(self._dirfile)
+                f.writelines(self._pending)
+            self._pending.clear()
+
+    # Record in the directory file that key is now associated with
+    # pos_and_siz_pair, or deleted if it is None.
+    def _log(self, key, pos_and_siz_pair):
+        entry = "%r, %r\n" % (key.decode("Latin-1"), pos_and_siz_pair)
+        self._loglen += 1
+        if self._batch_depth:
+            self._pending.append(entry)
+        else:
+            with _io.open(self._dirfile, 'a', encoding="Latin-1") as f:
+                self._chmod(self._dirfile)
+                f.write(entry)
+            self._commit()
+
+    @_contextlib.contextmanager
+    def batch(self):
+        """Defer the writes to the directory file until the end of the
+        with block, and keep the data file open meanwhile."""
+        self._verify_open()
+        if not self._batch_depth:
+            self._datf = _io.open(self._datfile,
+                                  'rb' if self._readonly else 'rb+')
+            self._datend = self._datf.seek(0, 2)
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._datf is not None:
+                try:
+                    self._commit()
+                finally:
+                    self._datf.close()
+                    self._datf = None
 
     def _verify_open(self):
         if self._index is None:
@@ -145,6 +253,9 @@ class _Database(collections.abc.MutableMapping):
             key = key.encode('utf-8')
         self._verify_open()
         pos, siz = self._index[key]     # may raise KeyError
+        if self._datf is not None:
+            self._datf.seek(pos)
+            return self._datf.read(siz)
         with _io.open(self._datfile, 'rb') as f:
             f.seek(pos)
             dat = f.read(siz)
@@ -155,6 +266,17 @@ class _Database(collections.abc.MutableMapping):
     # to get to an aligned offset.  Return pair
     #     (starting offset of val, len(val))
     def _addval(self, val):
+        f = self._datf
+        if f is not None:
+            # Avoid seeking, which flushes the buffer, when appending.
+            pos = self._datend
+            npos = ((pos + _BLOCKSIZE - 1) // _BLOCKSIZE) * _BLOCKSIZE
+            if f.tell() != pos:
+                f.seek(pos)
+            f.write(b'\0'*(npos-pos))
+            f.write(val)
+            self._datend = npos + len(val)
+            return (npos, len(val))
         with _io.open(self._datfile, 'rb+') as f:
             f.seek(0, 2)
             pos = int(f.tell())
@@ -169,6 +291,10 @@ class _Database(collections.abc.MutableMapping):
     # pos to hold val, without overwriting some other value.  Return
     # pair (pos, len(val)).
     def _setval(self, pos, val):
+        if self._datf is not None:
+            self._datf.seek(pos)
+            self._datf.write(val)
+            return (pos, len(val))
         with _io.open(self._datfile, 'rb+') as f:
             f.seek(pos)
             f.write(val)
@@ -179,9 +305,7 @@ class _Database(collections.abc.MutableMapping):
     # the in-memory index dict, and append one to the directory file.
     def _addkey(self, key, pos_and_siz_pair):
         self._index[key] = pos_and_siz_pair
-        with _io.open(self._dirfile, 'a', encoding="Latin-1") as f:
-            self._chmod(self._dirfile)
-            f.write("%r, %r\n" % (key.decode("Latin-1"), pos_and_siz_pair))
+        self._log(key, pos_and_siz_pair)
 
     def __setitem__(self, key, val):
         if self._readonly:
@@ -205,20 +329,13 @@ class _Database(collections.abc.MutableMapping):
             oldblocks = (siz + _BLOCKSIZE - 1) // _BLOCKSIZE
             newblocks = (len(val) + _BLOCKSIZE - 1) // _BLOCKSIZE
             if newblocks <= oldblocks:
-                self._index[key] = self._setval(pos, val)
+                pos_and_siz_pair = self._setval(pos, val)
             else:
                 # The new value doesn't fit in the (padded) space used
                 # by the old value.  The blocks used by the old value are
-                # forever lost.
-                self._index[key] = self._addval(val)
-
-            # Note that _index may be out of synch with the directory
-            # file now:  _setval() and _addval() don't update the directory
-            # file.  This also means that the on-disk directory and data
-            # files are in a mutually inconsistent state, and they'll
-            # remain that way until _commit() is called.  Note that this
-            # is a disaster (for the database) if the program crashes
-            # (so that _commit() never gets called).
+                # lost until reorganize() is called.
+                pos_and_siz_pair = self._addval(val)
+            self._addkey(key, pos_and_siz_pair)
 
     def __delitem__(self, key):
         if self._readonly:
@@ -226,14 +343,58 @@ class _Database(collections.abc.MutableMapping):
         if isinstance(key, str):
             key = key.encode('utf-8')
         self._verify_open()
-        self._modified = True
-        # The blocks used by the associated value are lost.
+        # The blocks used by the associated value are lost until
+        # reorganize() is called.
         del self._index[key]
-        # XXX It's unclear why we do a _commit() here (the code always
-        # XXX has, so I'm not changing it).  __setitem__ doesn't try to
-        # XXX keep the directory file in synch.  Why should we?  Or
-        # XXX why shouldn't __setitem__?
-        self._commit()
+        self._modified = True
+        self._log(key, None)
+
+    def reorganize(self):
+        """Shrink the data file by rewriting it without the space left
+        by deleted and replaced values, and rewrite the directory file."""
+        if self._readonly:
+            raise ValueError('The database is opened for reading only')
+        self._verify_open()
+        if self._batch_depth:
+            raise error('cannot reorganize the database within batch()')
+        # Both new files are written before replacing the old ones.  If
+        # the process dies between the two replacements, the new directory
+        # file is put in place when the database is opened again.
+        index = {}
+        with _io.open(self._datfile, 'rb') as f, \
+             _io.open(self._dattmpfile, 'wb') as out:
+            self._chmod(self._dattmpfile)
+            pos = 0
+            for key, (oldpos, siz) in sorted(self._index.items(),
+                                             key=lambda item: item[1]):
+                f.seek(oldpos)
+                npos = ((pos + _BLOCKSIZE - 1) // _BLOCKSIZE) * _BLOCKSIZE
+                out.write(b'\0'*(npos-pos))
+                out.write(f.read(siz))
+                index[key] = (npos, siz)
+                pos = npos + siz
+            out.flush()
+            _os.fsync(out.fileno())
+        with _io.open(self._dirtmpfile, 'w', encoding="Latin-1") as f:
+            self._chmod(self._dirtmpfile)
+            for key, pos_and_siz_pair in index.items():
+                f.write("%r, %r\n" % (key.decode('Latin-1'), pos_and_siz_pair))
+            f.flush()
+            _os.fsync(f.fileno())
+        _os.replace(self._dattmpfile, self._datfile)
+        self._index = index
+        self._modified = True
+        try:
+            _os.replace(self._dirtmpfile, self._dirfile)
+        except OSError:
+            # close() rewrites the directory file from the index.
+            try:
+                _os.remove(self._dirtmpfile)
+            except OSError:
+                pass
+            raise
+        self._loglen = len(index)
+        self._modified = False
 
     def keys(self):
         try:
@@ -271,8 +432,11 @@ class _Database(collections.abc.MutableMapping):
 
     def close(self):
         try:
-            self._commit()
+            self._commit(closing=True)
         finally:
+            if self._datf is not None:
+                self._datf.close()
+                self._datf = None
             self._index = self._datfile = self._dirfile = self._bakfile = None
 
     __del__ = close
@@ -6,6 +6,7 @@ but random access is not allowed."""
 # based on Andrew Kuchling's minigzip.py distributed with the zlib module
 
 import struct, sys, time, os
+import functools
 import zlib
 import builtins
 import io
@@ -18,7 +19,7 @@ FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
 READ, WRITE = 1, 2
 
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, threads=1):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -29,8 +30,8 @@ def open(filename, mode="rb", compresslevel=9,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, threads=threads). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -50,9 +51,11 @@ def open(filename, mode="rb", compresslevel=9,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               threads=threads)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               threads=threads)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -61,6 +64,22 @@ def open(filename, mode="rb", compresslevel=9,
     else:
         return binary_file
 
+# Size of the blocks compressed concurrently when writing with several threads.
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+
+def _deflate_block(compresslevel, block, previous):
+    """Compress block to a piece of a raw deflate stream, ending on a byte
+    boundary so that the pieces can be concatenated.
+    """
+    # The previous block is the window the decompressor will have seen,
+    # so using its end as a dictionary keeps the compression ratio.
+    kwargs = {}
+    if previous:
+        kwargs['zdict'] = previous[-32768:]
+    compress = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                zlib.DEF_MEM_LEVEL, 0, **kwargs)
+    return compress.compress(block) + compress.flush(zlib.Z_SYNC_FLUSH)
+
 def write32u(output, value):
     # The L format writes the bit pattern correctly whether signed
     # or unsigned.
@@ -121,7 +140,7 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=9, fileobj=None, mtime=None):
+                 compresslevel=9, fileobj=None, mtime=None, *, threads=1):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -153,6 +172,12 @@ class GzipFile(_compression.BaseStream):
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        The threads argument is the number of threads which compress the
+        data when writing; None means the number of CPUs.  With more than one
+        thread, the data is compressed in independent blocks, each primed
+        with the end of the previous block, as pigz does.  The result is
+        still a single gzip member.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -169,6 +194,8 @@ class GzipFile(_compression.BaseStream):
             filename = os.fspath(filename)
         if mode is None:
             mode = getattr(fileobj, 'mode', 'rb')
+        threads = _compression.check_threads(threads, not mode.startswith('r'))
+        self._parallel = None
 
         if mode.startswith('r'):
             self.mode = READ
@@ -192,6 +219,10 @@ class GzipFile(_compression.BaseStream):
 
         if self.mode == WRITE:
             self._write_gzip_header()
+            if threads > 1:
+                self._parallel = _compression.ParallelCompressor(
+                    fileobj, functools.partial(_deflate_block, compresslevel),
+                    _PARALLEL_BLOCK_SIZE, threads)
 
     @property
     def filename(self):
@@ -261,7 +292,10 @@ class GzipFile(_compression.BaseStream):
             length = data.nbytes
 
         if length > 0:
-            self.fileobj.write(self.compress.compress(data))
+            if self._parallel is not None:
+                self._parallel.write(data)
+            else:
+                self.fileobj.write(self.compress.compress(data))
             self.size += length
             self.crc = zlib.crc32(data, self.crc)
             self.offset += length
@@ -306,6 +340,10 @@ class GzipFile(_compression.BaseStream):
         self.fileobj = None
         try:
             if self.mode == WRITE:
+                if self._parallel is not None:
+                    parallel = self._parallel
+                    self._parallel = None
+                    parallel.close()
                 fileobj.write(self.compress.flush())
                 write32u(fileobj, self.crc)
                 # self.size may exceed 2 GiB, or even 4 GiB
@@ -322,7 +360,15 @@ class GzipFile(_compression.BaseStream):
         self._check_not_closed()
         if self.mode == WRITE:
             # Ensure the compressor's buffer is flushed
-            self.fileobj.write(self.compress.flush(zlib_mode))
+            if self._parallel is not None:
+                # Every block ends with a sync flush; a full flush also
+                # compresses the next block without the previous one.
+                if zlib_mode not in (zlib.Z_SYNC_FLUSH, zlib.Z_FULL_FLUSH):
+                    raise ValueError('only Z_SYNC_FLUSH and Z_FULL_FLUSH are '
+                                     'supported when writing with threads')
+                self._parallel.flush(zlib_mode == zlib.Z_FULL_FLUSH)
+            else:
+                self.fileobj.write(self.compress.flush(zlib_mode))
             self.fileobj.flush()
 
     def fileno(self):
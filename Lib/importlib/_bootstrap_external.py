@@ -1216,6 +1216,42 @@ class _NamespaceLoader:
 
 # Finders #####################################################################
 
+_PATH_CACHE_MAGIC = b'PYPC'
+
+
+class _PathCache:
+
+    """Directory listings shared by all the FileFinder instances, and the
+    modules which PathFinder failed to find, kept until
+    importlib.invalidate_caches() is called."""
+
+    def __init__(self, listings=()):
+        # Maps directory paths to (mtime, contents) pairs.
+        self.listings = dict(listings)
+        # The directories whose listing was loaded from a file, and whose
+        # modification time has not been checked yet by this process.
+        self.unchecked = set(self.listings)
+        self.missing = set()
+
+    @classmethod
+    def from_file(cls, path):
+        """Create a cache from the listings saved in the file 'path'."""
+        with _io.FileIO(path, 'r') as file:
+            data = file.readall()
+        if data[:4] != _PATH_CACHE_MAGIC:
+            raise ImportError('bad magic number in path cache {!r}'
+                              .format(path), path=path)
+        try:
+            listings = marshal.loads(memoryview(data)[4:])
+            return cls(listings)
+        except (EOFError, ValueError, TypeError):
+            raise ImportError('bad path cache {!r}'.format(path), path=path)
+
+
+# The process-wide path cache, None unless enabled.
+_path_cache = None
+
+
 class PathFinder:
 
     """Meta path finder for sys.path and package __path__ attributes."""
@@ -1229,6 +1265,10 @@ class PathFinder:
                 del sys.path_importer_cache[name]
             elif hasattr(finder, 'invalidate_caches'):
                 finder.invalidate_caches()
+        if _path_cache is not None:
+            _path_cache.listings.clear()
+            _path_cache.unchecked.clear()
+            _path_cache.missing.clear()
 
     @classmethod
     def _path_hooks(cls, path):
@@ -1320,10 +1360,19 @@ class PathFinder:
         """
         if path is None:
             path = sys.path
+        key = None
+        if _path_cache is not None:
+            try:
+                key = fullname, tuple(path)
+                if key in _path_cache.missing:
+                    return None
+            except TypeError:
+                # An unhashable path entry.
+                key = None
         spec = cls._get_spec(fullname, path, target)
-        if spec is None:
-            return None
-        elif spec.loader is None:
+        if spec is not None:
+            if spec.loader is not None:
+                return spec
             namespace_path = spec.submodule_search_locations
             if namespace_path:
                 # We found at least one namespace path.  Return a spec which
@@ -1331,10 +1380,9 @@ class PathFinder:
                 spec.origin = None
                 spec.submodule_search_locations = _NamespacePath(fullname, namespace_path, cls._get_spec)
                 return spec
-            else:
-                return None
-        else:
-            return spec
+        if key is not None and _path_cache is not None:
+            _path_cache.missing.add(key)
+        return None
 
     @classmethod
     def find_module(cls, fullname, path=None):
@@ -1376,6 +1424,9 @@ class FileFinder:
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
         self._path_mtime = -1
+        if _path_cache is not None:
+            _path_cache.listings.pop(self.path, None)
+            _path_cache.unchecked.discard(self.path)
 
     find_module = _find_module_shim
 
@@ -1403,13 +1454,10 @@ class FileFinder:
         """
         is_namespace = False
         tail_module = fullname.rpartition('.')[2]
-        try:
-            mtime = _path_stat(self.path or _os.getcwd()).st_mtime
-        except OSError:
-            mtime = -1
-        if mtime != self._path_mtime:
-            self._fill_cache()
-            self._path_mtime = mtime
+        # With a path cache, the directory is only checked once until the
+        # caches are invalidated.
+        if _path_cache is None or self._path_mtime == -1:
+            self._update_cache()
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
             cache = self._relaxed_path_cache
@@ -1444,15 +1492,52 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
-        """Fill the cache of potential modules and packages for this directory."""
-        path = self.path
+    def _update_cache(self):
+        """Refill the cache if the directory has been modified."""
+        mtime = None
+        if _path_cache is not None:
+            try:
+                cached_mtime, contents = _path_cache.listings[self.path]
+            except KeyError:
+                pass
+            else:
+                if self.path in _path_cache.unchecked:
+                    # A listing loaded from a file is checked once.
+                    _path_cache.unchecked.discard(self.path)
+                    mtime = self._get_mtime()
+                    if mtime != cached_mtime:
+                        del _path_cache.listings[self.path]
+                if mtime is None or mtime == cached_mtime:
+                    self._path_mtime = cached_mtime
+                    self._fill_cache(contents)
+                    return
+        if mtime is None:
+            mtime = self._get_mtime()
+        if mtime != self._path_mtime:
+            contents = self._fill_cache()
+            self._path_mtime = mtime
+            if _path_cache is not None:
+                _path_cache.listings[self.path] = mtime, contents
+
+    def _get_mtime(self):
         try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+            return _path_stat(self.path or _os.getcwd()).st_mtime
+        except OSError:
+            return -1
+
+    def _fill_cache(self, contents=None):
+        """Fill the cache of potential modules and packages for this directory.
+
+        Return the directory contents.
+        """
+        if contents is None:
+            path = self.path
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or
+                # made unreadable.
+                contents = []
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1474,6 +1559,7 @@ class FileFinder:
             self._path_cache = lower_suffix_contents
         if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
             self._relaxed_path_cache = {fn.lower() for fn in contents}
+        return contents
 
     @classmethod
     def path_hook(cls, *loader_details):
@@ -1497,6 +1583,151 @@ class FileFinder:
         return 'FileFinder({!r})'.format(self.path)
 
 
+_IMPORT_CACHE_MAGIC = b'PYIC'
+
+
+class _CachedSourceFileLoader(SourceFileLoader):
+
+    """Source file loader whose code object was stored in an import cache."""
+
+    def __init__(self, fullname, path, data):
+        super(_CachedSourceFileLoader, self).__init__(fullname, path)
+        self._data = data
+
+    def get_code(self, fullname):
+        """Return the code object recorded in the import cache."""
+        if fullname != self.name:
+            return super(_CachedSourceFileLoader, self).get_code(fullname)
+        _bootstrap._verbose_message('code object from import cache for {}',
+                                    self.path)
+        return marshal.loads(self._data)
+
+
+class ImportCacheFinder:
+
+    """Meta path finder backed by an import cache file.
+
+    The cache records the location of modules found in a set of directories,
+    along with the code objects of the source modules, so that importing them
+    requires neither a stat() of every sys.path entry nor a .pyc file.  A
+    directory whose modification time differs from the recorded one is
+    ignored, as is a module whose file's modification time or size differs
+    from the recorded ones (like .pyc files, the file is checked once) and
+    any module not recorded in the cache; those fall back to the path based
+    finder.
+
+    """
+
+    def __init__(self, path):
+        """Load the import cache stored in the file 'path'.
+
+        ImportError is raised if the cache was not written by a compatible
+        interpreter, and OSError if it cannot be read.
+
+        """
+        self.path = path
+        with _io.FileIO(path, 'r') as file:
+            data = memoryview(file.readall())
+        if (len(data) < 12 or data[:4] != _IMPORT_CACHE_MAGIC or
+                data[4:8] != MAGIC_NUMBER):
+            raise ImportError('bad magic number in import cache {!r}'
+                              .format(path), path=path)
+        index_size = _r_long(data[8:12])
+        self._code_offset = 12 + index_size
+        try:
+            optimize, self._directories = marshal.loads(
+                data[12:self._code_offset])
+        except (EOFError, ValueError, TypeError):
+            raise ImportError('bad import cache {!r}'.format(path), path=path)
+        if optimize != sys.flags.optimize:
+            raise ImportError('import cache {!r} was written with a different '
+                              'optimization level'.format(path), path=path)
+        self._data = data
+        self.invalidate_caches()
+
+    def invalidate_caches(self):
+        """Check the recorded directories against the file system.
+
+        Only the directories whose modification time is unchanged are used
+        by find_spec(), and the files of the modules are checked again.
+
+        """
+        # Maps the files already checked to whether they are unchanged.
+        self._checked = {}
+        valid = set()
+        for directory, (mtime, _, _) in self._directories.items():
+            try:
+                st_mtime = _path_stat(directory).st_mtime
+            except OSError:
+                st_mtime = None
+            if st_mtime == mtime:
+                valid.add(directory)
+        self._valid = valid
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Try to find a spec for 'fullname' on sys.path or 'path'.
+
+        None is returned unless every path entry preceding the module's
+        directory is also recorded in the cache and up to date.
+        """
+        if _relax_case():
+            return None
+        if path is None:
+            path = sys.path
+        tail_module = fullname.rpartition('.')[2]
+        for entry in path:
+            if not isinstance(entry, str):
+                return None
+            if entry == '':
+                try:
+                    entry = _os.getcwd()
+                except FileNotFoundError:
+                    return None
+            if entry not in self._valid:
+                return None
+            _, names, modules = self._directories[entry]
+            if tail_module in modules:
+                return self._get_spec(fullname, *modules[tail_module])
+            if tail_module in names:
+                # Something which was not recorded, like a namespace package.
+                return None
+        return None
+
+    def _get_spec(self, fullname, kind, location, offset, size, mtime,
+                  source_size):
+        try:
+            unchanged = self._checked[location]
+        except KeyError:
+            try:
+                st = _path_stat(location)
+            except OSError:
+                unchanged = False
+            else:
+                unchanged = (int(st.st_mtime) == mtime and
+                             st.st_size == source_size)
+            self._checked[location] = unchanged
+        if not unchanged:
+            _bootstrap._verbose_message('{} changed since import cache {!r} '
+                                        'was written', location, self.path)
+            return None
+        smsl = None
+        if kind == 'extension':
+            loader = ExtensionFileLoader(fullname, location)
+        else:
+            start = self._code_offset + offset
+            loader = _CachedSourceFileLoader(fullname, location,
+                                             self._data[start:start + size])
+            if kind == 'package':
+                smsl = [_path_split(location)[0]]
+        _bootstrap._verbose_message('found {} in import cache {!r}',
+                                    fullname, self.path, verbosity=2)
+        return spec_from_file_location(fullname, location, loader=loader,
+                                       submodule_search_locations=smsl)
+
+    def __repr__(self):
+        return 'ImportCacheFinder({!r})'.format(self.path)
+
+
 # Import setup ###############################################################
 
 def _fix_up_module(ns, name, pathname, cpathname=None):
@@ -1600,7 +1831,26 @@ def _setup(_bootstrap_module):
 
 def _install(_bootstrap_module):
     """Install the path-based import components."""
+    global _path_cache
     _setup(_bootstrap_module)
     supported_loaders = _get_supported_file_loaders()
     sys.path_hooks.extend([FileFinder.path_hook(*supported_loaders)])
+    if not sys.flags.ignore_environment:
+        if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS_STR_KEY):
+            cache_path = _os.environ.get('PYTHONIMPORTCACHE')
+            path_cache_path = _os.environ.get('PYTHONPATHCACHE')
+        else:
+            cache_path = _os.environ.get(b'PYTHONIMPORTCACHE')
+            path_cache_path = _os.environ.get(b'PYTHONPATHCACHE')
+        if cache_path:
+            try:
+                sys.meta_path.append(ImportCacheFinder(cache_path))
+            except (ImportError, OSError) as exc:
+                _bootstrap._verbose_message('ignoring import cache: {}', exc)
+        if path_cache_path:
+            try:
+                _path_cache = _PathCache.from_file(path_cache_path)
+            except (ImportError, OSError) as exc:
+                _bootstrap._verbose_message('ignoring path cache: {}', exc)
+                _path_cache = _PathCache()
     sys.meta_path.append(PathFinder)
@@ -1,11 +1,22 @@
 """Utility code for constructing importers, etc."""
 from . import abc
+from . import _bootstrap
+from . import _bootstrap_external
 from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
+from ._bootstrap import _gcd_import
 from ._bootstrap_external import MAGIC_NUMBER
+from ._bootstrap_external import _IMPORT_CACHE_MAGIC
+from ._bootstrap_external import _PATH_CACHE_MAGIC
 from ._bootstrap_external import _RAW_MAGIC_NUMBER
+from ._bootstrap_external import _w_long
+from ._bootstrap_external import _write_atomic
+from ._bootstrap_external import ExtensionFileLoader
+from ._bootstrap_external import FileFinder
+from ._bootstrap_external import PathFinder
+from ._bootstrap_external import SourceFileLoader
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
 from ._bootstrap_external import source_from_cache
@@ -14,6 +25,8 @@ from ._bootstrap_external import spec_from_file_location
 from contextlib import contextmanager
 import _imp
 import functools
+import marshal
+import os
 import sys
 import types
 import warnings
@@ -115,6 +128,142 @@ def find_spec(name, package=None):
             return spec
 
 
+def write_import_cache(path, modules=None):
+    """Write an import cache for the given modules to the file *path*.
+
+    *modules* is an iterable of module names and defaults to all the modules
+    in sys.modules.  The modules are imported if needed; only source and
+    extension modules loaded from the file system are recorded.  Return the
+    number of modules written.
+
+    """
+    if modules is None:
+        modules = list(sys.modules)
+    else:
+        modules = list(modules)
+        for name in modules:
+            _gcd_import(name)
+
+    directories = {}
+    def add_directory(directory):
+        if directory not in directories:
+            try:
+                mtime = os.stat(directory).st_mtime
+                names = frozenset(filename.partition('.')[0]
+                                  for filename in os.listdir(directory))
+            except OSError:
+                mtime = None
+                names = frozenset()
+            directories[directory] = mtime, names, {}
+        return directories[directory][2]
+
+    def search_path(path):
+        for entry in path:
+            if isinstance(entry, str):
+                yield entry or os.getcwd()
+
+    for directory in search_path(sys.path):
+        add_directory(directory)
+    code = []
+    offset = 0
+    for name in modules:
+        spec = getattr(sys.modules.get(name), '__spec__', None)
+        if spec is None or not spec.has_location or spec.origin is None:
+            continue
+        parent, _, tail = name.rpartition('.')
+        if parent:
+            locations = getattr(sys.modules.get(parent), '__path__', None)
+            if locations is None:
+                continue
+        else:
+            locations = sys.path
+        directory, filename = os.path.split(spec.origin)
+        if spec.submodule_search_locations is not None:
+            if list(spec.submodule_search_locations) != [directory]:
+                continue
+            directory, filename = os.path.split(directory)
+        if (filename.partition('.')[0] != tail or
+                directory not in search_path(locations)):
+            continue
+        if isinstance(spec.loader, SourceFileLoader):
+            data = marshal.dumps(spec.loader.get_code(name))
+            if spec.submodule_search_locations is None:
+                kind = 'source'
+            else:
+                kind = 'package'
+                add_directory(spec.submodule_search_locations[0])
+        elif (isinstance(spec.loader, ExtensionFileLoader) and
+                spec.submodule_search_locations is None):
+            data = b''
+            kind = 'extension'
+        else:
+            continue
+        try:
+            st = os.stat(spec.origin)
+        except OSError:
+            continue
+        add_directory(directory)[tail] = (kind, spec.origin, offset, len(data),
+                                          int(st.st_mtime), st.st_size)
+        code.append(data)
+        offset += len(data)
+
+    index = marshal.dumps((sys.flags.optimize, directories))
+    data = bytearray(_IMPORT_CACHE_MAGIC)
+    data.extend(MAGIC_NUMBER)
+    data.extend(_w_long(len(index)))
+    data.extend(index)
+    data.extend(b''.join(code))
+    _write_atomic(os.fspath(path), data)
+    return len(code)
+
+
+def enable_path_cache(path=None):
+    """Make the path based finder trust its caches until invalidated.
+
+    The directory listings used by the finders of the path entries are kept
+    for the whole process instead of being checked on every import, and
+    the modules which could not be found are remembered, until
+    importlib.invalidate_caches() is called.  If *path* is given, the
+    listings saved to that file by save_path_cache() are loaded.
+
+    """
+    if path is None:
+        cache = _bootstrap_external._PathCache()
+    else:
+        cache = _bootstrap_external._PathCache.from_file(path)
+    # Make the finders check their directory once more.
+    PathFinder.invalidate_caches()
+    _bootstrap_external._path_cache = cache
+
+
+def disable_path_cache():
+    """Make the path based finder check the modification time of the
+    directories on every import again."""
+    _bootstrap_external._path_cache = None
+
+
+def save_path_cache(path):
+    """Save the directory listings of the path entry finders to the file
+    *path*, to be loaded by enable_path_cache().
+
+    Return the number of directories saved.
+
+    """
+    listings = {}
+    if _bootstrap_external._path_cache is not None:
+        listings.update(_bootstrap_external._path_cache.listings)
+    for finder in list(sys.path_importer_cache.values()):
+        if isinstance(finder, FileFinder) and finder.path not in listings:
+            try:
+                mtime = os.stat(finder.path).st_mtime
+                contents = os.listdir(finder.path)
+            except OSError:
+                continue
+            listings[finder.path] = mtime, contents
+    _write_atomic(os.fspath(path), _PATH_CACHE_MAGIC + marshal.dumps(listings))
+    return len(listings)
+
+
 @contextmanager
 def _module_to_load(name):
     is_reload = name in sys.modules
@@ -222,18 +371,47 @@ class _LazyModule(types.ModuleType):
 
     def __getattribute__(self, attr):
         """Trigger the load of the module and return the attribute."""
+        __spec__ = object.__getattribute__(self, '__spec__')
+        # The import system looks up __spec__ whenever the module is imported
+        # again; that must not trigger the load.
+        if attr == '__spec__':
+            return __spec__
+        loader_state = __spec__.loader_state
+        # The module lock of the import system detects deadlocks, e.g. when
+        # two threads load modules which access each other while they are
+        # executing.
+        lock = _bootstrap._get_module_lock(__spec__.name)
+        try:
+            lock.acquire()
+        except _bootstrap._DeadlockError:
+            # Like an eager import, see the partially initialized module.
+            return object.__getattribute__(self, attr)
+        try:
+            # Only the first thread to get the lock triggers the load.
+            if object.__getattribute__(self, '__class__') is _LazyModule:
+                # Accesses made while the module is executing, e.g. by a
+                # circular import, see the partially initialized module.
+                if loader_state['is_loading']:
+                    return object.__getattribute__(self, attr)
+                loader_state['is_loading'] = True
+                try:
+                    _LazyModule.__load(self, __spec__)
+                finally:
+                    loader_state['is_loading'] = False
+        finally:
+            lock.release()
+        return getattr(self, attr)
+
+    def __load(self, spec):
         # All module metadata must be garnered from __spec__ in order to avoid
         # using mutated values.
-        # Stop triggering this method.
-        self.__class__ = types.ModuleType
         # Get the original name to make sure no object substitution occurred
         # in sys.modules.
-        original_name = self.__spec__.name
+        original_name = spec.name
         # Figure out exactly what attributes were mutated between the creation
         # of the module and now.
-        attrs_then = self.__spec__.loader_state['__dict__']
-        original_type = self.__spec__.loader_state['__class__']
-        attrs_now = self.__dict__
+        attrs_then = spec.loader_state['__dict__']
+        attrs_now = object.__getattribute__(self, '__dict__')
         attrs_updated = {}
         for key, value in attrs_now.items():
             # Code that set the attribute may have kept a reference to the
@@ -242,7 +420,7 @@ class _LazyModule(types.ModuleType):
                 attrs_updated[key] = value
             elif id(attrs_now[key]) != id(attrs_then[key]):
                 attrs_updated[key] = value
-        self.__spec__.loader.exec_module(self)
+        spec.loader.exec_module(self)
         # If exec_module() was used directly there is no guarantee the module
         # object was put into sys.modules.
         if original_name in sys.modules:
@@ -252,15 +430,15 @@ class _LazyModule(types.ModuleType):
                                   "load")
         # Update after loading since that's what would happen in an eager
         # loading situation.
-        self.__dict__.update(attrs_updated)
-        return getattr(self, attr)
+        attrs_now.update(attrs_updated)
+        # Stop triggering this method.
+        self.__class__ = types.ModuleType
 
     def __delattr__(self, attr):
         """Trigger the load and then perform the deletion."""
-        # To trigger the load and raise an exception if the attribute
-        # doesn't exist.
-        self.__getattribute__(attr)
-        delattr(self, attr)
+        # To trigger the load.
+        self.__dict__
+        types.ModuleType.__delattr__(self, attr)
 
 
 class LazyLoader(abc.Loader):
@@ -296,5 +474,89 @@ class LazyLoader(abc.Loader):
         loader_state = {}
         loader_state['__dict__'] = module.__dict__.copy()
         loader_state['__class__'] = module.__class__
+        loader_state['is_loading'] = False
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class _LazyImportFinder:
+
+    """A meta path finder which makes the modules found by the finders
+    following it in sys.meta_path load lazily."""
+
+    def __init__(self):
+        self.names = set()
+        self.exclude = set()
+        self.all = False
+
+    @staticmethod
+    def _match(fullname, names):
+        while fullname:
+            if fullname in names:
+                return True
+            fullname = fullname.rpartition('.')[0]
+        return False
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in sys.modules:
+            # Reloading a module is done eagerly.
+            return None
+        if (not (self.all or self._match(fullname, self.names)) or
+                self._match(fullname, self.exclude)):
+            return None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        # Built-in, frozen and extension modules are executed when they are
+        # created, so there is nothing to gain from deferring them.
+        if (spec.has_location and hasattr(spec.loader, 'exec_module') and
+                not isinstance(spec.loader, ExtensionFileLoader)):
+            spec.loader = LazyLoader(spec.loader)
+        return spec
+
+
+def _lazy_import_finder():
+    for finder in sys.meta_path:
+        if isinstance(finder, _LazyImportFinder):
+            return finder
+    return None
+
+
+def enable_lazy_imports(*names, exclude=()):
+    """Make the modules imported from now on load lazily.
+
+    With no *names*, every module which supports it is imported lazily;
+    otherwise only the given modules and their submodules are.  The modules
+    in *exclude*, and their submodules, are always imported eagerly.
+
+    """
+    finder = _lazy_import_finder()
+    if finder is None:
+        finder = _LazyImportFinder()
+        sys.meta_path.insert(0, finder)
+    if names:
+        finder.names.update(names)
+    else:
+        finder.all = True
+    finder.exclude.update(exclude)
+
+
+def disable_lazy_imports():
+    """Stop importing modules lazily.
+
+    Modules which were imported lazily and have not been loaded yet are not
+    affected.
+
+    """
+    finder = _lazy_import_finder()
+    if finder is not None:
+        sys.meta_path.remove(finder)
@@ -97,13 +97,14 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload', 'iterparse', 'load_lines',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONPullParser',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONPullParser
+from .decoder import _adjust_error
 from .encoder import JSONEncoder
 import codecs
 
@@ -166,18 +167,20 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    # Subclasses overriding iterencode() keep getting it called
+    if type(encoder).iterencode is JSONEncoder.iterencode:
+        encoder._dump(obj, fp.write)
+    else:
+        for chunk in encoder.iterencode(obj):
+            fp.write(chunk)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -298,8 +301,9 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
 
 def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
-    """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
-    containing a JSON document) to a Python object.
+    """Deserialize ``s`` (a ``str`` instance or a bytes-like object, such
+    as ``bytes``, ``bytearray``, ``memoryview`` or ``mmap``, containing a
+    JSON document) to a Python object.
 
     ``object_hook`` is an optional function that will be called with the
     result of any object literal decode (a ``dict``). The return value of
@@ -338,24 +342,139 @@ def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
                                   s, 0)
     else:
         if not isinstance(s, (bytes, bytearray)):
-            raise TypeError(f'the JSON object must be str, bytes or bytearray, '
-                            f'not {s.__class__.__name__}')
-        s = s.decode(detect_encoding(s), 'surrogatepass')
+            try:
+                s = memoryview(s).cast('B')
+            except TypeError:
+                raise TypeError(f'the JSON object must be str, bytes or '
+                                f'bytearray, not {s.__class__.__name__}'
+                                ) from None
+        encoding = detect_encoding(bytes(s[:4]))
+        if encoding != 'utf-8':
+            s = str(s, encoding, 'surrogatepass')
 
     if (cls is None and object_hook is None and
             parse_int is None and parse_float is None and
             parse_constant is None and object_pairs_hook is None and not kw):
-        return _default_decoder.decode(s)
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    if isinstance(s, str):
+        return decoder.decode(s)
+    # UTF-8 input is scanned without decoding it first, unless decode()
+    # is overridden
+    if type(decoder).decode is JSONDecoder.decode:
+        return decoder._decode_utf8(s)
+    return decoder.decode(str(s, 'utf-8', 'surrogatepass'))
+
+
+def _make_decoder(cls, kw):
+    if cls is None and not any(v is not None for v in kw.values()):
+        return _default_decoder
     if cls is None:
         cls = JSONDecoder
-    if object_hook is not None:
-        kw['object_hook'] = object_hook
-    if object_pairs_hook is not None:
-        kw['object_pairs_hook'] = object_pairs_hook
-    if parse_float is not None:
-        kw['parse_float'] = parse_float
-    if parse_int is not None:
-        kw['parse_int'] = parse_int
-    if parse_constant is not None:
-        kw['parse_constant'] = parse_constant
-    return cls(**kw).decode(s)
+    return cls(**{k: v for k, v in kw.items() if v is not None})
+
+
+def _read_chunks(fp, chunk_size):
+    data = fp.read(chunk_size)
+    if isinstance(data, str):
+        if data.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                                  data, 0)
+        while data:
+            yield data
+            data = fp.read(chunk_size)
+        return
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                        f'not {data.__class__.__name__}')
+    # detect_encoding() looks at the first 4 bytes
+    while 0 < len(data) < 4:
+        more = fp.read(chunk_size)
+        if not more:
+            break
+        data += more
+    decoder = codecs.getincrementaldecoder(detect_encoding(data))(
+        'surrogatepass')
+    while data:
+        yield decoder.decode(data)
+        data = fp.read(chunk_size)
+    yield decoder.decode(b'', True)
+
+
+def iterload(fp, *, cls=None, chunk_size=65536, object_hook=None,
+        parse_float=None, parse_int=None, parse_constant=None,
+        object_pairs_hook=None, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting file-like object
+    containing a stream of JSON documents) and yield each document as a
+    Python object as soon as it has been read.
+
+    The documents may be separated by whitespace.  ``fp`` is read in
+    chunks of ``chunk_size`` characters (or bytes), and only the text of
+    the document being decoded is kept in memory.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    decoder = _make_decoder(cls, dict(kw, object_hook=object_hook,
+        parse_float=parse_float, parse_int=parse_int,
+        parse_constant=parse_constant, object_pairs_hook=object_pairs_hook))
+    return decoder.iterdecode(_read_chunks(fp, chunk_size))
+
+
+def iterparse(fp, *, cls=None, chunk_size=65536, parse_float=None,
+        parse_int=None, parse_constant=None, **kw):
+    """Parse ``fp`` (a ``.read()``-supporting file-like object containing
+    a stream of JSON documents) and yield ``(event, value)`` pairs.
+
+    The events are those reported by ``JSONPullParser``.  ``fp`` is read
+    in chunks of ``chunk_size`` characters (or bytes), and only the text of
+    the current token is kept in memory, so documents larger than the
+    available memory can be processed.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    decoder = _make_decoder(cls, dict(kw, parse_float=parse_float,
+        parse_int=parse_int, parse_constant=parse_constant))
+    return decoder.iterparse(_read_chunks(fp, chunk_size))
+
+
+def load_lines(fp, *, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Deserialize ``fp`` (an iterable of lines, such as a file object, in
+    the JSON Lines format) and yield the JSON document of each line as a
+    Python object.
+
+    Lines which contain only whitespace are skipped.  Lines of a binary
+    file must be encoded in UTF-8.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    decoder = _make_decoder(cls, dict(kw, object_hook=object_hook,
+        parse_float=parse_float, parse_int=parse_int,
+        parse_constant=parse_constant, object_pairs_hook=object_pairs_hook))
+    decode = decoder.decode
+    pos = 0
+    for lineno, line in enumerate(fp, 1):
+        if not isinstance(line, str):
+            if not isinstance(line, (bytes, bytearray)):
+                raise TypeError(f'the JSON object must be str, bytes or '
+                                f'bytearray, not {line.__class__.__name__}')
+            line = line.decode('utf-8', 'surrogatepass')
+        if line.strip(' \t\n\r'):
+            try:
+                yield decode(line.rstrip('\n\r'))
+            except JSONDecodeError as exc:
+                raise _adjust_error(exc, pos, lineno, 0)
+        pos += len(line)
@@ -1,6 +1,7 @@
 """Implementation of JSONDecoder
 """
 import re
+from collections import deque
 
 from json import scanner
 try:
@@ -8,7 +9,7 @@ try:
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONPullParser']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -43,6 +44,19 @@ class JSONDecodeError(ValueError):
         return self.__class__, (self.msg, self.doc, self.pos)
 
 
+def _adjust_error(exc, pos, lineno, colno):
+    # Make the position of exc relative to the whole input when exc.doc is
+    # only a part of it, starting at index pos, line lineno and column colno
+    # (0-based) of the input.
+    if exc.lineno == 1:
+        exc.colno += colno
+    exc.lineno += lineno - 1
+    exc.pos += pos
+    exc.args = ('%s: line %d column %d (char %d)' %
+                (exc.msg, exc.lineno, exc.colno, exc.pos),)
+    return exc
+
+
 _CONSTANTS = {
     '-Infinity': NegInf,
     'Infinity': PosInf,
@@ -130,6 +144,7 @@ def py_scanstring(s, end, strict=True,
 scanstring = c_scanstring or py_scanstring
 
 WHITESPACE = re.compile(r'[ \t\n\r]*', FLAGS)
+WHITESPACE_BYTES = re.compile(br'[ \t\n\r]*', FLAGS)
 WHITESPACE_STR = ' \t\n\r'
 
 
@@ -340,6 +355,24 @@ class JSONDecoder(object):
             raise JSONDecodeError("Extra data", s, end)
         return obj
 
+    def _decode_utf8(self, b, _w=WHITESPACE_BYTES.match):
+        """Return the Python representation of ``b`` (a UTF-8 encoded
+        bytes-like object containing a JSON document).
+
+        The C scanner scans ``b`` directly, without the decoded copy
+        of the whole document.  Errors are reported as by ``decode()``.
+        """
+        if (scanner.c_make_scanner is not None and
+                isinstance(self.scan_once, scanner.c_make_scanner)):
+            try:
+                obj, end = self.scan_once(b, _w(b, 0).end())
+            except (StopIteration, UnicodeDecodeError):
+                pass
+            else:
+                if _w(b, end).end() == len(b):
+                    return obj
+        return self.decode(str(b, 'utf-8', 'surrogatepass'))
+
     def raw_decode(self, s, idx=0):
         """Decode a JSON document from ``s`` (a ``str`` beginning with
         a JSON document) and return a 2-tuple of the Python
@@ -354,3 +387,342 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def iterdecode(self, chunks):
+        """Decode a stream of JSON documents from ``chunks`` (an iterable
+        of ``str`` instances) and yield the Python representation of each
+        document as soon as it is complete.
+
+        The documents may be separated by whitespace, and they may be split
+        across chunks at any position.  Only the text of the document being
+        decoded is kept in memory.
+
+        """
+        buffer = _TextBuffer()
+        return _feed_chunks(buffer, chunks,
+                            _decode_values(buffer, self.scan_once))
+
+    def iterparse(self, chunks):
+        """Parse a stream of JSON documents from ``chunks`` (an iterable
+        of ``str`` instances) and yield ``(event, value)`` pairs.
+
+        See ``JSONPullParser`` for the events reported.  Neither a whole
+        document nor its arrays and objects are kept in memory, only the
+        text of the current token.
+
+        """
+        buffer = _TextBuffer()
+        return _feed_chunks(buffer, chunks,
+                            _parse_events(buffer, self.scan_once))
+
+
+class JSONPullParser(object):
+    """Incremental JSON parser with a non-blocking API.
+
+    Text is passed to ``feed()`` in chunks of any size as it becomes
+    available, and ``close()`` is called at the end of the input.  The
+    parser reports ``(event, value)`` pairs, which are retrieved with
+    ``read_events()``:
+
+    ``('start_object', None)``, ``('end_object', None)``
+        The start and the end of a JSON object.
+    ``('start_array', None)``, ``('end_array', None)``
+        The start and the end of a JSON array.
+    ``('key', key)``
+        A member name of the current object, as a ``str``.
+    ``('value', value)``
+        A string, number or constant, decoded as by ``decoder``.
+
+    The input may contain several JSON documents separated by whitespace.
+    Only the text of the current token is kept in memory, so documents of
+    any size can be parsed.
+
+    ``decoder``, if specified, is the ``JSONDecoder`` instance used to
+    decode strings, numbers and constants.
+
+    """
+
+    def __init__(self, *, decoder=None):
+        if decoder is None:
+            decoder = JSONDecoder()
+        self._buffer = _TextBuffer()
+        self._parser = _parse_events(self._buffer, decoder.scan_once)
+        self._events = deque()
+        # The exception which stopped the parser, raised again by feed()
+        # and close()
+        self._error = None
+
+    def feed(self, data):
+        """Feed ``data`` (a ``str`` instance) to the parser.
+
+        Raise ``JSONDecodeError`` if the input is invalid, and again on
+        every later call.
+        """
+        if not isinstance(data, str):
+            raise TypeError(f'the JSON object must be str, '
+                            f'not {data.__class__.__name__}')
+        if self._error is not None:
+            raise self._error
+        if self._buffer.eof:
+            raise ValueError("feed() called after close()")
+        if data:
+            self._buffer.append(data)
+            self._run()
+
+    def close(self):
+        """Signal the end of the input.
+
+        Raise ``JSONDecodeError`` if the input ends inside a document, or
+        if the input was invalid.
+        """
+        if self._error is not None:
+            raise self._error
+        if not self._buffer.eof:
+            self._buffer.eof = True
+            self._run()
+
+    def read_events(self):
+        """Return an iterator over the events which have been parsed
+        since the last call to ``read_events()``.
+        """
+        events = self._events
+        while events:
+            yield events.popleft()
+
+    def _run(self):
+        append = self._events.append
+        try:
+            for event in self._parser:
+                if event is _MORE:
+                    return
+                append(event)
+        except Exception as exc:
+            self._error = exc
+            raise
+
+
+# Yielded by the incremental parsers when they need more text
+_MORE = object()
+
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*', FLAGS)
+
+
+class _TextBuffer(object):
+    # Text received so far by an incremental parser.  Appended chunks are
+    # only collected; they are joined to the buffer, and consumed text is
+    # dropped from it, when the parser needs them, so that a value split
+    # across many chunks is not copied for each chunk.  The position of the
+    # buffer in the whole input is kept for error messages.
+
+    def __init__(self):
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        # Chunks not joined to buf yet, and their total length
+        self.chunks = []
+        self.pending = 0
+        # Length of the text after pos required before scanning again
+        self.need = 0
+        # Index, line and column of buf[0] in the whole input
+        self.offset = 0
+        self.lineno = 1
+        self.colno = 0
+
+    def append(self, data):
+        self.chunks.append(data)
+        self.pending += len(data)
+
+    def join(self):
+        buf = self.buf
+        pos = self.pos
+        if pos:
+            nl = buf.count('\n', 0, pos)
+            if nl:
+                self.lineno += nl
+                self.colno = pos - buf.rfind('\n', 0, pos) - 1
+            else:
+                self.colno += pos
+            self.offset += pos
+            buf = buf[pos:]
+            self.pos = 0
+        self.chunks.insert(0, buf)
+        self.buf = ''.join(self.chunks)
+        self.chunks = []
+        self.pending = 0
+
+    def error(self, exc):
+        return _adjust_error(exc, self.offset, self.lineno, self.colno)
+
+    def errmsg(self, msg):
+        return self.error(JSONDecodeError(msg, self.buf, self.pos))
+
+    def peek(self, _w=WHITESPACE.match):
+        """Skip whitespace and return the next character.
+
+        Return '' at the end of the input, or None if more text is needed.
+        """
+        while True:
+            buf = self.buf
+            pos = self.pos = _w(buf, self.pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if not self.chunks:
+                return '' if self.eof else None
+            self.join()
+
+    def scan(self, scan_once, _n=NUMBER_TAIL.match):
+        """Decode the value starting at the current position.
+
+        Return _MORE if the value may continue past the end of the buffer.
+        """
+        if (len(self.buf) - self.pos + self.pending < self.need and
+                not self.eof):
+            return _MORE
+        if self.chunks:
+            self.join()
+        buf = self.buf
+        start = self.pos
+        try:
+            obj, end = scan_once(buf, start)
+        except StopIteration as err:
+            exc = JSONDecodeError("Expecting value", buf, err.value)
+        except JSONDecodeError as err:
+            exc = err
+        else:
+            # A number ending the buffer can be followed by more digits
+            if (self.eof or buf[start] not in '-0123456789' or
+                    _n(buf, end).end() < len(buf)):
+                self.pos = end
+                self.need = 0
+                return obj
+            exc = None
+        if exc is not None:
+            # The value is invalid unless the error is caused by the end of
+            # the buffer: an unterminated string, or an error within the
+            # last characters (e.g. in "-Infinit", "1e" or "\u12").
+            if self.eof or (exc.pos < len(buf) - len('-Infinity') and
+                            not exc.msg.startswith('Unterminated string')):
+                raise self.error(exc)
+        # Wait until the pending text doubles before scanning again, so
+        # large values split across many chunks are scanned in linear time.
+        self.need = 2 * (len(buf) - start)
+        return _MORE
+
+
+def _feed_chunks(buffer, chunks, parser):
+    # Run an incremental parser, appending text from chunks to buffer each
+    # time it needs more.
+    chunks = iter(chunks)
+    for item in parser:
+        if item is _MORE:
+            for chunk in chunks:
+                if not isinstance(chunk, str):
+                    raise TypeError(f'the JSON object must be str, '
+                                    f'not {chunk.__class__.__name__}')
+                if chunk:
+                    buffer.append(chunk)
+                    break
+            else:
+                buffer.eof = True
+        else:
+            yield item
+
+
+def _decode_values(buffer, scan_once):
+    # Yield the JSON documents in buffer.
+    while True:
+        nextchar = buffer.peek()
+        while nextchar is None:
+            yield _MORE
+            nextchar = buffer.peek()
+        if not nextchar:
+            return
+        obj = buffer.scan(scan_once)
+        while obj is _MORE:
+            yield _MORE
+            obj = buffer.scan(scan_once)
+        yield obj
+
+
+def _parse_events(buffer, scan_once):
+    # Yield the events of the JSON documents in buffer.  Containers are
+    # tracked with an explicit stack of their closing characters, so deeply
+    # nested documents do not hit the recursion limit.
+    stack = []
+    expect_key = False
+    while True:
+        nextchar = buffer.peek()
+        while nextchar is None:
+            yield _MORE
+            nextchar = buffer.peek()
+        if expect_key:
+            if nextchar != '"':
+                raise buffer.errmsg(
+                    "Expecting property name enclosed in double quotes")
+            key = buffer.scan(scan_once)
+            while key is _MORE:
+                yield _MORE
+                key = buffer.scan(scan_once)
+            nextchar = buffer.peek()
+            while nextchar is None:
+                yield _MORE
+                nextchar = buffer.peek()
+            if nextchar != ':':
+                raise buffer.errmsg("Expecting ':' delimiter")
+            buffer.pos += 1
+            expect_key = False
+            yield 'key', key
+            continue
+        if nextchar == '{':
+            buffer.pos += 1
+            yield 'start_object', None
+            nextchar = buffer.peek()
+            while nextchar is None:
+                yield _MORE
+                nextchar = buffer.peek()
+            if nextchar != '}':
+                stack.append('}')
+                expect_key = True
+                continue
+            buffer.pos += 1
+            yield 'end_object', None
+        elif nextchar == '[':
+            buffer.pos += 1
+            yield 'start_array', None
+            nextchar = buffer.peek()
+            while nextchar is None:
+                yield _MORE
+                nextchar = buffer.peek()
+            if nextchar != ']':
+                stack.append(']')
+                continue
+            buffer.pos += 1
+            yield 'end_array', None
+        elif not nextchar and not stack:
+            return
+        else:
+            value = buffer.scan(scan_once)
+            while value is _MORE:
+                yield _MORE
+                value = buffer.scan(scan_once)
+            yield 'value', value
+        # A value is complete; close the containers it ends
+        while stack:
+            nextchar = buffer.peek()
+            while nextchar is None:
+                yield _MORE
+                nextchar = buffer.peek()
+            closer = stack[-1]
+            if nextchar == closer:
+                buffer.pos += 1
+                del stack[-1]
+                if closer == '}':
+                    yield 'end_object', None
+                else:
+                    yield 'end_array', None
+            elif nextchar == ',':
+                buffer.pos += 1
+                expect_key = closer == '}'
+                break
+            else:
+                raise buffer.errmsg("Expecting ',' delimiter")
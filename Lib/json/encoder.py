@@ -243,12 +243,8 @@ class JSONEncoder(object):
             return text
 
 
-        if (_one_shot and c_make_encoder is not None
-                and self.indent is None):
-            _iterencode = c_make_encoder(
-                markers, self.default, _encoder, self.indent,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+        if _one_shot and c_make_encoder is not None:
+            _iterencode = self._make_c_encoder(markers, _encoder)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, self.indent, floatstr,
@@ -256,6 +252,33 @@ class JSONEncoder(object):
                 self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def _make_c_encoder(self, markers, _encoder):
+        indent = self.indent
+        if indent is not None and not isinstance(indent, str):
+            indent = ' ' * indent
+        return c_make_encoder(
+            markers, self.default, _encoder, indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+
+    def _dump(self, o, write):
+        """Encode the given object and pass each string representation
+        to ``write``, in chunks of bounded size.
+
+        Used by ``json.dump()`` to let the C encoder write straight to a
+        file without building the whole document in memory.
+        """
+        if c_make_encoder is None:
+            for chunk in self.iterencode(o):
+                write(chunk)
+            return
+        markers = {} if self.check_circular else None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        self._make_c_encoder(markers, _encoder)(o, 0, write)
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
         ## HACK: hand-optimized bytecode; turn globals into locals
@@ -229,6 +229,11 @@ def _releaseLock():
 #   The logging record
 #---------------------------------------------------------------------------
 
+# Maps the pathname of a record to its filename and module, which are
+# otherwise recomputed for every record logged from the same source file.
+_pathnameCache = {}
+_PATHNAME_CACHE_SIZE = 1000
+
 class LogRecord(object):
     """
     A LogRecord instance represents an event being logged.
@@ -275,11 +280,18 @@ class LogRecord(object):
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+            self.filename, self.module = _pathnameCache[pathname]
+        except (KeyError, TypeError):
+            try:
+                self.filename = os.path.basename(pathname)
+                self.module = os.path.splitext(self.filename)[0]
+            except (TypeError, ValueError, AttributeError):
+                self.filename = pathname
+                self.module = "Unknown module"
+            else:
+                if len(_pathnameCache) >= _PATHNAME_CACHE_SIZE:
+                    _pathnameCache.clear()
+                _pathnameCache[pathname] = self.filename, self.module
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
@@ -838,6 +850,16 @@ class Handler(Filterer):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emitBatch(self, records):
+        """
+        Do whatever it takes to actually log a batch of logging records.
+
+        This version just calls emit() for each record. Subclasses may
+        override it to format and write the whole batch in one operation.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -856,6 +878,23 @@ class Handler(Filterer):
                 self.release()
         return rv
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit a batch of logging records.
+
+        The records which pass the handler's filters are emitted with a
+        single call to emitBatch(), holding the I/O thread lock once for
+        the whole batch. Returns the list of records passed for emission.
+        """
+        records = [record for record in records if self.filter(record)]
+        if records:
+            self.acquire()
+            try:
+                self.emitBatch(records)
+            finally:
+                self.release()
+        return records
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -988,6 +1027,35 @@ class StreamHandler(Handler):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        The records are formatted and written to the stream with a single
+        write, and the stream is flushed once. If a subclass overrides
+        emit(), it is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            self._writeBatch(records)
+
+    def _writeBatch(self, records):
+        terminator = self.terminator
+        parts = []
+        for record in records:
+            try:
+                parts.append(self.format(record))
+                parts.append(terminator)
+            except Exception:
+                self.handleError(record)
+        if parts:
+            try:
+                self.stream.write(''.join(parts))
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1080,6 +1148,20 @@ class FileHandler(StreamHandler):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit a batch of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before writing the batch.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            if self.stream is None:
+                self.stream = self._open()
+            self._writeBatch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1454,6 +1536,8 @@ class Logger(Filterer):
         Low-level logging routine which creates a LogRecord and then calls
         all the handlers of this logger to handle the record.
         """
+        if not self._wouldHandle(level):
+            return
         sinfo = None
         if _srcfile:
             #IronPython doesn't track Python frames, so findCaller raises an
@@ -1474,6 +1558,33 @@ class Logger(Filterer):
                                  exc_info, func, extra, sinfo)
         self.handle(record)
 
+    def _wouldHandle(self, level):
+        """
+        Return whether a record at the specified level could be emitted.
+
+        A record is only worth creating if some handler which callHandlers()
+        would visit accepts its level; finding the caller and building the
+        record are the most expensive parts of a logging call. Logger filters
+        are given the record whenever the logger has any, since they may
+        have side effects, and so are subclasses which change how records
+        are handled.
+        """
+        if (self.filters or type(self).handle is not Logger.handle
+                or type(self).callHandlers is not Logger.callHandlers):
+            return True
+        c = self
+        found = False
+        while c:
+            for hdlr in c.handlers:
+                if level >= hdlr.level:
+                    return True
+                found = True
+            if not c.propagate:
+                break
+            c = c.parent
+        # With no handlers at all, the record goes to lastResort.
+        return not found
+
     def handle(self, record):
         """
         Call the handlers for the specified record.
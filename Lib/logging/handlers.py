@@ -27,6 +27,8 @@ import logging, socket, os, pickle, struct, time, re
 from stat import ST_DEV, ST_INO, ST_MTIME
 import queue
 import threading
+import collections
+import weakref
 
 #
 # Some constants...
@@ -1501,3 +1503,224 @@ class QueueListener(object):
         self.enqueue_sentinel()
         self._thread.join()
         self._thread = None
+
+
+class AsyncHandler(logging.Handler):
+    """
+    This handler passes records to a background thread, which emits them
+    to a list of handlers in batches.
+
+    Emitting a record only appends it to a bounded queue, so that the thread
+    which logs the event does not format the record, wait for the I/O locks
+    of the target handlers or perform any I/O itself.
+    """
+    _sentinel = None
+
+    def __init__(self, *handlers, capacity=10000, block=True, timeout=None,
+                 batch_size=100, respect_handler_level=False):
+        """
+        Initialise an instance with the specified handlers.
+
+        At most *capacity* records are held in the queue. When it is full,
+        emitting a record waits for the background thread if *block* is
+        true, for at most *timeout* seconds if that is not None; otherwise
+        the record is dropped and counted in the ``dropped`` attribute.
+        The background thread passes up to *batch_size* records at a time
+        to the handleBatch() method of each handler.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        logging.Handler.__init__(self)
+        self.handlers = handlers
+        self.capacity = capacity
+        self.block = block
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.respect_handler_level = respect_handler_level
+        self.dropped = 0
+        # A deque and an event are much cheaper to feed than a queue.Queue.
+        # The condition is only used when the queue is full.
+        self._queue = collections.deque()
+        self._ready = threading.Event()
+        self._not_full = threading.Condition(threading.Lock())
+        self._thread = None
+        self._start()
+        _async_handlers.add(self)
+
+    def _start(self):
+        self._thread = t = threading.Thread(target=self._monitor)
+        t.daemon = True
+        t.start()
+
+    def _after_fork_in_child(self):
+        # The background thread does not exist in the child process, and
+        # the records still in the queue are handled by the parent.
+        self.createLock()
+        self._queue = collections.deque()
+        self._ready = threading.Event()
+        self._not_full = threading.Condition(threading.Lock())
+        if self._thread is not None:
+            self._start()
+
+    def handle(self, record):
+        """
+        Conditionally enqueue the specified logging record.
+
+        Unlike the base class, this does not acquire the I/O thread lock,
+        since enqueueing a record is thread-safe.
+        """
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Puts the record on the queue as it is: formatting is left to the
+        handlers, on the background thread. If the queue is full and the
+        record cannot be enqueued, or if the handler has been closed, it is
+        dropped.
+        """
+        q = self._queue
+        if len(q) >= self.capacity or self._thread is None:
+            if not self._wait_not_full():
+                return
+        q.append(record)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def _wait_not_full(self):
+        with self._not_full:
+            if self.block and self._thread is not None:
+                endtime = None
+                if self.timeout is not None:
+                    endtime = time.monotonic() + self.timeout
+                while len(self._queue) >= self.capacity:
+                    if endtime is None:
+                        self._not_full.wait()
+                    else:
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            break
+                        self._not_full.wait(remaining)
+                    if self._thread is None:
+                        break
+                else:
+                    return True
+            self.dropped += 1
+            return False
+
+    def _enqueue_control(self, item):
+        self._queue.append(item)
+        self._ready.set()
+
+    def handleBatch(self, records):
+        """
+        Conditionally enqueue a batch of logging records.
+        """
+        return [record for record in records if self.handle(record)]
+
+    def process(self, records):
+        """
+        Pass a batch of records to the handlers.
+
+        This runs on the background thread.
+        """
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            else:
+                batch = records
+            if batch:
+                try:
+                    handler.handleBatch(batch)
+                except Exception:
+                    self.handleError(batch[-1])
+
+    def _monitor(self):
+        """
+        Take batches of records from the queue and process them.
+
+        This method runs on a separate, internal thread. Besides records,
+        the queue carries flush requests, which are events to set once all
+        the records before them have been emitted, and a sentinel object
+        which terminates the thread.
+        """
+        q = self._queue
+        ready = self._ready
+        not_full = self._not_full
+        batch_size = self.batch_size
+        while True:
+            ready.wait()
+            ready.clear()
+            while q:
+                records = []
+                while q and len(records) < batch_size:
+                    item = q.popleft()
+                    if isinstance(item, logging.LogRecord):
+                        records.append(item)
+                        continue
+                    if records:
+                        self.process(records)
+                        records = []
+                    if item is self._sentinel:
+                        with not_full:
+                            not_full.notify_all()
+                        return
+                    for handler in self.handlers:
+                        try:
+                            handler.flush()
+                        except Exception:
+                            pass
+                    item.set()
+                with not_full:
+                    not_full.notify_all()
+                if records:
+                    self.process(records)
+
+    def flush(self):
+        """
+        Wait until all the records emitted so far have been handled, then
+        flush the handlers.
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            done = threading.Event()
+            self._enqueue_control(done)
+            done.wait()
+
+    def close(self):
+        """
+        Tidy up any resources used by the handler.
+
+        This emits all the records which are still in the queue and stops
+        the background thread. The handlers themselves are not closed:
+        logging.shutdown() closes them after this handler if they were
+        created before it.
+        """
+        self.acquire()
+        try:
+            thread = self._thread
+            self._thread = None
+        finally:
+            self.release()
+        if thread is not None and thread.is_alive():
+            self._enqueue_control(self._sentinel)
+            thread.join()
+        logging.Handler.close(self)
+
+
+# The handlers whose background thread must be restarted in a child process.
+_async_handlers = weakref.WeakSet()
+
+def _after_fork_in_child():
+    for handler in list(_async_handlers):
+        handler._after_fork_in_child()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -22,6 +22,7 @@ __all__ = [
 ]
 
 import builtins
+import functools
 import io
 import os
 from _lzma import *
@@ -47,7 +48,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 threads=1):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,10 +91,17 @@ class LZMAFile(_compression.BaseStream):
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        threads (if greater than 1, or None for the number of CPUs) makes
+        the file compress blocks of its input concurrently when writing
+        with FORMAT_XZ. Each block is written as an independent .xz
+        stream; like the xz utility, LZMAFile reads such concatenated
+        streams back as a single file.
         """
         self._fp = None
         self._closefp = False
         self._mode = _MODE_CLOSED
+        self._parallel = None
 
         if mode in ("r", "rb"):
             if check != -1:
@@ -113,6 +122,10 @@ class LZMAFile(_compression.BaseStream):
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
+        threads = _compression.check_threads(threads,
+                                             mode_code == _MODE_WRITE)
+        if threads > 1 and format != FORMAT_XZ:
+            raise ValueError("threads is only supported for FORMAT_XZ")
 
         if isinstance(filename, (str, bytes, os.PathLike)):
             if "b" not in mode:
@@ -130,6 +143,11 @@ class LZMAFile(_compression.BaseStream):
             raw = _compression.DecompressReader(self._fp, LZMADecompressor,
                 trailing_error=LZMAError, format=format, filters=filters)
             self._buffer = io.BufferedReader(raw)
+        elif threads > 1:
+            self._parallel = _compression.ParallelCompressor(
+                self._fp,
+                functools.partial(_compress_block, check, preset, filters),
+                _parallel_block_size(preset, filters), threads)
 
     def close(self):
         """Flush and close the file.
@@ -143,6 +161,9 @@ class LZMAFile(_compression.BaseStream):
             if self._mode == _MODE_READ:
                 self._buffer.close()
                 self._buffer = None
+            elif self._parallel is not None:
+                self._parallel.close()
+                self._compressor = None
             elif self._mode == _MODE_WRITE:
                 self._fp.write(self._compressor.flush())
                 self._compressor = None
@@ -154,6 +175,7 @@ class LZMAFile(_compression.BaseStream):
                 self._fp = None
                 self._closefp = False
                 self._mode = _MODE_CLOSED
+                self._parallel = None
 
     @property
     def closed(self):
@@ -229,8 +251,11 @@ class LZMAFile(_compression.BaseStream):
         may not reflect the data written until close() is called.
         """
         self._check_can_write()
-        compressed = self._compressor.compress(data)
-        self._fp.write(compressed)
+        if self._parallel is not None:
+            self._parallel.write(data)
+        else:
+            compressed = self._compressor.compress(data)
+            self._fp.write(compressed)
         self._pos += len(data)
         return len(data)
 
@@ -262,7 +287,7 @@ class LZMAFile(_compression.BaseStream):
 
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, threads=1):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str, bytes,
@@ -273,7 +298,7 @@ def open(filename, mode="rb", *,
     "a", or "ab" for binary mode, or "rt", "wt", "xt", or "at" for text
     mode.
 
-    The format, check, preset and filters arguments specify the
+    The format, check, preset, filters and threads arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
     LZMAFile.
 
@@ -299,7 +324,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, threads=threads)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
@@ -307,6 +332,28 @@ def open(filename, mode="rb", *,
         return binary_file
 
 
+# Dictionary sizes of the preset levels 0-9, from liblzma.
+_PRESET_DICT_SIZES = [1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22,
+                      1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26]
+
+
+def _parallel_block_size(preset, filters):
+    # Like "xz --threads", use blocks of three times the dictionary size,
+    # so that splitting the input costs little compression.
+    dict_size = None
+    if filters is not None:
+        dict_size = filters[-1].get("dict_size")
+    elif preset is not None:
+        dict_size = _PRESET_DICT_SIZES[preset & 0x1f]
+    if dict_size is None:
+        dict_size = _PRESET_DICT_SIZES[PRESET_DEFAULT]
+    return 3 * dict_size
+
+
+def _compress_block(check, preset, filters, block, previous):
+    return compress(block, FORMAT_XZ, check, preset, filters)
+
+
 def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
     """Compress a block of data.
 
@@ -46,6 +46,52 @@ def mapstar(args):
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+def timedmapstar(args):
+    start = time.perf_counter()
+    result = list(map(*args))
+    return time.perf_counter() - start, result
+
+class AdaptiveChunker(object):
+    '''
+    Chooses the chunk sizes for `imap()` and `imap_unordered()` when
+    chunksize is None, from the time workers spent on earlier chunks.
+    '''
+
+    # Aim for chunks taking this many seconds, which keeps the cost of
+    # sending each chunk small compared to the work it carries while still
+    # letting long-running tasks spread evenly over the workers.
+    target_time = 0.02
+    max_chunksize = 1 << 14
+
+    def __init__(self):
+        self.chunksize = 1
+
+    def get_tasks(self, func, it):
+        it = iter(it)
+        while 1:
+            x = tuple(itertools.islice(it, self.chunksize))
+            if not x:
+                return
+            yield (func, x)
+
+    def record(self, obj):
+        '''Update the chunk size from a `timedmapstar()` result and return
+        that result without its timing.'''
+        success, value = obj
+        if not success:
+            return obj
+        elapsed, value = value
+        if value:
+            per_item = elapsed / len(value)
+            if per_item > 0:
+                ideal = int(self.target_time / per_item)
+            else:
+                ideal = self.max_chunksize
+            # Grow gradually, shrink at once.
+            self.chunksize = max(1, min(ideal, self.chunksize * 2,
+                                        self.max_chunksize))
+        return (True, value)
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -297,6 +343,7 @@ class Pool(object):
     def imap(self, func, iterable, chunksize=1):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
+        If chunksize is None, chunk sizes adapt to the time tasks take.
         '''
         if self._state != RUN:
             raise ValueError("Pool not running")
@@ -308,6 +355,18 @@ class Pool(object):
                     result._set_length
                 ))
             return result
+        elif chunksize is None:
+            chunker = AdaptiveChunker()
+            task_batches = chunker.get_tasks(func, iterable)
+            result = IMapIterator(self._cache, chunker)
+            self._taskqueue.put(
+                (
+                    self._guarded_task_generation(result._job,
+                                                  timedmapstar,
+                                                  task_batches),
+                    result._set_length
+                ))
+            return (item for chunk in result for item in chunk)
         else:
             if chunksize < 1:
                 raise ValueError(
@@ -338,6 +397,18 @@ class Pool(object):
                     result._set_length
                 ))
             return result
+        elif chunksize is None:
+            chunker = AdaptiveChunker()
+            task_batches = chunker.get_tasks(func, iterable)
+            result = IMapUnorderedIterator(self._cache, chunker)
+            self._taskqueue.put(
+                (
+                    self._guarded_task_generation(result._job,
+                                                  timedmapstar,
+                                                  task_batches),
+                    result._set_length
+                ))
+            return (item for chunk in result for item in chunk)
         else:
             if chunksize < 1:
                 raise ValueError(
@@ -714,8 +785,9 @@ class MapResult(ApplyResult):
 
 class IMapIterator(object):
 
-    def __init__(self, cache):
+    def __init__(self, cache, chunker=None):
         self._cond = threading.Condition(threading.Lock())
+        self._chunker = chunker
         self._job = next(job_counter)
         self._cache = cache
         self._items = collections.deque()
@@ -750,6 +822,8 @@ class IMapIterator(object):
     __next__ = next                    # XXX
 
     def _set(self, i, obj):
+        if self._chunker is not None:
+            obj = self._chunker.record(obj)
         with self._cond:
             if self._index == i:
                 self._items.append(obj)
@@ -779,6 +853,8 @@ class IMapIterator(object):
 class IMapUnorderedIterator(IMapIterator):
 
     def _set(self, i, obj):
+        if self._chunker is not None:
+            obj = self._chunker.record(obj)
         with self._cond:
             self._items.append(obj)
             self._index += 1
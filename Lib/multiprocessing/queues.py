@@ -76,6 +76,9 @@ class Queue(object):
         self._send_bytes = self._writer.send_bytes
         self._recv_bytes = self._reader.recv_bytes
         self._poll = self._reader.poll
+        # Items of a batch already read from the pipe by this process; each
+        # of them holds the semaphore until it is returned
+        self._pending = collections.deque()
 
     def put(self, obj, block=True, timeout=None):
         assert not self._closed, "Queue {0!r} has been closed".format(self)
@@ -88,7 +91,59 @@ class Queue(object):
             self._buffer.append(obj)
             self._notempty.notify()
 
+    def put_many(self, objs, block=True, timeout=None):
+        """Put all the items of the iterable objs into the queue.
+
+        The items are pickled together and written to the pipe as a single
+        message.  They are all received by the process which reads that
+        message, and returned by its following get() or get_many() calls.
+        Only the pickling and the pipe write are shared by the batch: the
+        semaphore bounding the queue size is still acquired once per item
+        here, and released once per item as they are returned.
+        """
+        assert not self._closed, "Queue {0!r} has been closed".format(self)
+        objs = _Batch(objs)
+        if len(objs) > self._maxsize:
+            raise ValueError('cannot put more than maxsize items at once')
+        if objs:
+            self._put_item(objs, len(objs), block, timeout)
+
+    def put_pickled(self, data, block=True, timeout=None):
+        """Put an object already serialized with pickle into the queue.
+
+        data is written to the pipe as is and unpickled by get().
+        """
+        assert not self._closed, "Queue {0!r} has been closed".format(self)
+        self._put_item(_Pickled(bytes(data)), 1, block, timeout)
+
+    def _put_item(self, item, nitems, block, timeout):
+        self._acquire_sem(nitems, block, timeout)
+        with self._notempty:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.append(item)
+            self._notempty.notify()
+
+    def _acquire_sem(self, n, block, timeout):
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        for i in range(n):
+            if block and timeout is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+            if not self._sem.acquire(block, timeout):
+                for j in range(i):
+                    self._sem.release()
+                raise Full
+
     def get(self, block=True, timeout=None):
+        if self._pending:
+            try:
+                res = self._pending.popleft()
+            except IndexError:
+                pass
+            else:
+                self._sem.release()
+                return res
         if block and timeout is None:
             with self._rlock:
                 res = self._recv_bytes()
@@ -110,14 +165,91 @@ class Queue(object):
             finally:
                 self._rlock.release()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        res = _ForkingPickler.loads(res)
+        if type(res) is _Batch:
+            # The semaphore was released for the first item when the message
+            # was read; the others are released when they leave _pending.
+            self._pending.extend(res[1:])
+            return res[0]
+        return res
+
+    def get_many(self, maxitems, block=True, timeout=None):
+        """Remove and return a list of up to maxitems items from the queue.
+
+        Wait for the first item as get() does, then also return the items
+        which can be read without blocking.
+        """
+        if maxitems < 1:
+            raise ValueError('maxitems must be at least 1')
+        res = []
+        pending = self._pending
+        while pending and len(res) < maxitems:
+            try:
+                res.append(pending.popleft())
+            except IndexError:
+                break
+            self._sem.release()
+        npending = len(res)
+        if res:
+            if len(res) == maxitems or not self._rlock.acquire(False):
+                return res
+            try:
+                msgs = self._recv_available(maxitems - len(res))
+            finally:
+                self._rlock.release()
+        elif block and timeout is None:
+            with self._rlock:
+                msgs = [self._recv_bytes()]
+                self._sem.release()
+                msgs += self._recv_available(maxitems - 1)
+        else:
+            if block:
+                deadline = time.monotonic() + timeout
+            if not self._rlock.acquire(block, timeout):
+                raise Empty
+            try:
+                if block:
+                    timeout = deadline - time.monotonic()
+                    if not self._poll(timeout):
+                        raise Empty
+                elif not self._poll():
+                    raise Empty
+                msgs = [self._recv_bytes()]
+                self._sem.release()
+                msgs += self._recv_available(maxitems - 1)
+            finally:
+                self._rlock.release()
+        # unserialize the data after having released the lock
+        for msg in msgs:
+            obj = _ForkingPickler.loads(msg)
+            if type(obj) is _Batch:
+                res.extend(obj)
+            else:
+                res.append(obj)
+        if len(res) > maxitems:
+            pending.extendleft(reversed(res[maxitems:]))
+            del res[maxitems:]
+        # The semaphore was released once per message read; release it for
+        # the other items returned, but not for those left in _pending.
+        for i in range(len(res) - npending - len(msgs)):
+            self._sem.release()
+        return res
+
+    def _recv_available(self, maxmsgs):
+        # Read up to maxmsgs messages without blocking; the read lock must
+        # be held.
+        msgs = []
+        while len(msgs) < maxmsgs and self._poll():
+            msgs.append(self._recv_bytes())
+            self._sem.release()
+        return msgs
 
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
         return self._maxsize - self._sem._semlock._get_value()
 
     def empty(self):
-        return not self._poll()
+        return not self._pending and not self._poll()
 
     def full(self):
         return self._sem._semlock._is_zero()
@@ -215,6 +347,7 @@ class Queue(object):
             wrelease = writelock.release
         else:
             wacquire = None
+        nitems = 1
 
         while 1:
             try:
@@ -232,8 +365,14 @@ class Queue(object):
                             close()
                             return
 
-                        # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
+                        nitems = 1
+                        if type(obj) is _Pickled:
+                            obj = obj.data
+                        else:
+                            if type(obj) is _Batch:
+                                nitems = len(obj)
+                            # serialize the data before acquiring the lock
+                            obj = _ForkingPickler.dumps(obj)
                         if wacquire is None:
                             send_bytes(obj)
                         else:
@@ -260,7 +399,8 @@ class Queue(object):
                     # if the object had been silently removed from the queue
                     # and this step is necessary to have a properly working
                     # queue.
-                    queue_sem.release()
+                    for i in range(nitems):
+                        queue_sem.release()
                     onerror(e, obj)
 
     @staticmethod
@@ -275,6 +415,19 @@ class Queue(object):
 
 _sentinel = object()
 
+
+class _Batch(list):
+    # Items put with put_many(), pickled and sent as a single message
+    __slots__ = ()
+
+
+class _Pickled(object):
+    # An object serialized by the caller of put_pickled()
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
 #
 # A queue type which also supports join() and task_done() methods
 #
@@ -309,6 +462,16 @@ class JoinableQueue(Queue):
             self._unfinished_tasks.release()
             self._notempty.notify()
 
+    def _put_item(self, item, nitems, block, timeout):
+        self._acquire_sem(nitems, block, timeout)
+        with self._notempty, self._cond:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.append(item)
+            for i in range(nitems):
+                self._unfinished_tasks.release()
+            self._notempty.notify()
+
     def task_done(self):
         with self._cond:
             if not self._unfinished_tasks.acquire(False):
@@ -96,6 +96,8 @@ This module exports the following functions:
     compile   Compile a pattern into a Pattern object.
     purge     Clear the regular expression cache.
     escape    Backslash all non-alphanumerics in a string.
+    save_cache Save the compiled patterns in the cache to a file.
+    load_cache Load compiled patterns saved by save_cache.
 
 Some of the functions in this module takes flags as optional parameters:
     A  ASCII       For string patterns, make \w, \W, \b, \B, \d, \D
@@ -123,6 +125,9 @@ import enum
 import sre_compile
 import sre_parse
 import functools
+import marshal
+import sys
+import _sre
 try:
     import _locale
 except ImportError:
@@ -133,6 +138,7 @@ except ImportError:
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
     "findall", "finditer", "compile", "purge", "template", "escape",
+    "save_cache", "load_cache",
     "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
     "UNICODE",
@@ -236,8 +242,66 @@ def compile(pattern, flags=0):
 def purge():
     "Clear the regular expression caches"
     _cache.clear()
+    _precompiled.clear()
     _compile_repl.cache_clear()
 
+def save_cache(file):
+    """Save the compiled code of the patterns in the regular expression
+    cache, and of those loaded by load_cache(), to file.
+
+    file is a path or a binary file object."""
+    precompiled = dict(_precompiled)
+    for key in list(_cache):
+        if key not in precompiled and key[0] in (str, bytes):
+            args = sre_compile._compile_args(key[1], key[2])
+            # The opcodes are int subclasses, which marshal rejects.
+            code = list(map(int, args[2]))
+            precompiled[key] = args = args[:2] + (code,) + args[3:]
+            # Pickled patterns are compiled again with their final flags.
+            precompiled.setdefault((key[0], key[1], args[1]), args)
+    entries = [(flags, args) for (_, _, flags), args in precompiled.items()]
+    data = marshal.dumps((_CACHE_HEADER, entries))
+    if hasattr(file, "write"):
+        file.write(data)
+    else:
+        # Write atomically, other processes may be loading the file.
+        import os
+        tmp = "%s.%d.tmp" % (os.fspath(file), os.getpid())
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, file)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+def load_cache(file):
+    """Load compiled patterns saved by save_cache() from file, a path or
+    a binary file object, and return their number.
+
+    Compiling one of these patterns with the same flags then skips the
+    regular expression compiler.  A file saved by another version of
+    Python is ignored.  Only load files you trust."""
+    if hasattr(file, "read"):
+        data = file.read()
+    else:
+        with open(file, "rb") as f:
+            data = f.read()
+    try:
+        header, entries = marshal.loads(data)
+        if header != _CACHE_HEADER:
+            return 0
+        precompiled = {}
+        for flags, args in entries:
+            precompiled[type(args[0]), args[0], flags] = args
+    except (EOFError, ValueError, TypeError, IndexError):
+        raise ValueError("bad regular expression cache") from None
+    _precompiled.update(precompiled)
+    return len(precompiled)
+
 def template(pattern, flags=0):
     "Compile a template pattern, returning a Pattern object"
     return _compile(pattern, flags|T)
@@ -268,6 +332,13 @@ Match = type(sre_compile.compile('', 0).match(''))
 _cache = {}  # ordered!
 
 _MAXCACHE = 512
+
+# Arguments of _sre.compile() loaded by load_cache()
+_precompiled = {}
+
+_CACHE_HEADER = ("re", sre_compile.MAGIC, _sre.CODESIZE,
+                 sys.implementation.cache_tag)
+
 def _compile(pattern, flags):
     # internal: compile pattern
     if isinstance(flags, RegexFlag):
@@ -283,7 +354,16 @@ def _compile(pattern, flags):
         return pattern
     if not sre_compile.isstring(pattern):
         raise TypeError("first argument must be string or compiled pattern")
-    p = sre_compile.compile(pattern, flags)
+    args = _precompiled.get((type(pattern), pattern, flags))
+    p = None
+    if args is not None and not (flags & DEBUG):
+        try:
+            p = _sre.compile(*args)
+        except (TypeError, ValueError, RuntimeError):
+            # Bad code in the cache file: compile the pattern again.
+            _precompiled.pop((type(pattern), pattern, flags), None)
+    if p is None:
+        p = sre_compile.compile(pattern, flags)
     if not (flags & DEBUG):
         if len(_cache) >= _MAXCACHE:
             # Drop the oldest item
@@ -50,10 +50,17 @@ However, using keyword argument writeback=True may consume vast amount
 of memory for the cache, and it may make d.close() very slow, if you
 access many of d's entries after opening it in this way: d has no way to
 check which of the entries you access are mutable and/or which ones you
-actually mutate, so it must cache, and write back at close, all of the
-entries that you access.  You can call d.sync() to write back all the
-entries in the cache, and empty the cache (d.sync() also synchronizes
-the persistent dictionary on disk, if feasible).
+actually mutate, so it must cache, and pickle again at close, all of the
+entries that you access (only the entries whose pickle changed are
+written back).  You can call d.sync() to write back all the entries in
+the cache, and empty the cache (d.sync() also synchronizes the
+persistent dictionary on disk, if feasible).
+
+To bound the memory used, pass the keyword argument cachesize=n as
+well: d then keeps only the n most recently used entries in the cache,
+and writes the least recently used one back when it is evicted.  Note
+that a mutation of an entry that has been evicted is lost, as if
+writeback=False was used.
 """
 
 from pickle import Pickler, Unpickler
@@ -82,13 +89,19 @@ class Shelf(collections.abc.MutableMapping):
     """
 
     def __init__(self, dict, protocol=None, writeback=False,
-                 keyencoding="utf-8"):
+                 keyencoding="utf-8", cachesize=None):
         self.dict = dict
         if protocol is None:
             protocol = 3
         self._protocol = protocol
         self.writeback = writeback
-        self.cache = {}
+        if cachesize is not None and cachesize < 0:
+            raise ValueError('cachesize must not be negative')
+        self.cachesize = cachesize
+        self.cache = self._new_cache()
+        # Maps the keys of cache to the hashes of the pickles of their
+        # entries in dict.
+        self._hashes = {}
         self.keyencoding = keyencoding
 
     def __iter__(self):
@@ -110,19 +123,23 @@ class Shelf(collections.abc.MutableMapping):
         try:
             value = self.cache[key]
         except KeyError:
-            f = BytesIO(self.dict[key.encode(self.keyencoding)])
-            value = Unpickler(f).load()
+            data = self.dict[key.encode(self.keyencoding)]
+            value = Unpickler(BytesIO(data)).load()
             if self.writeback:
-                self.cache[key] = value
+                self._add_to_cache(key, value, data)
+        else:
+            if self.cachesize is not None:
+                self.cache.move_to_end(key)
         return value
 
     def __setitem__(self, key, value):
-        if self.writeback:
-            self.cache[key] = value
         f = BytesIO()
         p = Pickler(f, self._protocol)
         p.dump(value)
-        self.dict[key.encode(self.keyencoding)] = f.getvalue()
+        data = f.getvalue()
+        self.dict[key.encode(self.keyencoding)] = data
+        if self.writeback:
+            self._add_to_cache(key, value, data)
 
     def __delitem__(self, key):
         del self.dict[key.encode(self.keyencoding)]
@@ -130,6 +147,31 @@ class Shelf(collections.abc.MutableMapping):
             del self.cache[key]
         except KeyError:
             pass
+        else:
+            del self._hashes[key]
+
+    def _new_cache(self):
+        # An unbounded cache needs no LRU order.
+        if self.cachesize is None:
+            return {}
+        return collections.OrderedDict()
+
+    def _add_to_cache(self, key, value, data):
+        self.cache[key] = value
+        self._hashes[key] = hash(data)
+        if self.cachesize is not None:
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cachesize:
+                self._write_back(*self.cache.popitem(last=False))
+
+    def _write_back(self, key, value):
+        # Write back a cached entry, unless it wasn't modified.
+        f = BytesIO()
+        p = Pickler(f, self._protocol)
+        p.dump(value)
+        data = f.getvalue()
+        if hash(data) != self._hashes.pop(key, None):
+            self.dict[key.encode(self.keyencoding)] = data
 
     def __enter__(self):
         return self
@@ -163,11 +205,10 @@ class Shelf(collections.abc.MutableMapping):
 
     def sync(self):
         if self.writeback and self.cache:
-            self.writeback = False
             for key, entry in self.cache.items():
-                self[key] = entry
-            self.writeback = True
-            self.cache = {}
+                self._write_back(key, entry)
+            self.cache = self._new_cache()
+            self._hashes = {}
         if hasattr(self.dict, 'sync'):
             self.dict.sync()
 
@@ -186,8 +227,9 @@ class BsdDbShelf(Shelf):
     """
 
     def __init__(self, dict, protocol=None, writeback=False,
-                 keyencoding="utf-8"):
-        Shelf.__init__(self, dict, protocol, writeback, keyencoding)
+                 keyencoding="utf-8", cachesize=None):
+        Shelf.__init__(self, dict, protocol, writeback, keyencoding,
+                       cachesize)
 
     def set_location(self, key):
         (key, value) = self.dict.set_location(key)
@@ -222,12 +264,14 @@ class DbfilenameShelf(Shelf):
     See the module's __doc__ string for an overview of the interface.
     """
 
-    def __init__(self, filename, flag='c', protocol=None, writeback=False):
+    def __init__(self, filename, flag='c', protocol=None, writeback=False,
+                 cachesize=None):
         import dbm
-        Shelf.__init__(self, dbm.open(filename, flag), protocol, writeback)
+        Shelf.__init__(self, dbm.open(filename, flag), protocol, writeback,
+                       cachesize=cachesize)
 
 
-def open(filename, flag='c', protocol=None, writeback=False):
+def open(filename, flag='c', protocol=None, writeback=False, cachesize=None):
     """Open a persistent dictionary for reading and writing.
 
     The filename parameter is the base filename for the underlying
@@ -235,9 +279,10 @@ def open(filename, flag='c', protocol=None, writeback=False):
     filename and more than one file may be created.  The optional flag
     parameter has the same interpretation as the flag parameter of
     dbm.open(). The optional protocol parameter specifies the
-    version of the pickle protocol.
+    version of the pickle protocol.  The optional cachesize parameter
+    bounds the number of entries cached when writeback is true.
 
     See the module's __doc__ string for an overview of the interface.
     """
 
-    return DbfilenameShelf(filename, flag, protocol, writeback)
+    return DbfilenameShelf(filename, flag, protocol, writeback, cachesize)
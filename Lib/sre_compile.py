@@ -765,6 +765,13 @@ def compile(p, flags=0):
     else:
         pattern = None
 
+    return _sre.compile(*_code_args(pattern, p, flags))
+
+def _compile_args(pattern, flags):
+    # internal: return the arguments of _sre.compile() for a pattern string
+    return _code_args(pattern, sre_parse.parse(pattern, flags), flags)
+
+def _code_args(pattern, p, flags):
     code = _code(p, flags)
 
     if flags & SRE_FLAG_DEBUG:
@@ -777,8 +784,6 @@ def compile(p, flags=0):
     for k, i in groupindex.items():
         indexgroup[i] = k
 
-    return _sre.compile(
-        pattern, flags | p.pattern.flags, code,
-        p.pattern.groups-1,
-        groupindex, tuple(indexgroup)
-        )
+    return (pattern, flags | p.pattern.flags, code,
+            p.pattern.groups-1,
+            groupindex, tuple(indexgroup))
@@ -46,6 +46,7 @@ import time
 import struct
 import copy
 import re
+import json
 
 try:
     import pwd
@@ -1400,7 +1401,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None):
+            errorlevel=None, copybufsize=None, index=None):
         """Open an (uncompressed) tar archive `name'. `mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. `mode'
@@ -1408,10 +1409,15 @@ class TarFile(object):
            If `fileobj' is given, it is used for reading or writing data. If it
            can be determined, `mode' is overridden by `fileobj's mode.
            `fileobj' is not closed, when TarFile is closed.
+           `index' is a path or binary file object with an index written by
+           save_index(), which is used to look up members without reading
+           the headers of the members before them.
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
             raise ValueError("mode must be 'r', 'a', 'w' or 'x'")
+        if index is not None and mode != "r":
+            raise ValueError("an index can only be used in mode 'r'")
         self.mode = mode
         self._mode = modes[mode]
 
@@ -1464,12 +1470,22 @@ class TarFile(object):
                                 # current position in the archive file
         self.inodes = {}        # dictionary caching the inodes of
                                 # archive members already added
+        self._index = None      # list of (name, offset, offset_data, size)
+                                # tuples read from an index file
+        self._index_names = None
+                                # dictionary mapping names to the last
+                                # entry with that name in the index
 
         try:
             if self.mode == "r":
                 self.firstmember = None
                 self.firstmember = self.next()
 
+                # Read the index only once the archive is known to be valid,
+                # as open() may try several compression methods.
+                if index is not None:
+                    self._read_index(index)
+
             if self.mode == "a":
                 # Move to the end of the archive,
                 # before the first empty block.
@@ -1584,6 +1600,8 @@ class TarFile(object):
 
             if filemode not in ("r", "w"):
                 raise ValueError("mode must be 'r' or 'w'")
+            if kwargs.get("index") is not None:
+                raise ValueError("an index cannot be used in stream mode")
 
             stream = _Stream(name, filemode, comptype, fileobj, bufsize)
             try:
@@ -1755,8 +1773,30 @@ class TarFile(object):
         """Return the members of the archive as a list of their names. It has
            the same order as the list returned by getmembers().
         """
+        if self._index is not None and not self._loaded:
+            self._check()
+            return [entry[0] for entry in self._index]
         return [tarinfo.name for tarinfo in self.getmembers()]
 
+    def save_index(self, file):
+        """Write an index of the archive to `file', a path or a binary file
+           object. The index maps the name of each member to the offsets of
+           its header and data and its size. Passing it as the `index'
+           argument when the archive is opened again makes getmember() read
+           a single header instead of all the headers before the member.
+           The whole archive is scanned if it has not been yet.
+        """
+        self._check("r")
+        members = [[tarinfo.name, tarinfo.offset, tarinfo.offset_data,
+                    tarinfo.size] for tarinfo in self.getmembers()]
+        data = json.dumps({"tarfile_index": 1, "members": members})
+        data = data.encode("ascii")
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "wb") as f:
+                f.write(data)
+        else:
+            file.write(data)
+
     def gettarinfo(self, name=None, arcname=None, fileobj=None):
         """Create a TarInfo object from the result of os.stat or equivalent
            on an existing file. The file is either named by `name', or
@@ -2310,6 +2350,9 @@ class TarFile(object):
         """Find an archive member by name from bottom to top.
            If tarinfo is given, it is used as the starting point.
         """
+        if self._index is not None and not self._loaded:
+            return self._getindexed(name, tarinfo, normalize)
+
         # Ensure that all members have been loaded.
         members = self.getmembers()
 
@@ -2329,6 +2372,65 @@ class TarFile(object):
             if name == member_name:
                 return member
 
+    def _getindexed(self, name, tarinfo=None, normalize=False):
+        """Find an archive member by name using the index, and read its
+           header. If tarinfo is given, only the members before it are
+           searched.
+        """
+        self._check()
+        if tarinfo is None and not normalize:
+            entry = self._index_names.get(name)
+        else:
+            if normalize:
+                name = os.path.normpath(name)
+            entry = None
+            for candidate in reversed(self._index):
+                if tarinfo is not None and candidate[1] >= tarinfo.offset:
+                    continue
+                member_name = candidate[0]
+                if normalize:
+                    member_name = os.path.normpath(member_name)
+                if name == member_name:
+                    entry = candidate
+                    break
+        if entry is None:
+            return None
+
+        # Reading a header moves self.offset, which is where next()
+        # continues to scan the archive.
+        offset = self.offset
+        try:
+            self.fileobj.seek(entry[1])
+            member = self.tarinfo.fromtarfile(self)
+        except HeaderError as e:
+            raise ReadError("invalid index entry for %r: %s" % (entry[0], e))
+        finally:
+            self.offset = offset
+        if (member.name, member.offset, member.offset_data,
+                member.size) != entry:
+            raise ReadError("index does not match the archive")
+        return member
+
+    def _read_index(self, index):
+        """Read an index written by save_index() from a path or a binary
+           file object.
+        """
+        if isinstance(index, (str, bytes, os.PathLike)):
+            with bltn_open(index, "rb") as f:
+                data = f.read()
+        else:
+            data = index.read()
+        try:
+            data = json.loads(data)
+            if data["tarfile_index"] != 1:
+                raise ValueError("unsupported version")
+            entries = [(name, offset, offset_data, size)
+                       for name, offset, offset_data, size in data["members"]]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ReadError("invalid tar index: %s" % e) from None
+        self._index = entries
+        self._index_names = {entry[0]: entry for entry in entries}
+
     def _load(self):
         """Read through the entire archive file and look for readable
            members.
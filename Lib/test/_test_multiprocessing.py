@@ -20,6 +20,8 @@ import logging
 import struct
 import operator
 import weakref
+import pickle
+import warnings
 import test.support
 import test.support.script_helper
 from test import support
@@ -55,6 +57,12 @@ try:
 except ImportError:
     HAS_SHAREDCTYPES = False
 
+try:
+    from multiprocessing import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
+
 try:
     import msvcrt
 except ImportError:
@@ -1115,6 +1123,141 @@ class _TestQueue(BaseTestCase):
         # Assert that the serialization and the hook have been called correctly
         self.assertTrue(not_serializable_obj.reduce_was_called)
         self.assertTrue(not_serializable_obj.on_queue_feeder_error_was_called)
+
+    @classmethod
+    def _test_put_many(cls, queue, results):
+        items = []
+        while len(items) < 100:
+            items += queue.get_many(30)
+        results.put(items)
+
+    def test_put_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue()
+        results = self.Queue()
+        p = self.Process(target=self._test_put_many, args=(queue, results))
+        p.daemon = True
+        p.start()
+        for i in range(0, 100, 10):
+            queue.put_many(range(i, i + 10))
+        self.assertEqual(results.get(timeout=TIMEOUT), list(range(100)))
+        p.join()
+        close_queue(queue)
+        close_queue(results)
+
+    def test_put_many_get(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue()
+        queue.put_many([1, 2, 3])
+        queue.put_many([])
+        queue.put(4)
+        self.assertEqual(queue.get(timeout=TIMEOUT), 1)
+        self.assertFalse(queue.empty())
+        self.assertEqual(queue.get(), 2)
+        self.assertEqual(queue.get(), 3)
+        self.assertEqual(queue.get(timeout=TIMEOUT), 4)
+        self.assertRaises(pyqueue.Empty, queue.get, False)
+        close_queue(queue)
+
+    def test_put_many_qsize(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue()
+        try:
+            self.assertEqual(queue.qsize(), 0)
+        except NotImplementedError:
+            self.skipTest('qsize method not implemented')
+        queue.put_many([1, 2, 3, 4])
+        self.assertEqual(queue.qsize(), 4)
+        # The other items of the batch were read from the pipe with the first
+        self.assertEqual(queue.get(timeout=TIMEOUT), 1)
+        self.assertEqual(queue.qsize(), 3)
+        self.assertFalse(queue.empty())
+        self.assertEqual(queue.get_many(2), [2, 3])
+        self.assertEqual(queue.qsize(), 1)
+        self.assertEqual(queue.get(), 4)
+        self.assertEqual(queue.qsize(), 0)
+        self.assertTrue(queue.empty())
+        close_queue(queue)
+
+    def test_get_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue()
+        self.assertRaises(ValueError, queue.get_many, 0)
+        self.assertRaises(pyqueue.Empty, queue.get_many, 5, False)
+        self.assertRaises(pyqueue.Empty, queue.get_many, 5, True, 0.1)
+
+        queue.put_many('abc')
+        self.assertEqual(queue.get_many(2, timeout=TIMEOUT), ['a', 'b'])
+        self.assertEqual(queue.get_many(2), ['c'])
+
+        for i in range(5):
+            queue.put(i)
+        queue.put_many([5, 6])
+        # Wait for the feeder thread to write everything to the pipe
+        self.assertEqual(queue.get(timeout=TIMEOUT), 0)
+        for i in range(100):
+            if queue.qsize() == 0:
+                break
+            time.sleep(DELTA)
+        items = queue.get_many(10)
+        while len(items) < 6:
+            items += queue.get_many(10, timeout=TIMEOUT)
+        self.assertEqual(items, [1, 2, 3, 4, 5, 6])
+        self.assertTrue(queue.empty())
+        close_queue(queue)
+
+    def test_put_many_maxsize(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue(maxsize=3)
+        self.assertRaises(ValueError, queue.put_many, range(4))
+        queue.put(0)
+        self.assertRaises(pyqueue.Full, queue.put_many, range(3), False)
+        self.assertRaises(pyqueue.Full, queue.put_many, range(3), True, 0.1)
+        queue.put_many(range(2))
+        self.assertTrue(queue.full())
+        self.assertEqual(queue.get(timeout=TIMEOUT), 0)
+        self.assertEqual(queue.get(timeout=TIMEOUT), 0)
+        self.assertFalse(queue.full())
+        self.assertEqual(queue.get(), 1)
+        close_queue(queue)
+
+    def test_put_pickled(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue()
+        data = pickle.dumps(['spam', 42])
+        queue.put_pickled(data)
+        queue.put_pickled(bytearray(data))
+        self.assertEqual(queue.get(timeout=TIMEOUT), ['spam', 42])
+        self.assertEqual(queue.get(timeout=TIMEOUT), ['spam', 42])
+        close_queue(queue)
+
+    def test_joinable_queue_put_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.JoinableQueue()
+        queue.put_many(range(3))
+        queue.put_pickled(pickle.dumps(3))
+        self.assertEqual(queue.get_many(3, timeout=TIMEOUT), [0, 1, 2])
+        for i in range(3):
+            queue.task_done()
+        self.assertEqual(queue.get(timeout=TIMEOUT), 3)
+        queue.task_done()
+        queue.join()
+        self.assertRaises(ValueError, queue.task_done)
+        close_queue(queue)
 #
 #
 #
@@ -2361,6 +2504,35 @@ class _TestPool(BaseTestCase):
         it = self.pool.imap_unordered(sqr, list(range(1000)), chunksize=100)
         self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
 
+    def test_imap_adaptive_chunksize(self):
+        it = self.pool.imap(sqr, list(range(1000)), chunksize=None)
+        for i in range(1000):
+            self.assertEqual(next(it), i*i)
+        self.assertRaises(StopIteration, it.__next__)
+
+        it = self.pool.imap(sqr, iter(range(1000)), None)
+        self.assertEqual(list(it), list(map(sqr, list(range(1000)))))
+
+        it = self.pool.imap(sqr, [], chunksize=None)
+        self.assertEqual(list(it), [])
+
+        it = self.pool.imap_unordered(sqr, list(range(1000)), chunksize=None)
+        self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
+
+    def test_imap_adaptive_chunksize_handle_exception(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # The first chunk always holds a single item.
+        it = self.pool.imap(sqr, exception_throwing_generator(10, 0), None)
+        self.assertRaises(SayWhenError, it.__next__)
+        it = self.pool.imap_unordered(sqr, exception_throwing_generator(10, 0),
+                                      None)
+        self.assertRaises(SayWhenError, it.__next__)
+
+        it = self.pool.imap(raise_large_valuerror, [0.0], chunksize=None)
+        self.assertRaises(ValueError, it.__next__)
+
     def test_imap_unordered_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -3544,6 +3716,267 @@ class _TestSharedCTypes(BaseTestCase):
 #
 #
 
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @staticmethod
+    def _new_shm_name(prefix):
+        # Add the pid so the fork, forkserver and spawn variants of the
+        # tests can run concurrently without colliding.
+        return prefix + str(os.getpid())
+
+    @staticmethod
+    def _attach_existing_shmem_then_write(shmem_name_or_obj, binary_data):
+        if isinstance(shmem_name_or_obj, str):
+            local_sms = shared_memory.SharedMemory(shmem_name_or_obj)
+        else:
+            local_sms = shmem_name_or_obj
+        local_sms.buf[:len(binary_data)] = binary_data
+        local_sms.close()
+
+    def test_shared_memory_basics(self):
+        name_tsmb = self._new_shm_name('t01a')
+        sms = shared_memory.SharedMemory(name_tsmb, create=True, size=512)
+        self.addCleanup(sms.unlink)
+
+        # Verify attributes are readable.
+        self.assertEqual(sms.name, name_tsmb)
+        self.assertGreaterEqual(sms.size, 512)
+        self.assertGreaterEqual(len(sms.buf), sms.size)
+
+        # Modify contents of shared memory segment through memoryview.
+        sms.buf[0] = 42
+        self.assertEqual(sms.buf[0], 42)
+
+        # Attach to existing shared memory segment.
+        also_sms = shared_memory.SharedMemory(name_tsmb)
+        self.assertEqual(also_sms.buf[0], 42)
+        also_sms.close()
+
+        # Attach to existing shared memory segment but specify a new size.
+        same_sms = shared_memory.SharedMemory(name_tsmb, size=20*sms.size)
+        self.assertLess(same_sms.size, 20*sms.size)  # Size was ignored.
+        same_sms.close()
+
+        if shared_memory._USE_POSIX:
+            # POSIX shared memory can only be unlinked once.
+            name_dblunlink = self._new_shm_name('t01b')
+            sms_uno = shared_memory.SharedMemory(
+                name_dblunlink,
+                create=True,
+                size=5000
+            )
+            self.assertGreaterEqual(sms_uno.size, 5000)
+            sms_duo = shared_memory.SharedMemory(name_dblunlink)
+            sms_duo.unlink()  # First shm_unlink() call.
+            sms_duo.close()
+            sms_uno.close()
+            with self.assertRaises(FileNotFoundError):
+                sms_uno.unlink()  # A second shm_unlink() call is bad.
+
+        with self.assertRaises(FileExistsError):
+            # Attempting to create a new shared memory segment with a
+            # name that is already in use triggers an exception.
+            shared_memory.SharedMemory(name_tsmb, create=True, size=512)
+
+        if shared_memory._USE_POSIX:
+            # Requesting creation of a shared memory segment with the option
+            # to attach to an existing segment, if that name is currently in
+            # use, should not trigger an exception.
+            class OptionalAttachSharedMemory(shared_memory.SharedMemory):
+                _flags = os.O_CREAT | os.O_RDWR
+            ok_if_exists_sms = OptionalAttachSharedMemory(name_tsmb)
+            self.assertEqual(ok_if_exists_sms.size, sms.size)
+            ok_if_exists_sms.close()
+
+        # Attempting to attach to an existing shared memory segment when
+        # no segment exists with the supplied name triggers an exception.
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(self._new_shm_name('t01c'))
+
+        sms.close()
+
+    def test_shared_memory_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=-2)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=0)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory()
+
+    def test_shared_memory_across_processes(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+
+        # Verify remote attachment to existing block by name is working.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms.name, b'howdy')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'howdy')
+
+        # Verify pickling of SharedMemory instance also works.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms, b'HELLO')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'HELLO')
+
+        sms.close()
+
+    def test_shared_memory_pickle_unpickle(self):
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                sms = shared_memory.SharedMemory(create=True, size=512)
+                self.addCleanup(sms.unlink)
+                sms.buf[0:6] = b'pickle'
+
+                # Test pickling
+                pickled_sms = pickle.dumps(sms, protocol=proto)
+
+                # Test unpickling
+                sms2 = pickle.loads(pickled_sms)
+                self.assertIsInstance(sms2, shared_memory.SharedMemory)
+                self.assertEqual(sms.name, sms2.name)
+                self.assertEqual(bytes(sms.buf[0:6]), b'pickle')
+                self.assertEqual(bytes(sms2.buf[0:6]), b'pickle')
+
+                # Test that unpickled version is still the same SharedMemory
+                sms.buf[0:6] = b'newval'
+                self.assertEqual(bytes(sms.buf[0:6]), b'newval')
+                self.assertEqual(bytes(sms2.buf[0:6]), b'newval')
+
+                sms2.buf[0:6] = b'oldval'
+                self.assertEqual(bytes(sms.buf[0:6]), b'oldval')
+                self.assertEqual(bytes(sms2.buf[0:6]), b'oldval')
+
+                sms2.close()
+                sms.close()
+
+    def test_shared_memory_ShareableList_basics(self):
+        sl = shared_memory.ShareableList(
+            ['howdy', b'HoWdY', -273.154, 100, None, True, 42]
+        )
+        self.addCleanup(sl.shm.unlink)
+
+        # Verify attributes are readable.
+        self.assertEqual(sl.format, '8s8sdqxxxxxx?xxxxxxxx?q')
+
+        # Exercise len().
+        self.assertEqual(len(sl), 7)
+
+        # Exercise index().
+        with warnings.catch_warnings():
+            # Suppress BytesWarning when comparing against b'HoWdY'.
+            warnings.simplefilter('ignore')
+            with self.assertRaises(ValueError):
+                sl.index('100')
+            self.assertEqual(sl.index(100), 3)
+
+        # Exercise retrieving individual values.
+        self.assertEqual(sl[0], 'howdy')
+        self.assertEqual(sl[-2], True)
+
+        # Exercise iterability.
+        self.assertEqual(
+            tuple(sl),
+            ('howdy', b'HoWdY', -273.154, 100, None, True, 42)
+        )
+
+        # Exercise modifying individual values.
+        sl[3] = 42
+        self.assertEqual(sl[3], 42)
+        sl[4] = 'some'  # Change type at a given position.
+        self.assertEqual(sl[4], 'some')
+        self.assertEqual(sl.format, '8s8sdq8sxxxxxxx?q')
+        with self.assertRaisesRegex(ValueError,
+                                    "exceeds available storage"):
+            sl[4] = 'far too many'
+        self.assertEqual(sl[4], 'some')
+        sl[0] = 'encodés'  # Exactly 8 bytes of UTF-8 data
+        self.assertEqual(sl[0], 'encodés')
+        self.assertEqual(sl[1], b'HoWdY')  # no spillage
+        with self.assertRaisesRegex(ValueError,
+                                    "exceeds available storage"):
+            sl[1] = b'123456789'
+        self.assertEqual(sl[1], b'HoWdY')
+
+        # Exercise count().
+        with warnings.catch_warnings():
+            # Suppress BytesWarning when comparing against b'HoWdY'.
+            warnings.simplefilter('ignore')
+            self.assertEqual(sl.count(42), 2)
+            self.assertEqual(sl.count(b'HoWdY'), 1)
+            self.assertEqual(sl.count(b'adios'), 0)
+
+        # Exercise creating a duplicate.
+        sl_copy = shared_memory.ShareableList(sl, name=self._new_shm_name('t02a'))
+        try:
+            self.assertNotEqual(sl.shm.name, sl_copy.shm.name)
+            self.assertEqual(list(sl), list(sl_copy))
+            self.assertEqual(sl.format, sl_copy.format)
+            sl_copy[-1] = 77
+            self.assertEqual(sl_copy[-1], 77)
+            self.assertNotEqual(sl[-1], 77)
+            sl_copy.shm.close()
+        finally:
+            sl_copy.shm.unlink()
+
+        # Obtain a second handle on the same ShareableList.
+        sl_tethered = shared_memory.ShareableList(name=sl.shm.name)
+        self.assertEqual(sl.shm.name, sl_tethered.shm.name)
+        sl_tethered[-1] = 880
+        self.assertEqual(sl[-1], 880)
+        sl_tethered.shm.close()
+
+        sl.shm.close()
+
+        # Exercise creating an empty ShareableList.
+        empty_sl = shared_memory.ShareableList()
+        try:
+            self.assertEqual(len(empty_sl), 0)
+            self.assertEqual(empty_sl.format, '')
+            self.assertEqual(empty_sl.count('any'), 0)
+            with self.assertRaises(ValueError):
+                empty_sl.index(None)
+            empty_sl.shm.close()
+        finally:
+            empty_sl.shm.unlink()
+
+    def test_shared_memory_ShareableList_pickling(self):
+        sl = shared_memory.ShareableList(range(10))
+        self.addCleanup(sl.shm.unlink)
+
+        serialized_sl = pickle.dumps(sl)
+        deserialized_sl = pickle.loads(serialized_sl)
+        self.assertIsInstance(deserialized_sl, shared_memory.ShareableList)
+        self.assertEqual(deserialized_sl[-1], 9)
+        self.assertFalse(sl is deserialized_sl)
+        deserialized_sl[4] = "changed"
+        self.assertEqual(sl[4], "changed")
+
+        # Verify data is not being put into the pickled representation.
+        larger_sl = shared_memory.ShareableList(range(400))
+        self.addCleanup(larger_sl.shm.unlink)
+        serialized_larger_sl = pickle.dumps(larger_sl)
+        self.assertEqual(len(serialized_sl), len(serialized_larger_sl))
+        larger_sl.shm.close()
+
+        deserialized_sl.shm.close()
+        sl.shm.close()
+
+#
+#
+#
+
 class _TestFinalize(BaseTestCase):
 
     ALLOWED_TYPES = ('processes',)
@@ -4583,6 +5016,47 @@ class TestSimpleQueue(unittest.TestCase):
         proc.join()
 
 
+class TestAdaptiveChunker(unittest.TestCase):
+
+    def timed(self, elapsed, n):
+        return (True, (elapsed, list(range(n))))
+
+    def test_get_tasks(self):
+        chunker = multiprocessing.pool.AdaptiveChunker()
+        tasks = chunker.get_tasks(sqr, range(10))
+        self.assertEqual(next(tasks), (sqr, (0,)))
+        chunker.chunksize = 4
+        self.assertEqual(next(tasks), (sqr, (1, 2, 3, 4)))
+        self.assertEqual(next(tasks), (sqr, (5, 6, 7, 8)))
+        self.assertEqual(next(tasks), (sqr, (9,)))
+        self.assertRaises(StopIteration, next, tasks)
+
+    def test_record(self):
+        chunker = multiprocessing.pool.AdaptiveChunker()
+        target = chunker.target_time
+        self.assertEqual(chunker.record(self.timed(0.0, 3)),
+                         (True, [0, 1, 2]))
+        # Cheap tasks make the chunk size grow, doubling at most each time.
+        self.assertEqual(chunker.chunksize, 2)
+        chunker.record(self.timed(target / 1000, 2))
+        self.assertEqual(chunker.chunksize, 4)
+        for i in range(30):
+            chunker.record(self.timed(0.0, chunker.chunksize))
+        self.assertEqual(chunker.chunksize, chunker.max_chunksize)
+        # Expensive tasks shrink it at once.
+        chunker.record(self.timed(target * 10, 100))
+        self.assertEqual(chunker.chunksize, 10)
+        chunker.record(self.timed(target * 5, 1))
+        self.assertEqual(chunker.chunksize, 1)
+
+    def test_record_failure(self):
+        chunker = multiprocessing.pool.AdaptiveChunker()
+        chunker.chunksize = 8
+        exc = ValueError()
+        self.assertEqual(chunker.record((False, exc)), (False, exc))
+        self.assertEqual(chunker.chunksize, 8)
+
+
 class MiscTestCase(unittest.TestCase):
     def test__all__(self):
         # Just make sure names in blacklist are excluded
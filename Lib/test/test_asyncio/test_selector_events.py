@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import errno
 import selectors
 import socket
@@ -11,6 +12,7 @@ except ImportError:
     ssl = None
 
 import asyncio
+from asyncio import selector_events
 from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSocketTransport
@@ -901,9 +903,13 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock = mock.Mock(socket.socket)
         self.sock_fd = self.sock.fileno.return_value = 7
 
-    def socket_transport(self, waiter=None):
+    def socket_transport(self, waiter=None, sendmsg=False):
         transport = _SelectorSocketTransport(self.loop, self.sock,
                                              self.protocol, waiter=waiter)
+        if sendmsg:
+            transport._write_ready = transport._write_sendmsg
+        else:
+            transport._write_ready = transport._write_send
         self.addCleanup(close_transport, transport)
         return transport
 
@@ -1072,18 +1078,17 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data'])
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(b'data1')
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
-                         transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data1', b'data2'])
 
     def test_write_partial(self):
         data = b'data'
@@ -1093,7 +1098,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'ta'])
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -1103,7 +1108,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'ta'])
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -1114,7 +1119,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'ta'])
 
     def test_write_partial_none(self):
         data = b'data'
@@ -1125,7 +1130,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data'])
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -1135,7 +1140,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data'])
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -1176,7 +1181,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -1188,7 +1193,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
 
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -1206,40 +1211,40 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'ta'])
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(data)
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data'])
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = collections.deque([b'data1', b'data2'])
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list(transport._buffer), [b'data1', b'data2'])
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(b'data')
         transport._write_ready()
         transport._fatal_error.assert_called_with(
                                    err,
@@ -1259,7 +1264,7 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(list(tr._buffer), [b'data'])
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -1274,6 +1279,142 @@ class SelectorSocketTransportTests(test_utils.TestCase):
         self.loop.run_until_complete(asyncio.sleep(0))
         tr.write_eof()
 
+    def mock_sendmsg(self, *results):
+        sent = []
+        results = iter(results)
+        def sendmsg(buffers):
+            sent.append([bytes(b) for b in buffers])
+            return next(results)
+        self.sock.sendmsg.side_effect = sendmsg
+        return sent
+
+    def test_write_buffer_size(self):
+        transport = self.socket_transport()
+        self.sock.send.side_effect = BlockingIOError
+        transport.write(b'data1')
+        transport.write(bytearray(b'data22'))
+        self.assertEqual(transport.get_write_buffer_size(), 11)
+
+    def test_write_buffer_bytearray_copied(self):
+        data = bytearray(b'data')
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(data)
+        data[:] = b'1234'
+        self.assertEqual(list(transport._buffer), [b'ta'])
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg(self):
+        self.sock.send.side_effect = BlockingIOError
+        sent = self.mock_sendmsg(13, 2)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.write(b'data1')
+        transport.write(b'data2')
+        transport.write(memoryview(b'data3'))
+        self.assertEqual(list(transport._buffer),
+                         [b'data1', b'data2', b'data3'])
+        self.loop.assert_writer(7, transport._write_ready)
+
+        transport._write_ready()
+        self.assertEqual(sent, [[b'data1', b'data2', b'data3']])
+        self.assertEqual(list(transport._buffer), [b'a3'])
+        self.loop.assert_writer(7, transport._write_ready)
+
+        transport._write_ready()
+        self.assertEqual(sent[-1], [b'a3'])
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_iov_max(self):
+        self.sock.sendmsg.side_effect = (
+            lambda buffers: sum(map(len, buffers)))
+
+        transport = self.socket_transport(sendmsg=True)
+        nbuffers = selector_events._IOV_MAX + 2
+        transport._buffer.extend([b'x'] * nbuffers)
+        transport._write_ready()
+        self.assertEqual(list(transport._buffer), [b'x', b'x'])
+        transport._write_ready()
+        self.assertFalse(transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_exception(self):
+        err = self.sock.sendmsg.side_effect = OSError()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._fatal_error = mock.Mock()
+        transport._buffer.append(b'data')
+        transport._write_ready()
+        self.assertFalse(transport._buffer)
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal write error on socket transport')
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg(self):
+        sent = self.mock_sendmsg(6)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'head', b'', bytearray(b'er'), b'body'])
+        self.assertEqual(sent, [[b'head', b'er', b'body']])
+        self.assertFalse(self.sock.send.called)
+        self.assertEqual(list(transport._buffer), [b'body'])
+        self.loop.assert_writer(7, transport._write_ready)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_all_sent(self):
+        self.sock.sendmsg.return_value = 8
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'data', b'data'])
+        self.assertFalse(transport._buffer)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_send(self):
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.writelines([b'data1', b'data2'])
+        self.sock.send.assert_called_with(b'data1')
+        self.assertEqual(list(transport._buffer), [b'ta1', b'data2'])
+        self.loop.assert_writer(7, transport._write_ready)
+
+    def test_writelines_buffer(self):
+        transport = self.socket_transport()
+        transport._buffer.append(b'data1')
+        transport.writelines([b'data2', b'data3'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(list(transport._buffer),
+                         [b'data1', b'data2', b'data3'])
+
+    def test_writelines_no_data(self):
+        transport = self.socket_transport()
+        transport.writelines([])
+        transport.writelines([b''])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_str(self):
+        transport = self.socket_transport()
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_after_eof(self):
+        transport = self.socket_transport()
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
+    def test_writelines_closing(self):
+        transport = self.socket_transport()
+        transport.close()
+        self.assertEqual(transport._conn_lost, 1)
+        transport.writelines([b'data'])
+        self.assertEqual(transport._conn_lost, 2)
+
     @mock.patch('asyncio.base_events.logger')
     def test_transport_close_remove_writer(self, m_log):
         remove_writer = self.loop._remove_writer = mock.Mock()
@@ -47,6 +47,8 @@ class StreamTests(test_utils.TestCase):
 
     def _basetest_open_connection(self, open_connection_fut):
         reader, writer = self.loop.run_until_complete(open_connection_fut)
+        self.assertIsInstance(writer._protocol,
+                              asyncio.BufferedStreamReaderProtocol)
         writer.write(b'GET / HTTP/1.0\r\n\r\n')
         f = reader.readline()
         data = self.loop.run_until_complete(f)
@@ -224,6 +226,59 @@ class StreamTests(test_utils.TestCase):
         self.assertEqual(b'chunk', data)
         self.assertEqual(b'', stream._buffer)
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(10)
+        read_task = asyncio.Task(stream.readinto(buf), loop=self.loop)
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 10)
+        self.assertEqual(buf, self.DATA[:10])
+        self.assertEqual(self.DATA[10:], stream._buffer)
+
+    def test_readinto_partial(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        buf = bytearray(b'xxxxxxxx')
+        view = memoryview(buf)[2:]
+        n = self.loop.run_until_complete(stream.readinto(view))
+        self.assertEqual(n, 4)
+        self.assertEqual(buf, b'xxdataxx')
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        stream.feed_eof()
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 4)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+    def test_readinto_empty_buffer(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+    def test_readinto_readonly(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'xxxx'))
+        self.assertEqual(b'data', stream._buffer)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
     def test_readline(self):
         # Read one line. 'readline' will need to wait for the data
         # to come from 'cb'
@@ -761,6 +816,53 @@ os.close(fd)
         protocol = asyncio.StreamReaderProtocol(reader)
         self.assertIs(protocol._loop, self.loop)
 
+    def test_buffered_streamreaderprotocol(self):
+        reader = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.BufferedStreamReaderProtocol(reader,
+                                                        loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        buf = protocol.get_buffer(-1)
+        self.assertGreater(len(buf), 0)
+        buf[:6] = b'line1\n'
+        protocol.buffer_updated(6)
+        self.assertIs(protocol.get_buffer(-1), buf)
+        buf[:5] = b'line2'
+        protocol.buffer_updated(5)
+        self.assertEqual(b'line1\nline2', reader._buffer)
+
+        # Transports which don't support BufferedProtocol still work.
+        protocol.data_received(b'\n')
+        protocol.eof_received()
+        self.assertEqual(self.loop.run_until_complete(reader.read()),
+                         b'line1\nline2\n')
+
+    def test_buffered_streamreaderprotocol_socket(self):
+        # Data sent in several chunks over a real socket, some of them
+        # larger than the receive buffer, is received intact.
+        chunks = [bytes([i]) * (i * 4099 % 200000) for i in range(1, 40)]
+        expected = b''.join(chunks)
+
+        async def serve(reader, writer):
+            writer.writelines(chunks)
+            await writer.drain()
+            writer.close()
+
+        async def client():
+            server = await asyncio.start_server(
+                serve, support.HOST, 0, loop=self.loop)
+            addr = server.sockets[0].getsockname()
+            reader, writer = await asyncio.open_connection(
+                *addr, loop=self.loop)
+            data = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return data
+
+        data = self.loop.run_until_complete(client())
+        self.assertEqual(data, expected)
+
     def test_drain_raises(self):
         # See http://bugs.python.org/issue25441
 
@@ -267,6 +267,32 @@ class BZ2FileTest(BaseTest):
         with open(self.filename, "rb") as f:
             self.assertEqual(f.read(), expected)
 
+    def testWriteThreads(self):
+        data = self.TEXT * 20
+        with support.swap_attr(bz2, '_BLOCK_SIZE_UNIT', 100):
+            for size in (1, 100, 1000, len(data)):
+                with self.subTest(size=size):
+                    with BZ2File(self.filename, "w", compresslevel=3,
+                                 threads=3) as bz2f:
+                        for i in range(0, len(data), size):
+                            bz2f.write(data[i:i+size])
+                        self.assertEqual(bz2f.tell(), len(data))
+                    with open(self.filename, "rb") as f:
+                        self.assertEqual(bz2.decompress(f.read()), data)
+                    with BZ2File(self.filename) as bz2f:
+                        self.assertEqual(bz2f.read(), data)
+
+    def testWriteThreadsEmpty(self):
+        with BZ2File(self.filename, "w", threads=2):
+            pass
+        with open(self.filename, "rb") as f:
+            self.assertEqual(f.read(), bz2.compress(b''))
+
+    def testThreadsBadArgs(self):
+        self.assertRaises(ValueError, BZ2File, self.filename, "w", threads=0)
+        self.createTempFile()
+        self.assertRaises(ValueError, BZ2File, self.filename, "r", threads=2)
+
     def testWriteLines(self):
         with BZ2File(self.filename, "w") as bz2f:
             self.assertRaises(TypeError, bz2f.writelines)
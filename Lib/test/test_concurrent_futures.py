@@ -343,10 +343,15 @@ class ThreadPoolShutdownTest(ThreadPoolMixin, ExecutorShutdownTest, BaseTestCase
         pass
 
     def test_threads_terminate(self):
-        self.executor.submit(mul, 21, 2)
-        self.executor.submit(mul, 6, 7)
-        self.executor.submit(mul, 3, 14)
+        def acquire_lock(lock):
+            lock.acquire()
+
+        sem = threading.Semaphore(0)
+        for i in range(3):
+            self.executor.submit(acquire_lock, sem)
         self.assertEqual(len(self.executor._threads), 3)
+        for i in range(3):
+            sem.release()
         self.executor.shutdown()
         for t in self.executor._threads:
             t.join()
@@ -674,6 +679,64 @@ class ExecutorTest:
         self.assertEqual(i.__next__(), (0, 1))
         self.assertRaises(ZeroDivisionError, i.__next__)
 
+    def test_map_buffersize_type_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    "buffersize must be an integer or None",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize_value_validation(self):
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    r"buffersize must be None or > 0",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+
+    def test_map_buffersize_on_multiple_iterables(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(mul, ints, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), [0, 1, 4, 9])
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(next(res, None), "0")
+        self.assertEqual(next(res, None), "1")
+        self.assertEqual(next(res, None), "2")
+
+    def test_map_buffersize_on_empty_iterable(self):
+        res = self.executor.map(str, [], buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_without_iteration(self):
+        it = iter(range(10))
+        self.executor.map(str, it, buffersize=2)
+        self.assertEqual(next(it), 2)
+
+    def test_map_buffersize_when_buffer_is_full(self):
+        ints = iter(range(4))
+        buffersize = 2
+        self.executor.map(str, ints, buffersize=buffersize)
+        self.executor.shutdown(wait=True)  # wait for tasks to complete
+        self.assertEqual(
+            next(ints),
+            buffersize,
+            msg="should have fetched only `buffersize` elements from `ints`.",
+        )
+
     def test_map_timeout(self):
         results = []
         try:
@@ -743,6 +806,37 @@ class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, BaseTestCase):
         self.assertEqual(executor._max_workers,
                          (os.cpu_count() or 1) * 5)
 
+    def test_idle_thread_reuse(self):
+        executor = self.executor_type()
+        executor.submit(mul, 21, 2).result()
+        executor.submit(mul, 6, 7).result()
+        executor.submit(mul, 3, 14).result()
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown(wait=True)
+
+    def test_idle_timeout_validation(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(idle_timeout=0)
+        with self.assertRaises(ValueError):
+            self.executor_type(idle_timeout=-1)
+
+    def test_idle_timeout(self):
+        executor = self.executor_type(max_workers=3, idle_timeout=0.1)
+        sem = threading.Semaphore(0)
+        fs = [executor.submit(sem.acquire) for _ in range(3)]
+        self.assertEqual(len(executor._threads), 3)
+        threads = list(executor._threads)
+        for _ in range(3):
+            sem.release()
+        futures.wait(fs)
+        for t in threads:
+            t.join()
+        self.assertEqual(len(executor._threads), 0)
+        # The executor spawns new threads as needed once idle ones retired.
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown(wait=True)
+
 
 class ProcessPoolExecutorTest(ExecutorTest):
     def test_killed_child(self):
@@ -757,6 +851,17 @@ class ProcessPoolExecutorTest(ExecutorTest):
         # Submitting other jobs fails as well.
         self.assertRaises(BrokenProcessPool, self.executor.submit, pow, 2, 8)
 
+    def test_shutdown_with_cancelled_futures(self):
+        # Shutdown used to hang when only cancelled futures were left
+        # pending, as happens when a map() result iterator is abandoned.
+        fs = [self.executor.submit(time.sleep, 0.1)
+              for _ in range(self.worker_count * 4)]
+        for f in fs:
+            f.cancel()
+        self.executor.shutdown(wait=True)
+        for f in fs:
+            self.assertTrue(f.done())
+
     def test_map_chunksize(self):
         def bad_map():
             list(self.executor.map(pow, range(40), range(40), chunksize=-1))
@@ -331,6 +331,85 @@ class Test_Csv(unittest.TestCase):
         self.assertRaises(StopIteration, next, r)
         self.assertEqual(r.line_num, 3)
 
+    def test_readrows(self):
+        lines = ['a,b\r\n', '"c\r\n', 'd",e\r\n', '\r\n', 'f\r\n']
+        r = csv.reader(lines)
+        self.assertEqual(r.readrows(0), [])
+        self.assertEqual(r.readrows(2), [['a', 'b'], ['c\r\nd', 'e']])
+        self.assertEqual(r.line_num, 3)
+        self.assertEqual(r.readrows(5), [[], ['f']])
+        self.assertEqual(r.readrows(5), [])
+        self.assertEqual(csv.reader(lines).readrows(), list(csv.reader(lines)))
+        self.assertEqual(csv.reader(lines).readrows(None),
+                         list(csv.reader(lines)))
+        self.assertRaises(TypeError, csv.reader(lines).readrows, 'x')
+        r = csv.reader(['a,b\r\n', '"c'], strict=True)
+        self.assertRaises(csv.Error, r.readrows)
+
+    def test_read_converters(self):
+        lines = ['1,2.5,x,y\r\n', '-12,1e3,"z",w\r\n']
+        r = csv.reader(lines, converters=[int, float, None])
+        self.assertEqual(r.converters, (int, float, None))
+        self.assertEqual(r.readrows(), [[1, 2.5, 'x', 'y'],
+                                        [-12, 1000.0, 'z', 'w']])
+        r = csv.reader(lines, converters=[str.upper, None, str.upper, len])
+        self.assertEqual(list(r), [['1', '2.5', 'X', 1],
+                                   ['-12', '1e3', 'Z', 1]])
+        # The keyword arguments are still dialect settings.
+        r = csv.reader(['1;2'], delimiter=';', converters=(None, int))
+        self.assertEqual(next(r), ['1', 2])
+        r = csv.reader(['1,2'])
+        self.assertIsNone(r.converters)
+        r.converters = [int]
+        self.assertEqual(next(r), [1, '2'])
+        r.converters = None
+        self.assertIsNone(r.converters)
+
+    def test_read_converters_int_float(self):
+        def check(converter, fields):
+            r = csv.reader([','.join(fields)],
+                           converters=[converter] * len(fields))
+            row = next(r)
+            # repr() makes NaNs compare equal.
+            self.assertEqual(repr(row), repr([converter(x) for x in fields]))
+            for value in row:
+                self.assertIs(type(value), converter)
+        check(int, ['0', '-0', '+7', '007', '123456789012345678',
+                    '-123456789012345678', '1234567890123456789012345',
+                    ' 12 ', '1_000', '\u0661\u0662'])
+        check(float, ['0', '-0.0', '+.5', '1e-7', '1e500', '-inf', 'nan',
+                      'Infinity', ' 1.5 ', '1_0.5', '\u0661.5', '1' * 100])
+        for converter in int, float:
+            for field in '', '-', 'x', '1x', '1.5.', '\u20ac':
+                with self.subTest(converter=converter, field=field):
+                    r = csv.reader(['"%s"' % field], converters=[converter])
+                    self.assertRaises(ValueError, next, r)
+
+    def test_read_converters_nonnumeric(self):
+        r = csv.reader(['1,"2",3,"4"'], quoting=csv.QUOTE_NONNUMERIC,
+                       converters=[None, int, int])
+        self.assertEqual(next(r), [1.0, 2, 3, '4'])
+
+    def test_read_converters_errors(self):
+        self.assertRaises(TypeError, csv.reader, [], converters=1)
+        self.assertRaises(TypeError, csv.reader, [], converters=[int, 1])
+        r = csv.reader([])
+        with self.assertRaises(TypeError):
+            r.converters = ['x']
+        self.assertIsNone(r.converters)
+        def fail(field):
+            raise KeyError(field)
+        r = csv.reader(['a,b', 'c,d'], converters=[None, fail])
+        self.assertRaises(KeyError, next, r)
+        r.converters = None
+        self.assertEqual(next(r), ['c', 'd'])
+        # A converter using its own reader.
+        def reenter(field):
+            r.converters = None
+            return next(r)
+        r = csv.reader(['a,b', 'c,d', 'e,f'], converters=[reenter])
+        self.assertRaises(csv.Error, next, r)
+
     def test_roundtrip_quoteed_newlines(self):
         with TemporaryFile("w+", newline='') as fileobj:
             writer = csv.writer(fileobj)
@@ -741,6 +820,65 @@ class TestDictFields(unittest.TestCase):
                                              "4": 'DEFAULT', "5": 'DEFAULT',
                                              "6": 'DEFAULT'})
 
+    def test_read_dict_readrows(self):
+        lines = ['f1,f2\r\n', '1,2\r\n', '\r\n', '3\r\n', '4,5,6\r\n']
+        reader = csv.DictReader(lines, restval='-')
+        self.assertEqual(reader.readrows(2), [{'f1': '1', 'f2': '2'},
+                                              {'f1': '3', 'f2': '-'}])
+        self.assertEqual(reader.line_num, 4)
+        self.assertEqual(reader.readrows(), [{'f1': '4', 'f2': '5',
+                                              None: ['6']}])
+        self.assertEqual(reader.readrows(), [])
+        self.assertEqual(csv.DictReader([]).readrows(), [])
+        rows = csv.DictReader(lines).readrows()
+        self.assertIsInstance(rows[0], OrderedDict)
+        self.assertEqual(rows, list(csv.DictReader(lines)))
+
+    def test_read_dict_converters(self):
+        lines = ['id,name,price\r\n', '1,apple,1.5\r\n', '2,pear,2\r\n']
+        expected = [{'id': 1, 'name': 'apple', 'price': 1.5},
+                    {'id': 2, 'name': 'pear', 'price': 2.0}]
+        reader = csv.DictReader(lines, converters={'id': int, 'price': float})
+        self.assertEqual(list(reader), expected)
+        reader = csv.DictReader(lines, converters=[int, None, float])
+        self.assertEqual(reader.readrows(), expected)
+        reader = csv.DictReader(lines[1:], fieldnames=['id', 'name', 'price'],
+                                converters={'id': int, 'price': float})
+        self.assertEqual(next(reader), expected[0])
+
+    def test_read_dict_line_num(self):
+        reader = csv.DictReader(['f1,f2\r\n', '1,"2\r\n', '3"\r\n'])
+        self.assertEqual(reader.line_num, 0)
+        self.assertEqual(reader.fieldnames, ['f1', 'f2'])
+        self.assertEqual(reader.line_num, 1)
+        next(reader)
+        self.assertEqual(reader.line_num, 3)
+
+    def test_read_dict_subclass(self):
+        class UpperDictReader(csv.DictReader):
+            def __next__(self):
+                return {k.upper(): v for k, v in super().__next__().items()}
+        reader = UpperDictReader(['f1,f2\r\n', '1,2\r\n'])
+        self.assertEqual(list(reader), [{'F1': '1', 'F2': '2'}])
+
+        class CountingDictReader(csv.DictReader):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.line_num = 0
+        reader = CountingDictReader(['f1,f2\r\n', '1,2\r\n', '3,4\r\n'])
+        self.assertIs(iter(reader), reader)
+        next(reader)
+        self.assertEqual(reader.line_num, 2)
+        self.assertEqual(list(reader), [{'f1': '3', 'f2': '4'}])
+        self.assertEqual(reader.line_num, 3)
+
+    def test_read_dict_set_fieldnames(self):
+        reader = csv.DictReader(['1,2\r\n', '3,4\r\n'],
+                                fieldnames=['a', 'b'])
+        self.assertEqual(next(reader), {'a': '1', 'b': '2'})
+        reader.fieldnames = ['c', 'd']
+        self.assertEqual(next(reader), {'c': '3', 'd': '4'})
+
     def test_read_multi(self):
         sample = [
             '2147483648,43.0e12,17,abc,def\r\n',
@@ -14,7 +14,7 @@ from functools import partial
 _fname = support.TESTFN
 
 def _delete_files():
-    for ext in [".dir", ".dat", ".bak"]:
+    for ext in [".dir", ".dat", ".bak", ".dat.tmp", ".dir.tmp"]:
         try:
             os.unlink(_fname + ext)
         except OSError:
@@ -201,6 +201,126 @@ class DumbDBMTestCase(unittest.TestCase):
             self.assertEqual(expected, got)
             f.close()
 
+    def dir_lines(self):
+        with io.open(_fname + '.dir', 'r', encoding='Latin-1') as file:
+            return file.readlines()
+
+    def test_index_log(self):
+        with dumbdbm.open(_fname, 'n') as f:
+            f[b'a'] = b'1'
+            f[b'b'] = b'2'
+            f[b'a'] = b'3'
+            del f[b'b']
+            # Updates and deletions are appended to the directory file.
+            self.assertEqual(len(self.dir_lines()), 4)
+            with dumbdbm.open(_fname, 'r') as g:
+                self.assertEqual(dict(g.items()), {b'a': b'3'})
+        # Deletions are compacted away when the database is closed.
+        self.assertEqual(self.dir_lines(), ["'a', (0, 1)\n"])
+        with dumbdbm.open(_fname, 'r') as f:
+            self.assertEqual(dict(f.items()), {b'a': b'3'})
+
+    def test_index_log_compaction(self):
+        with dumbdbm.open(_fname, 'n') as f:
+            for i in range(1000):
+                f[b'k%d' % (i % 10)] = b'%d' % i
+                self.assertLessEqual(len(self.dir_lines()),
+                                     2 * len(f) + 101)
+            for i in range(10):
+                self.assertEqual(f[b'k%d' % i], b'%d' % (990 + i))
+
+    def test_batch(self):
+        with dumbdbm.open(_fname, 'n') as f:
+            f[b'x'] = b'old'
+            with f.batch() as g:
+                self.assertIs(g, f)
+                for k in self._dict:
+                    f[k] = self._dict[k]
+                with f.batch():
+                    f[b'x'] = b'new' * 1000
+                self.assertEqual(f[b'x'], b'new' * 1000)
+                del f[b'x']
+                self.read_helper(f)
+                # The directory file isn't written until the end of the batch.
+                self.assertEqual(len(self.dir_lines()), 1)
+            self.assertEqual(len(self.dir_lines()), len(self._dict) + 3)
+        with dumbdbm.open(_fname, 'r') as f:
+            self.read_helper(f)
+
+    def test_batch_close(self):
+        f = dumbdbm.open(_fname, 'n')
+        with f.batch():
+            for k in self._dict:
+                f[k] = self._dict[k]
+            f.close()
+        with dumbdbm.open(_fname, 'r') as f:
+            self.read_helper(f)
+
+    def test_reorganize(self):
+        with dumbdbm.open(_fname, 'n') as f:
+            for k in self._dict:
+                f[k] = self._dict[k] * 1000
+            for k in self._dict:
+                f[k] = self._dict[k]
+            f[b'big'] = b'x' * 10000
+            del f[b'big']
+            size = os.path.getsize(_fname + '.dat')
+            f.reorganize()
+            self.assertLess(os.path.getsize(_fname + '.dat'), size // 10)
+            self.assertEqual(len(self.dir_lines()), len(self._dict))
+            self.read_helper(f)
+            with f.batch():
+                self.assertRaises(dumbdbm.error, f.reorganize)
+        with dumbdbm.open(_fname, 'r') as f:
+            self.read_helper(f)
+            self.assertRaises(ValueError, f.reorganize)
+
+    def interrupted_reorganize(self, calls, exc):
+        # Make the os.replace() call number `calls` of reorganize() raise exc.
+        real_replace = os.replace
+        def replace(*args):
+            nonlocal calls
+            calls -= 1
+            if not calls:
+                raise exc
+            return real_replace(*args)
+        f = dumbdbm.open(_fname, 'n')
+        # Deleting the first value moves all the others.
+        f[b'big'] = b'x' * 10000
+        for k in self._dict:
+            f[k] = self._dict[k]
+        del f[b'big']
+        with support.swap_attr(os, 'replace', replace):
+            self.assertRaises(type(exc), f.reorganize)
+        return f
+
+    def test_reorganize_crash(self):
+        for calls in 1, 2:
+            with self.subTest(calls=calls):
+                f = self.interrupted_reorganize(calls, KeyboardInterrupt())
+                # Simulate a crash: the database is not closed.
+                f._index = None
+                for flag in 'r', 'w':
+                    with dumbdbm.open(_fname, flag) as f:
+                        self.read_helper(f)
+                self.assertFalse(os.path.exists(_fname + '.dat.tmp'))
+                self.assertFalse(os.path.exists(_fname + '.dir.tmp'))
+
+    def test_reorganize_failure(self):
+        for calls in 1, 2:
+            with self.subTest(calls=calls):
+                f = self.interrupted_reorganize(calls, OSError())
+                f[b'new'] = b'value'
+                self.read_helper_extra(f)
+                f.close()
+                with dumbdbm.open(_fname, 'r') as f:
+                    self.read_helper_extra(f)
+
+    def read_helper_extra(self, f):
+        self.assertEqual(f[b'new'], b'value')
+        for key in self._dict:
+            self.assertEqual(self._dict[key], f[key])
+
     def test_context_manager(self):
         with dumbdbm.open(_fname, 'c') as db:
             db["dumbdbm context manager"] = "context manager"
@@ -10,6 +10,7 @@ import io
 import struct
 import array
 gzip = support.import_module('gzip')
+zlib = support.import_module('zlib')
 
 data1 = b"""  int length=DEFAULTALLOC, err = Z_OK;
   PyObject *RetVal;
@@ -523,6 +524,66 @@ class TestGzip(BaseTest):
         with gzip.GzipFile(fileobj=io.BytesIO(gzdata)) as f:
             self.assertEqual(f.read(), b'Test')
 
+    def test_write_threads(self):
+        data = (data1 + data2) * 200
+        with support.swap_attr(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            for size in (1, 100, 1000, 3000, len(data)):
+                with self.subTest(size=size):
+                    with gzip.GzipFile(self.filename, 'wb', threads=3) as f:
+                        for i in range(0, len(data), size):
+                            f.write(data[i:i+size])
+                        self.assertEqual(f.tell(), len(data))
+                    with open(self.filename, 'rb') as f:
+                        compressed = f.read()
+                    # The output is a single gzip member.
+                    self.assertEqual(zlib.decompress(compressed, 31), data)
+                    self.assertEqual(gzip.decompress(compressed), data)
+
+    def test_write_threads_empty(self):
+        with gzip.GzipFile(self.filename, 'wb', threads=2):
+            pass
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), b'')
+
+    def test_write_threads_flush(self):
+        with support.swap_attr(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode='wb', threads=2) as f:
+                f.write(data1)
+                f.flush()
+                d = zlib.decompressobj(31)
+                self.assertEqual(d.decompress(buf.getvalue()), data1)
+                f.write(data2 * 100)
+            self.assertEqual(gzip.decompress(buf.getvalue()),
+                             data1 + data2 * 100)
+
+    def test_write_threads_full_flush(self):
+        with support.swap_attr(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            buf = io.BytesIO()
+            with gzip.GzipFile(fileobj=buf, mode='wb', threads=2) as f:
+                f.write(data1 * 10)
+                f.flush(zlib.Z_FULL_FLUSH)
+                pos = buf.tell()
+                # The data after a full flush does not refer to the data
+                # before it, even if it repeats it.
+                f.write(data1 * 10)
+                self.assertRaises(ValueError, f.flush, zlib.Z_FINISH)
+                self.assertRaises(ValueError, f.flush, zlib.Z_PARTIAL_FLUSH)
+            d = zlib.decompressobj(-zlib.MAX_WBITS)
+            self.assertEqual(d.decompress(buf.getvalue()[pos:]), data1 * 10)
+            self.assertTrue(d.eof)
+            self.assertEqual(gzip.decompress(buf.getvalue()), data1 * 20)
+
+    def test_threads_bad_args(self):
+        self.assertRaises(ValueError, gzip.GzipFile, self.filename, 'wb',
+                          threads=0)
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.write(data1)
+        self.assertRaises(ValueError, gzip.GzipFile, self.filename, 'rb',
+                          threads=2)
+        with gzip.GzipFile(self.filename, 'rb', threads=1) as f:
+            self.assertEqual(f.read(), data1)
+
     def test_prepend_error(self):
         # See issue #20875
         with gzip.open(self.filename, "wb") as f:
@@ -1,9 +1,13 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
+import tempfile
+import threading
 import types
 import unittest
+from test import support
 
 from . import util as test_util
 
@@ -140,6 +144,158 @@ class LazyLoaderTests(unittest.TestCase):
             # Force the load; just care that no exception is raised.
             module.__name__
 
+    def test_spec_does_not_load(self):
+        # The import system looks up __spec__ when a module is imported
+        # again.
+        importer = TestingImporter()
+        with test_util.uncache(importer.module_name):
+            with test_util.import_state(meta_path=[importer]):
+                module = importlib.import_module(importer.module_name)
+                self.assertIs(module.__spec__.loader, importer)
+                self.assertIs(importlib.import_module(importer.module_name),
+                              module)
+        self.assertIsNone(importer.loaded)
+        self.assertEqual(module.attr, 42)
+
+    def test_concurrent_load(self):
+        # Only one thread executes the module, the others wait for it.
+        module = self.new_module('import time; time.sleep(0.1); attr = 42')
+        loader = module.__spec__.loader
+        calls = []
+        def exec_module(module):
+            calls.append(module)
+            TestingImporter.exec_module(loader, module)
+        loader.exec_module = exec_module
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(module.attr))
+                   for i in range(5)]
+        with support.start_threads(threads):
+            pass
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(calls, [module])
+
+    def test_reentrant_access(self):
+        # Accesses made while executing the module do not load it again.
+        module = self.new_module('import sys; '
+                                 'attr = sys.modules["lazy_loader_test"].early')
+        with test_util.uncache(TestingImporter.module_name):
+            sys.modules[TestingImporter.module_name] = module
+            module.early = 42
+            self.assertEqual(module.attr, 42)
+
+
+class LazyImportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        os.mkdir(os.path.join(self.directory, 'lazy_pkg'))
+        for name in ('lazy_mod', 'lazy_other', 'lazy_pkg/__init__',
+                     'lazy_pkg/sub', 'lazy_pkg/eager'):
+            with open(os.path.join(self.directory, name + '.py'), 'w') as f:
+                f.write('attr = {!r}\n'.format(name))
+        names = ('lazy_mod', 'lazy_other', 'lazy_pkg', 'lazy_pkg.sub',
+                 'lazy_pkg.eager')
+        for manager in (test_util.uncache(*names),
+                        support.DirsOnSysPath(self.directory),
+                        support.swap_attr(sys, 'meta_path', sys.meta_path[:])):
+            manager.__enter__()
+            self.addCleanup(manager.__exit__, None, None, None)
+        importlib.invalidate_caches()
+
+    def assertLazy(self, name):
+        self.assertIs(type(sys.modules[name]), util._LazyModule)
+
+    def assertLoaded(self, name):
+        self.assertIs(type(sys.modules[name]), types.ModuleType)
+
+    def test_all_modules(self):
+        util.enable_lazy_imports()
+        import lazy_mod
+        self.assertLazy('lazy_mod')
+        import lazy_mod
+        self.assertLazy('lazy_mod')
+        self.assertEqual(lazy_mod.attr, 'lazy_mod')
+        self.assertLoaded('lazy_mod')
+        # Built-in and extension modules are always imported eagerly.
+        with test_util.uncache('array'):
+            import array
+            self.assertLoaded('array')
+
+    def test_packages(self):
+        util.enable_lazy_imports('lazy_pkg', exclude=['lazy_pkg.eager'])
+        import lazy_mod, lazy_pkg
+        self.assertLoaded('lazy_mod')
+        self.assertLazy('lazy_pkg')
+        import lazy_pkg.sub, lazy_pkg.eager
+        # Importing a submodule requires the package to be executed.
+        self.assertLoaded('lazy_pkg')
+        self.assertLazy('lazy_pkg.sub')
+        self.assertLoaded('lazy_pkg.eager')
+        self.assertEqual(lazy_pkg.sub.attr, 'lazy_pkg/sub')
+        util.enable_lazy_imports('lazy_other')
+        import lazy_other
+        self.assertLazy('lazy_other')
+
+    def test_from_import(self):
+        util.enable_lazy_imports()
+        from lazy_mod import attr
+        self.assertEqual(attr, 'lazy_mod')
+        from lazy_pkg import sub
+        self.assertLazy('lazy_pkg.sub')
+        self.assertEqual(sub.attr, 'lazy_pkg/sub')
+        from lazy_pkg.sub import attr
+        self.assertEqual(attr, 'lazy_pkg/sub')
+
+    def test_concurrent_circular_loads(self):
+        # Two threads loading modules which access each other while they are
+        # executing see the partially initialized module instead of
+        # deadlocking, like with eager imports.
+        for name, other, attr, other_attr in (('lazy_a', 'lazy_b', 'A', 'B'),
+                                              ('lazy_b', 'lazy_a', 'B', 'A')):
+            with open(os.path.join(self.directory, name + '.py'), 'w') as f:
+                f.write('import {0}, lazy_barrier\n'
+                        '{1} = {1!r}\n'
+                        'lazy_barrier.barrier.wait()\n'
+                        'other = {0}.{2}\n'.format(other, attr, other_attr))
+        barrier = types.ModuleType('lazy_barrier')
+        barrier.barrier = threading.Barrier(2, timeout=30)
+        with test_util.uncache('lazy_a', 'lazy_b', 'lazy_barrier'):
+            sys.modules['lazy_barrier'] = barrier
+            util.enable_lazy_imports('lazy_a', 'lazy_b')
+            import lazy_a, lazy_b
+            results = {}
+            def load(module):
+                results[module.__name__] = module.other
+            threads = [threading.Thread(target=load, args=(module,),
+                                        daemon=True)
+                       for module in (lazy_a, lazy_b)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(60)
+                self.assertFalse(thread.is_alive(), 'deadlock')
+        self.assertEqual(results, {'lazy_a': 'B', 'lazy_b': 'A'})
+
+    def test_disable(self):
+        util.enable_lazy_imports()
+        util.enable_lazy_imports()
+        import lazy_mod
+        util.disable_lazy_imports()
+        self.assertFalse(any(isinstance(finder, util._LazyImportFinder)
+                             for finder in sys.meta_path))
+        import lazy_other
+        self.assertLazy('lazy_mod')
+        self.assertLoaded('lazy_other')
+        util.disable_lazy_imports()
+
+    def test_reload(self):
+        util.enable_lazy_imports()
+        import lazy_mod
+        self.assertEqual(lazy_mod.attr, 'lazy_mod')
+        importlib.reload(lazy_mod)
+        self.assertLoaded('lazy_mod')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,12 +5,15 @@ machinery = util.import_importlib('importlib.machinery')
 importlib_util = util.import_importlib('importlib.util')
 
 import contextlib
+import importlib.machinery
 import importlib.util
 import os
 import pathlib
 import string
 import sys
 from test import support
+from test.support import script_helper
+import tempfile
 import types
 import unittest
 import unittest.mock
@@ -837,6 +840,245 @@ class PEP3147Tests:
  ) = util.test_both(PEP3147Tests, util=importlib_util)
 
 
+class ImportCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.cache = os.path.join(tempfile.mkdtemp(), 'import.cache')
+        self.addCleanup(support.rmtree, os.path.dirname(self.cache))
+        self.pkg_dir = os.path.join(self.directory, 'ic_pkg')
+        os.mkdir(self.pkg_dir)
+        self.files = {
+            'ic_mod': os.path.join(self.directory, 'ic_mod.py'),
+            'ic_pkg': os.path.join(self.pkg_dir, '__init__.py'),
+            'ic_pkg.sub': os.path.join(self.pkg_dir, 'sub.py'),
+            'ic_other': os.path.join(self.directory, 'ic_other.py'),
+        }
+        for name, filename in self.files.items():
+            with open(filename, 'w') as file:
+                file.write('value = {!r}\n'.format(name))
+        path = support.swap_attr(sys, 'path', [self.directory])
+        path.__enter__()
+        self.addCleanup(path.__exit__, None, None, None)
+        self.addCleanup(support.forget, 'ic_mod')
+        self.addCleanup(support.forget, 'ic_pkg.sub')
+        self.addCleanup(support.forget, 'ic_pkg')
+        importlib.invalidate_caches()
+
+    def write_cache(self):
+        count = importlib.util.write_import_cache(
+            self.cache, ['ic_mod', 'ic_pkg', 'ic_pkg.sub', 'os'])
+        self.assertEqual(count, 3)
+        return importlib.machinery.ImportCacheFinder(self.cache)
+
+    def load(self, spec):
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_find_spec(self):
+        finder = self.write_cache()
+        for name, filename in self.files.items():
+            # The cache holds the code, not the source.
+            st = os.stat(filename)
+            with open(filename, 'w') as file:
+                file.write('value = {!r}\n'.format(name.upper()))
+            os.utime(filename, ns=(st.st_atime_ns, st.st_mtime_ns))
+        spec = finder.find_spec('ic_mod')
+        self.assertEqual(spec.origin, self.files['ic_mod'])
+        self.assertIsNone(spec.submodule_search_locations)
+        self.assertIsInstance(spec.loader, importlib.machinery.SourceFileLoader)
+        self.assertEqual(self.load(spec).value, 'ic_mod')
+        spec = finder.find_spec('ic_pkg')
+        self.assertEqual(spec.origin, self.files['ic_pkg'])
+        self.assertEqual(spec.submodule_search_locations, [self.pkg_dir])
+        self.assertEqual(self.load(spec).value, 'ic_pkg')
+        spec = finder.find_spec('ic_pkg.sub', [self.pkg_dir])
+        self.assertEqual(spec.origin, self.files['ic_pkg.sub'])
+        self.assertEqual(self.load(spec).value, 'ic_pkg.sub')
+        # Not found in the package directory.
+        self.assertIsNone(finder.find_spec('ic_pkg.sub'))
+
+    def test_not_recorded(self):
+        finder = self.write_cache()
+        # Present in the directory, but not in the cache.
+        self.assertIsNone(finder.find_spec('ic_other'))
+        # Unknown path entries.
+        self.assertIsNone(finder.find_spec('ic_mod', [self.pkg_dir + 'x']))
+        self.assertIsNone(finder.find_spec('ic_mod', [b'ic_mod']))
+        self.assertIsNone(finder.find_spec('missing'))
+        # Missing from the first directory, found in the second one.
+        spec = finder.find_spec('ic_mod', [self.pkg_dir, self.directory])
+        self.assertEqual(spec.origin, self.files['ic_mod'])
+
+    def test_changed_source(self):
+        finder = self.write_cache()
+        mtime = os.stat(self.files['ic_mod']).st_mtime
+        with open(self.files['ic_mod'], 'w') as file:
+            file.write('value = 2\n')
+        os.utime(self.files['ic_mod'], (mtime + 10, mtime + 10))
+        self.assertIsNone(finder.find_spec('ic_mod'))
+        # Only the size differs.
+        with open(self.files['ic_pkg'], 'a') as file:
+            file.write('\n')
+        os.utime(self.files['ic_pkg'], (mtime, mtime))
+        self.assertIsNone(finder.find_spec('ic_pkg'))
+        self.assertIsNotNone(finder.find_spec('ic_pkg.sub', [self.pkg_dir]))
+        # The files are checked once, until the caches are invalidated.
+        os.utime(self.files['ic_pkg.sub'], (mtime + 10, mtime + 10))
+        self.assertIsNotNone(finder.find_spec('ic_pkg.sub', [self.pkg_dir]))
+        finder.invalidate_caches()
+        self.assertIsNone(finder.find_spec('ic_pkg.sub', [self.pkg_dir]))
+
+    def test_invalidate_caches(self):
+        finder = self.write_cache()
+        mtime = os.stat(self.directory).st_mtime
+        os.utime(self.directory, (mtime + 10, mtime + 10))
+        self.assertIsNotNone(finder.find_spec('ic_mod'))
+        finder.invalidate_caches()
+        self.assertIsNone(finder.find_spec('ic_mod'))
+        self.assertIsNotNone(finder.find_spec('ic_pkg.sub', [self.pkg_dir]))
+        os.utime(self.directory, (mtime, mtime))
+        finder.invalidate_caches()
+        self.assertIsNotNone(finder.find_spec('ic_mod'))
+
+    def test_bad_cache(self):
+        self.write_cache()
+        with open(self.cache, 'rb') as file:
+            data = file.read()
+        for bad in b'', data[:12], b'PYIC\0\0\0\0' + data[8:], data[:20]:
+            with open(self.cache, 'wb') as file:
+                file.write(bad)
+            with self.assertRaises(ImportError):
+                importlib.machinery.ImportCacheFinder(self.cache)
+        os.remove(self.cache)
+        with self.assertRaises(OSError):
+            importlib.machinery.ImportCacheFinder(self.cache)
+
+    def test_environment_variable(self):
+        code = ('import ic_mod, ic_pkg.sub; '
+                'print(type(ic_mod.__loader__).__name__, '
+                'type(ic_pkg.sub.__loader__).__name__)')
+        script_helper.assert_python_ok(
+            '-c', 'import ic_mod, ic_pkg.sub, importlib.util; '
+                  'importlib.util.write_import_cache({!r})'.format(self.cache),
+            __cwd=self.directory, __isolated=False)
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, __cwd=self.directory, PYTHONIMPORTCACHE=self.cache)
+        self.assertEqual(out.split(),
+                         [b'_CachedSourceFileLoader'] * 2)
+        rc, out, err = script_helper.assert_python_ok(
+            '-E', '-c', code, __cwd=self.directory,
+            PYTHONIMPORTCACHE=self.cache)
+        self.assertEqual(out.split(), [b'SourceFileLoader'] * 2)
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, __cwd=self.directory,
+            PYTHONIMPORTCACHE=self.cache + 'x')
+        self.assertEqual(out.split(), [b'SourceFileLoader'] * 2)
+
+
+class PathCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(support.rmtree, self.directory)
+        self.cache = os.path.join(tempfile.mkdtemp(), 'path.cache')
+        self.addCleanup(support.rmtree, os.path.dirname(self.cache))
+        for manager in (
+                support.DirsOnSysPath(self.directory),
+                support.swap_attr(sys, 'path_importer_cache', {}),
+                support.swap_attr(importlib._bootstrap_external,
+                                  '_path_cache', None)):
+            manager.__enter__()
+            self.addCleanup(manager.__exit__, None, None, None)
+        self.create('pc_first')
+
+    def create(self, name):
+        self.addCleanup(support.forget, name)
+        with open(os.path.join(self.directory, name + '.py'), 'w') as file:
+            file.write('value = {!r}\n'.format(name))
+        # Make sure that the directory modification time changes.
+        mtime = os.stat(self.directory).st_mtime + 10
+        os.utime(self.directory, (mtime, mtime))
+
+    def assertImportable(self, name):
+        self.assertEqual(importlib.import_module(name).value, name)
+
+    def test_invalidation(self):
+        importlib.util.enable_path_cache()
+        self.assertImportable('pc_first')
+        self.create('pc_second')
+        # The directory listing is used until the caches are invalidated.
+        with self.assertRaises(ModuleNotFoundError):
+            importlib.import_module('pc_second')
+        self.assertIn(('pc_second', tuple(sys.path)),
+                      importlib._bootstrap_external._path_cache.missing)
+        importlib.invalidate_caches()
+        self.assertImportable('pc_second')
+        self.assertFalse(importlib._bootstrap_external._path_cache.missing)
+
+    def test_disable(self):
+        importlib.util.enable_path_cache()
+        self.assertImportable('pc_first')
+        importlib.util.disable_path_cache()
+        self.assertIsNone(importlib._bootstrap_external._path_cache)
+        self.create('pc_second')
+        self.assertImportable('pc_second')
+
+    def test_save(self):
+        self.assertImportable('pc_first')
+        self.assertGreaterEqual(importlib.util.save_path_cache(self.cache), 1)
+        st = os.stat(self.directory)
+        self.create('pc_second')
+        os.utime(self.directory, ns=(st.st_atime_ns, st.st_mtime_ns))
+        importlib.util.enable_path_cache(self.cache)
+        # The saved listing is used while the directory is unchanged.
+        with self.assertRaises(ModuleNotFoundError):
+            importlib.import_module('pc_second')
+        importlib.invalidate_caches()
+        self.assertImportable('pc_second')
+        self.assertGreaterEqual(importlib.util.save_path_cache(self.cache), 1)
+        support.forget('pc_second')
+        importlib.util.enable_path_cache(self.cache)
+        self.assertImportable('pc_second')
+
+    def test_save_outdated(self):
+        self.assertImportable('pc_first')
+        importlib.util.save_path_cache(self.cache)
+        self.create('pc_second')
+        importlib.util.enable_path_cache(self.cache)
+        # The modification time of a saved listing is checked once.
+        self.assertImportable('pc_second')
+        self.create('pc_third')
+        with self.assertRaises(ModuleNotFoundError):
+            importlib.import_module('pc_third')
+
+    def test_bad_file(self):
+        with self.assertRaises(OSError):
+            importlib.util.enable_path_cache(self.cache)
+        for data in b'', b'PYPC', b'PYIC\0\0\0\0':
+            with open(self.cache, 'wb') as file:
+                file.write(data)
+            with self.assertRaises(ImportError):
+                importlib.util.enable_path_cache(self.cache)
+        self.assertIsNone(importlib._bootstrap_external._path_cache)
+
+    def test_environment_variable(self):
+        code = ('import _frozen_importlib_external as b; '
+                'print(b._path_cache is not None, '
+                '{!r} in b._path_cache.listings)'.format(self.directory))
+        self.assertImportable('pc_first')
+        importlib.util.save_path_cache(self.cache)
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, PYTHONPATHCACHE=self.cache)
+        self.assertEqual(out.split(), [b'True', b'True'])
+        # The cache is enabled even if the file cannot be read.
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, PYTHONPATHCACHE=self.cache + 'x')
+        self.assertEqual(out.split(), [b'True', b'False'])
+
+
 class MagicNumberTests(unittest.TestCase):
     """
     Test release compatibility issues relating to importlib
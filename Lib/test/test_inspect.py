@@ -2835,15 +2835,18 @@ class TestSignatureObject(unittest.TestCase):
                      "Signature information for builtins requires docstrings")
     def test_signature_on_builtin_class(self):
         self.assertEqual(str(inspect.signature(_pickle.Pickler)),
-                         '(file, protocol=None, fix_imports=True)')
+                         '(file, protocol=None, fix_imports=True, '
+                         'buffer_callback=None)')
 
         class P(_pickle.Pickler): pass
         class EmptyTrait: pass
         class P2(EmptyTrait, P): pass
         self.assertEqual(str(inspect.signature(P)),
-                         '(file, protocol=None, fix_imports=True)')
+                         '(file, protocol=None, fix_imports=True, '
+                         'buffer_callback=None)')
         self.assertEqual(str(inspect.signature(P2)),
-                         '(file, protocol=None, fix_imports=True)')
+                         '(file, protocol=None, fix_imports=True, '
+                         'buffer_callback=None)')
 
         class P3(P2):
             def __init__(self, spam):
@@ -48,6 +48,32 @@ class TestDump:
         self.assertEqual(self.dumps(d, sort_keys=True), '{"1337": "true.dat"}')
 
 
+    def test_dump_chunks(self):
+        data = [{'a': i, 'b': [str(i)] * 3} for i in range(20000)]
+        written = []
+        class Writer:
+            def write(self, chunk):
+                written.append(chunk)
+        self.json.dump(data, Writer(), indent=1)
+        self.assertGreater(len(written), 1)
+        self.assertEqual(''.join(written), self.dumps(data, indent=1))
+
+    def test_dump_error(self):
+        sio = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump([1, 2, object()], sio)
+        with self.assertRaises(ValueError):
+            self.json.dump([float('nan')], sio, allow_nan=False)
+
+    def test_dump_iterencode_override(self):
+        class Encoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                yield 'spam'
+        sio = StringIO()
+        self.json.dump([1], sio, cls=Encoder)
+        self.assertEqual(sio.getvalue(), 'spam')
+
+
 class TestPyDump(TestDump, PyTest): pass
 
 class TestCDump(TestDump, CTest):
@@ -0,0 +1,253 @@
+from io import StringIO, BytesIO
+from test import support
+from test.test_json import PyTest, CTest
+
+
+DOC = ('{"a": [1, 2.5e3, -Infinity, "x\\u00e9\\ud834\\udd1e", true, null, '
+       '{"b": {}}, []], "c": "' + 'z' * 100 + '"}\n12 "s" [] -7 NaN')
+
+EVENTS = [
+    ('start_object', None),
+    ('key', 'a'),
+    ('start_array', None),
+    ('value', 1),
+    ('value', 2.5e3),
+    ('value', float('-inf')),
+    ('value', 'x\xe9\U0001d11e'),
+    ('value', True),
+    ('value', None),
+    ('start_object', None),
+    ('key', 'b'),
+    ('start_object', None),
+    ('end_object', None),
+    ('end_object', None),
+    ('start_array', None),
+    ('end_array', None),
+    ('end_array', None),
+    ('key', 'c'),
+    ('value', 'z' * 100),
+    ('end_object', None),
+    ('value', 12),
+    ('value', 's'),
+    ('start_array', None),
+    ('end_array', None),
+    ('value', -7),
+]
+
+BAD_DOCS = [
+    '[1,]',
+    '{"a" 1}',
+    '[1 2]',
+    '{"a":1,}',
+    '{1: 2}',
+    '[',
+    '{"a": ',
+    '"abc',
+    '"abc\\',
+    '"\\u12',
+    'tru',
+    '-',
+    '\n\n  {"a": "\x01"}',
+]
+
+
+def split(s, size):
+    return [s[i:i + size] for i in range(0, len(s), size)]
+
+
+class TestIncremental:
+    def values(self):
+        decoder = self.json.JSONDecoder()
+        values = []
+        idx = 0
+        while True:
+            idx = self.json.decoder.WHITESPACE.match(DOC, idx).end()
+            if idx == len(DOC):
+                return values
+            value, idx = decoder.raw_decode(DOC, idx)
+            values.append(value)
+
+    def check_events(self, events):
+        events = list(events)
+        # NaN != NaN
+        self.assertEqual(events[-1][0], 'value')
+        self.assertNotEqual(events[-1][1], events[-1][1])
+        self.assertEqual(events[:-1], EVENTS)
+
+    def check_values(self, values):
+        self.assertEqual(repr(list(values)), repr(self.values()))
+
+    def test_iterdecode(self):
+        decoder = self.json.JSONDecoder()
+        for size in (1, 2, 3, 7, 64, len(DOC)):
+            with self.subTest(size=size):
+                self.check_values(decoder.iterdecode(split(DOC, size)))
+        self.check_values(decoder.iterdecode(['', DOC, '']))
+        self.assertEqual(list(decoder.iterdecode([])), [])
+        self.assertEqual(list(decoder.iterdecode([' \n', '\t'])), [])
+
+    def test_iterdecode_numbers(self):
+        decoder = self.json.JSONDecoder()
+        self.assertEqual(list(decoder.iterdecode(['1', '2', '.', '5e', '1'])),
+                         [125.0])
+        self.assertEqual(list(decoder.iterdecode(['-', '12 ', '3'])),
+                         [-12, 3])
+        self.assertEqual(list(decoder.iterdecode(['tr', 'ue', 'null'])),
+                         [True, None])
+
+    def test_iterparse(self):
+        decoder = self.json.JSONDecoder()
+        for size in (1, 2, 3, 7, 64, len(DOC)):
+            with self.subTest(size=size):
+                self.check_events(decoder.iterparse(split(DOC, size)))
+
+    def test_iterparse_deep(self):
+        decoder = self.json.JSONDecoder()
+        depth = 100000
+        doc = '[' * depth + ']' * depth
+        events = list(decoder.iterparse(split(doc, 1000)))
+        self.assertEqual(events, [('start_array', None)] * depth +
+                                 [('end_array', None)] * depth)
+
+    def test_pull_parser(self):
+        for size in (1, 2, 3, 7, 64, len(DOC)):
+            with self.subTest(size=size):
+                parser = self.json.JSONPullParser()
+                events = []
+                for chunk in split(DOC, size):
+                    parser.feed(chunk)
+                    events.extend(parser.read_events())
+                parser.close()
+                events.extend(parser.read_events())
+                self.check_events(events)
+
+    def test_pull_parser_partial(self):
+        parser = self.json.JSONPullParser()
+        parser.feed('[1, "ab')
+        self.assertEqual(list(parser.read_events()),
+                         [('start_array', None), ('value', 1)])
+        parser.feed('c", 2')
+        self.assertEqual(list(parser.read_events()), [('value', 'abc')])
+        parser.feed(']')
+        self.assertEqual(list(parser.read_events()),
+                         [('value', 2), ('end_array', None)])
+        parser.close()
+        self.assertEqual(list(parser.read_events()), [])
+        self.assertRaises(ValueError, parser.feed, '1')
+
+    def test_pull_parser_decoder(self):
+        from decimal import Decimal
+        decoder = self.json.JSONDecoder(parse_float=Decimal)
+        parser = self.json.JSONPullParser(decoder=decoder)
+        parser.feed('[1.1]')
+        parser.close()
+        self.assertEqual(list(parser.read_events()),
+                         [('start_array', None), ('value', Decimal('1.1')),
+                          ('end_array', None)])
+
+    def test_errors(self):
+        decoder = self.json.JSONDecoder()
+        for doc in BAD_DOCS:
+            with self.assertRaises(self.JSONDecodeError) as cm:
+                self.loads(doc)
+            expected = cm.exception
+            for size in (1, 3, len(doc)):
+                with self.subTest(doc=doc, size=size):
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        list(decoder.iterparse(split(doc, size)))
+                    self.assertEqual(str(cm.exception), str(expected))
+                    self.assertEqual(cm.exception.pos, expected.pos)
+                    self.assertEqual(cm.exception.lineno, expected.lineno)
+                    self.assertEqual(cm.exception.colno, expected.colno)
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        list(decoder.iterdecode(split(doc, size)))
+                    self.assertEqual(cm.exception.pos, expected.pos)
+
+        parser = self.json.JSONPullParser()
+        parser.feed('[1, 2')
+        self.assertRaises(self.JSONDecodeError, parser.close)
+        self.assertRaises(self.JSONDecodeError, parser.close)
+
+        # A failed parser keeps failing.
+        parser = self.json.JSONPullParser()
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            parser.feed('[1, 2 3')
+        expected = cm.exception
+        self.assertEqual(list(parser.read_events()),
+                         [('start_array', None), ('value', 1), ('value', 2)])
+        for method, args in (parser.feed, ('4]',)), (parser.close, ()):
+            with self.assertRaises(self.JSONDecodeError) as cm:
+                method(*args)
+            self.assertIs(cm.exception, expected)
+        self.assertEqual(list(parser.read_events()), [])
+
+    def test_invalid_chunk(self):
+        decoder = self.json.JSONDecoder()
+        with self.assertRaises(TypeError):
+            list(decoder.iterdecode([b'[]']))
+        with self.assertRaises(TypeError):
+            list(decoder.iterparse([b'[]']))
+        self.assertRaises(TypeError, self.json.JSONPullParser().feed, b'[]')
+
+    def test_iterload(self):
+        self.check_values(self.json.iterload(StringIO(DOC), chunk_size=5))
+        for encoding in 'utf-8', 'utf-16', 'utf-32-be':
+            with self.subTest(encoding=encoding):
+                fp = BytesIO(DOC.encode(encoding))
+                self.check_values(self.json.iterload(fp, chunk_size=3))
+        self.assertEqual(list(self.json.iterload(StringIO('{"a": 1}'),
+                                                 object_pairs_hook=list)),
+                         [[('a', 1)]])
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(StringIO('\ufeff[]')))
+
+    def test_iterload_large_value(self):
+        # The text of a value split across many chunks is not copied for
+        # each chunk, so that decoding it takes linear time.
+        value = ['x' * 100] * 30000
+        doc = self.dumps(value)
+        buffer_class = self.json.decoder._TextBuffer
+        join = buffer_class.join
+        copied = 0
+        def counting_join(buffer):
+            nonlocal copied
+            copied += len(buffer.buf) - buffer.pos + buffer.pending
+            join(buffer)
+        with support.swap_attr(buffer_class, 'join', counting_join):
+            self.assertEqual(list(self.json.iterload(StringIO(doc),
+                                                     chunk_size=1000)),
+                             [value])
+        self.assertLess(copied, 4 * len(doc))
+
+    def test_iterparse_file(self):
+        self.check_events(self.json.iterparse(StringIO(DOC), chunk_size=5))
+        fp = BytesIO(DOC.encode('utf-16'))
+        self.check_events(self.json.iterparse(fp, chunk_size=3))
+
+    def test_load_lines(self):
+        lines = '{"a": 1}\n\n[2, "\xe9"]\r\n"x"\n'
+        expected = [{'a': 1}, [2, '\xe9'], 'x']
+        self.assertEqual(list(self.json.load_lines(StringIO(lines))),
+                         expected)
+        self.assertEqual(list(self.json.load_lines(lines.splitlines())),
+                         expected)
+        fp = BytesIO(lines.encode('utf-8'))
+        self.assertEqual(list(self.json.load_lines(fp)), expected)
+        self.assertEqual(list(self.json.load_lines(StringIO('{"a": 1}'),
+                                                   object_hook=len)),
+                         [1])
+
+    def test_load_lines_errors(self):
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.load_lines(StringIO('1\n2\n[3,\n')))
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual(cm.exception.colno, 4)
+        self.assertEqual(cm.exception.pos, 7)
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.load_lines(StringIO('1 2\n')))
+        self.assertEqual(cm.exception.msg, 'Extra data')
+
+
+class TestPyIncremental(TestIncremental, PyTest): pass
+class TestCIncremental(TestIncremental, CTest): pass
@@ -62,6 +62,16 @@ class TestIndent:
         # indent=None is more compact
         check(None, '{"3": 1}')
 
+    def test_indent_nested(self):
+        h = {'a': [1, {'b': [], 'c': {}}, [[2]]], 'd': {'e': None}}
+        expected = self.json.encoder.JSONEncoder(indent=3).iterencode(h)
+        expected = ''.join(expected)
+        self.assertEqual(self.dumps(h, indent=3), expected)
+        self.assertEqual(self.loads(expected), h)
+        sio = StringIO()
+        self.json.dump(h, sio, indent=3)
+        self.assertEqual(sio.getvalue(), expected)
+
 
 class TestPyIndent(TestIndent, PyTest): pass
 class TestCIndent(TestIndent, CTest): pass
@@ -22,6 +22,32 @@ class TestDecode(CTest):
     def test_make_scanner(self):
         self.assertRaises(AttributeError, self.json.scanner.c_make_scanner, 1)
 
+    def test_make_encoder_indent(self):
+        self.assertRaises(TypeError, self.json.encoder.c_make_encoder,
+                          None, None, self.json.encoder.encode_basestring, 4,
+                          ': ', ', ', False, False, False)
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.encode_basestring, '  ',
+            ': ', ',', False, False, False)
+        self.assertEqual(''.join(enc([1, {'a': []}], 0)),
+                         '[\n  1,\n  {\n    "a": []\n  }\n]')
+        self.assertEqual(''.join(enc([1], 1)), '[\n    1\n  ]')
+
+    def test_encoder_write(self):
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.encode_basestring, None,
+            ': ', ', ', False, False, False)
+        written = []
+        self.assertIsNone(enc(list(range(100000)), 0, written.append))
+        self.assertGreater(len(written), 1)
+        self.assertEqual(''.join(written), str(list(range(100000))))
+        def bad_write(chunk):
+            1/0
+        with self.assertRaises(ZeroDivisionError):
+            enc(list(range(100000)), 0, bad_write)
+        with self.assertRaises(ZeroDivisionError):
+            enc([], 0, bad_write)
+
     def test_bad_bool_args(self):
         def test(value):
             self.json.decoder.JSONDecoder(strict=BadBool()).decode(value)
@@ -59,6 +85,32 @@ class TestEncode(CTest):
         with self.assertRaises(ZeroDivisionError):
             enc('spam', 4)
 
+    def test_make_encoder_indent(self):
+        self.assertRaises(TypeError, self.json.encoder.c_make_encoder,
+                          None, None, self.json.encoder.encode_basestring, 4,
+                          ': ', ', ', False, False, False)
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.encode_basestring, '  ',
+            ': ', ',', False, False, False)
+        self.assertEqual(''.join(enc([1, {'a': []}], 0)),
+                         '[\n  1,\n  {\n    "a": []\n  }\n]')
+        self.assertEqual(''.join(enc([1], 1)), '[\n    1\n  ]')
+
+    def test_encoder_write(self):
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.encode_basestring, None,
+            ': ', ', ', False, False, False)
+        written = []
+        self.assertIsNone(enc(list(range(100000)), 0, written.append))
+        self.assertGreater(len(written), 1)
+        self.assertEqual(''.join(written), str(list(range(100000))))
+        def bad_write(chunk):
+            1/0
+        with self.assertRaises(ZeroDivisionError):
+            enc(list(range(100000)), 0, bad_write)
+        with self.assertRaises(ZeroDivisionError):
+            enc([], 0, bad_write)
+
     def test_bad_bool_args(self):
         def test(name):
             self.json.encoder.JSONEncoder(**{name: BadBool()}).encode({'a': 1})
@@ -1,5 +1,9 @@
+import array
 import codecs
+import mmap
+import tempfile
 from collections import OrderedDict
+from decimal import Decimal
 from test.test_json import PyTest, CTest
 
 
@@ -79,6 +83,41 @@ class TestUnicode:
         self.assertEqual(self.loads(b'\x007'), 7)
         self.assertEqual(self.loads(b'57'), 57)
 
+    def test_bytes_like_decode(self):
+        data = {"a\xb5": ["\u20ac\U0001d120", 1.5, None, {"\ud800": []}]}
+        encoded = self.dumps(data, ensure_ascii=False).encode('utf-8',
+                                                             'surrogatepass')
+        self.assertEqual(self.loads(encoded), data)
+        self.assertEqual(self.loads(bytearray(encoded)), data)
+        self.assertEqual(self.loads(memoryview(encoded)), data)
+        self.assertEqual(self.loads(memoryview(b' ' + encoded)[1:]), data)
+        self.assertEqual(self.loads(array.array('b', encoded)), data)
+        with tempfile.TemporaryFile() as f:
+            f.write(encoded)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0) as m:
+                self.assertEqual(self.loads(m), data)
+        self.assertEqual(self.loads(encoded, parse_float=Decimal),
+                         {"a\xb5": ["\u20ac\U0001d120", Decimal('1.5'),
+                                    None, {"\ud800": []}]})
+
+    def test_bytes_decode_errors(self):
+        for doc in ['["\xe9", 1,]', '{"\u20ac": 1 "x"}', '["\u20ac"] 5',
+                    '\n\u20ac', '"\u20ac\\x"', '["\u20ac\x01"]', '[1, ']:
+            with self.subTest(doc=doc):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.loads(doc)
+                expected = cm.exception
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.loads(doc.encode('utf-8'))
+                self.assertEqual(str(cm.exception), str(expected))
+                self.assertEqual(cm.exception.doc, doc)
+        for doc in [b'["\xe9"]', b'["a", \xe9]', b'\xff', b'{"a": 1}\xe9']:
+            with self.subTest(doc=doc):
+                self.assertRaises(UnicodeDecodeError, self.loads, doc)
+        self.assertRaises(TypeError, self.loads,
+                          memoryview(b'[1, 2]')[::2])
+
     def test_object_pairs_hook_with_unicode(self):
         s = '{"xkd":1, "kcw":2, "art":3, "hxm":4, "qrt":5, "pad":6, "hoy":7}'
         p = [("xkd", 1), ("kcw", 2), ("art", 3), ("hxm", 4),
@@ -712,6 +712,36 @@ class StreamHandlerTest(BaseTest):
         actual = h.setStream(old)
         self.assertIsNone(actual)
 
+    def test_emit_batch(self):
+        class CountingStream(io.StringIO):
+            writes = 0
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+
+        stream = CountingStream()
+        h = logging.StreamHandler(stream)
+        h.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+        h.addFilter(lambda record: record.levelno > logging.DEBUG)
+        records = [logging.makeLogRecord({'msg': msg, 'levelno': levelno,
+                                          'levelname': levelname})
+                   for msg, levelno, levelname in [
+                       ('a', logging.INFO, 'INFO'),
+                       ('b', logging.DEBUG, 'DEBUG'),
+                       ('c %s', logging.ERROR, 'ERROR')]]
+        records[2].args = ('d',)
+        passed = h.handleBatch(records)
+        self.assertEqual(passed, [records[0], records[2]])
+        self.assertEqual(stream.getvalue(), 'INFO:a\nERROR:c d\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(h.handleBatch([records[1]]), [])
+        self.assertEqual(stream.writes, 1)
+
+        # A subclass which overrides emit() sees every record.
+        h = TestStreamHandler(BadStream())
+        h.emitBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -3371,6 +3401,176 @@ if hasattr(logging.handlers, 'QueueListener'):
 
 ZERO = datetime.timedelta(0)
 
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        logging.Handler.__init__(self, level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class BlockingHandler(logging.Handler):
+    def __init__(self, event):
+        logging.Handler.__init__(self)
+        self.event = event
+
+    def emit(self, record):
+        self.event.wait()
+
+
+class AsyncHandlerTest(BaseTest):
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.handler = ListHandler()
+        self.async_hdlr = logging.handlers.AsyncHandler(self.handler)
+        self.async_logger = logging.getLogger('async')
+        self.async_logger.propagate = False
+        self.async_logger.addHandler(self.async_hdlr)
+
+    def tearDown(self):
+        self.async_logger.removeHandler(self.async_hdlr)
+        self.async_hdlr.close()
+        self.handler.close()
+        BaseTest.tearDown(self)
+
+    def test_async_handler(self):
+        for i in range(250):
+            self.async_logger.warning('msg %d', i)
+        self.async_hdlr.flush()
+        self.assertEqual(self.handler.messages,
+                         ['msg %d' % i for i in range(250)])
+        self.async_logger.error('last')
+        self.async_hdlr.close()
+        self.assertEqual(self.handler.messages[-1], 'last')
+        # Records emitted after closing are dropped.
+        self.async_logger.error('dropped')
+        self.assertEqual(self.async_hdlr.dropped, 1)
+        self.assertEqual(self.handler.messages[-1], 'last')
+
+    def test_batches(self):
+        batches = []
+        class BatchHandler(logging.Handler):
+            def emitBatch(self, records):
+                batches.append([r.msg for r in records])
+        blocker = threading.Event()
+        async_hdlr = logging.handlers.AsyncHandler(
+            BlockingHandler(blocker), BatchHandler(), batch_size=3)
+        try:
+            for i in range(6):
+                async_hdlr.handle(logging.makeLogRecord({'msg': i}))
+            blocker.set()
+            async_hdlr.flush()
+        finally:
+            async_hdlr.close()
+        self.assertEqual(sum(batches, []), list(range(6)))
+        self.assertLessEqual(max(map(len, batches)), 3)
+        self.assertLess(len(batches), 6)
+
+    def test_drop_policy(self):
+        blocker = threading.Event()
+        async_hdlr = logging.handlers.AsyncHandler(
+            BlockingHandler(blocker), self.handler,
+            capacity=2, block=False, batch_size=1)
+        try:
+            for i in range(10):
+                async_hdlr.handle(logging.makeLogRecord({'msg': str(i)}))
+            self.assertGreaterEqual(async_hdlr.dropped, 7)
+            blocker.set()
+            async_hdlr.flush()
+        finally:
+            async_hdlr.close()
+        self.assertEqual(len(self.handler.messages) + async_hdlr.dropped, 10)
+        self.assertEqual(self.handler.messages[0], '0')
+
+        blocker.clear()
+        async_hdlr = logging.handlers.AsyncHandler(
+            BlockingHandler(blocker), capacity=1, timeout=0.01, batch_size=1)
+        try:
+            for i in range(4):
+                async_hdlr.handle(logging.makeLogRecord({'msg': str(i)}))
+            self.assertGreaterEqual(async_hdlr.dropped, 1)
+        finally:
+            blocker.set()
+            async_hdlr.close()
+
+    def test_respect_handler_level(self):
+        self.handler.setLevel(logging.ERROR)
+        self.async_logger.warning('warning')
+        self.async_hdlr.flush()
+        self.assertEqual(self.handler.messages, ['warning'])
+        async_hdlr = logging.handlers.AsyncHandler(self.handler,
+                                                   respect_handler_level=True)
+        try:
+            async_hdlr.handle(logging.makeLogRecord(
+                {'msg': 'info', 'levelno': logging.INFO}))
+            async_hdlr.handle(logging.makeLogRecord(
+                {'msg': 'critical', 'levelno': logging.CRITICAL}))
+        finally:
+            async_hdlr.close()
+        self.assertEqual(self.handler.messages, ['warning', 'critical'])
+
+    def test_handler_errors(self):
+        class BadHandler(logging.Handler):
+            def handleBatch(self, records):
+                raise RuntimeError('deliberate mistake')
+        async_hdlr = logging.handlers.AsyncHandler(BadHandler(), self.handler)
+        try:
+            with support.captured_stderr() as stderr:
+                async_hdlr.handle(logging.makeLogRecord({'msg': 'x'}))
+                async_hdlr.flush()
+            self.assertIn('RuntimeError: deliberate mistake', stderr.getvalue())
+        finally:
+            async_hdlr.close()
+        self.assertEqual(self.handler.messages, ['x'])
+
+    def test_shutdown(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        async_hdlr = logging.handlers.AsyncHandler(handler)
+        for i in range(100):
+            async_hdlr.handle(logging.makeLogRecord({'msg': i}))
+        logging.shutdown([weakref.ref(handler), weakref.ref(async_hdlr)])
+        self.assertEqual(stream.getvalue().split(), list(map(str, range(100))))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork()')
+    def test_fork(self):
+        blocker = threading.Event()
+        async_hdlr = logging.handlers.AsyncHandler(
+            BlockingHandler(blocker), self.handler, capacity=5, batch_size=1)
+        try:
+            # Records left in the queue are handled by the parent only.
+            async_hdlr.handle(logging.makeLogRecord({'msg': 'parent'}))
+            pid = os.fork()
+            if pid == 0:
+                # The child must not wait for a dead thread.
+                ok = False
+                try:
+                    blocker.set()
+                    del self.handler.messages[:]
+                    for i in range(10):
+                        async_hdlr.handle(logging.makeLogRecord({'msg': i}))
+                    async_hdlr.close()
+                    ok = self.handler.messages == list(map(str, range(10)))
+                finally:
+                    os._exit(0 if ok else 1)
+            blocker.set()
+            pid, status = os.waitpid(pid, 0)
+            self.assertEqual(status, 0)
+            async_hdlr.flush()
+        finally:
+            blocker.set()
+            async_hdlr.close()
+        self.assertEqual(self.handler.messages, ['parent'])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, logging.handlers.AsyncHandler,
+                          self.handler, batch_size=0)
+        self.assertRaises(ValueError, logging.handlers.AsyncHandler,
+                          self.handler, capacity=0)
+
+
 class UTC(datetime.tzinfo):
     def utcoffset(self, dt):
         return ZERO
@@ -3761,6 +3961,14 @@ class ModuleLevelMiscTest(BaseTest):
 
 
 class LogRecordTest(BaseTest):
+    def test_filename_module(self):
+        for i in range(2):
+            r = logging.LogRecord('name', logging.INFO, '/a/b/mod.py', 1,
+                                  'msg', None, None)
+            self.assertEqual((r.filename, r.module), ('mod.py', 'mod'))
+        r = logging.LogRecord('name', logging.INFO, None, 1, 'msg', None, None)
+        self.assertEqual((r.filename, r.module), (None, 'Unknown module'))
+
     def test_str_rep(self):
         r = logging.makeLogRecord({})
         s = str(r)
@@ -4162,6 +4370,39 @@ class LoggerTest(BaseTest):
     def test_set_invalid_level(self):
         self.assertRaises(TypeError, self.logger.setLevel, object())
 
+    def test_no_record_without_handler(self):
+        # No record is created if no handler accepts its level.
+        self.recording.setLevel(logging.INFO)
+        child = logging.Logger('blah.child')
+        child.parent = self.logger
+        other = RecordingHandler(logging.ERROR)
+        child.addHandler(other)
+        with support.swap_attr(self.logger, 'makeRecord', None), \
+             support.swap_attr(child, 'makeRecord', None):
+            self.logger.debug('not created')
+            child.debug('not created')
+            child.propagate = False
+            child.warning('not created')
+        child.propagate = True
+        child.warning('created')
+        child.error('created')
+        self.assertEqual([r.levelno for r in self.recording.records],
+                         [logging.WARNING, logging.ERROR])
+        self.assertEqual([r.levelno for r in other.records], [logging.ERROR])
+
+        # Logger filters still see every record.
+        seen = []
+        self.logger.addFilter(lambda record: seen.append(record))
+        self.logger.debug('filtered')
+        self.assertEqual([r.msg for r in seen], ['filtered'])
+        self.assertEqual(len(self.recording.records), 2)
+
+        # Without any handler, records go to lastResort.
+        lonely = logging.Logger('lonely')
+        with support.captured_stderr() as stderr:
+            lonely.warning('last resort')
+        self.assertEqual(stderr.getvalue(), 'last resort\n')
+
     def test_exception(self):
         msg = 'testing exception: %r'
         exc = None
@@ -4693,7 +4934,7 @@ def test_main():
         DatagramHandlerTest, MemoryTest, EncodingTest, WarningsTest,
         ConfigDictTest, ManagerTest, FormatterTest, BufferingFormatterTest,
         StreamHandlerTest, LogRecordFactoryTest, ChildLoggerTest,
-        QueueHandlerTest, ShutdownTest, ModuleLevelMiscTest, BasicConfigTest,
+        QueueHandlerTest, AsyncHandlerTest, ShutdownTest, ModuleLevelMiscTest, BasicConfigTest,
         LoggerAdapterTest, LoggerTest, SMTPHandlerTest, FileHandlerTest,
         RotatingFileHandlerTest,  LastResortTest, LogRecordTest,
         ExceptionTest, SysLogHandlerTest, IPv6SysLogHandlerTest, HTTPHandlerTest,
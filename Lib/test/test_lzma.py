@@ -1036,6 +1036,47 @@ class FileTestCase(unittest.TestCase):
             expected = lzma.compress(INPUT)
             self.assertEqual(dst.getvalue(), expected)
 
+    def test_write_threads(self):
+        with support.swap_attr(lzma, '_parallel_block_size',
+                               lambda preset, filters: 1000):
+            for size in (1, 100, 1000, len(INPUT)):
+                with self.subTest(size=size):
+                    with BytesIO() as dst:
+                        with LZMAFile(dst, "w", preset=1, threads=3) as f:
+                            for i in range(0, len(INPUT), size):
+                                f.write(INPUT[i:i+size])
+                            self.assertEqual(f.tell(), len(INPUT))
+                        compressed = dst.getvalue()
+                    self.assertEqual(lzma.decompress(compressed), INPUT)
+                    with LZMAFile(BytesIO(compressed)) as f:
+                        self.assertEqual(f.read(), INPUT)
+        with BytesIO() as dst:
+            with LZMAFile(dst, "w", check=lzma.CHECK_SHA256,
+                          threads=2) as f:
+                f.write(INPUT)
+            self.assertEqual(dst.getvalue(),
+                             lzma.compress(INPUT, check=lzma.CHECK_SHA256))
+        with BytesIO() as dst:
+            with LZMAFile(dst, "w", threads=2):
+                pass
+            self.assertEqual(dst.getvalue(), lzma.compress(b""))
+
+    def test_write_threads_bad_args(self):
+        with BytesIO() as dst:
+            self.assertRaises(ValueError, LZMAFile, dst, "w", threads=0)
+            self.assertRaises(ValueError, LZMAFile, dst, "w",
+                              format=lzma.FORMAT_ALONE, threads=2)
+        with BytesIO(COMPRESSED_XZ) as src:
+            self.assertRaises(ValueError, LZMAFile, src, threads=2)
+
+    def test_parallel_block_size(self):
+        self.assertEqual(lzma._parallel_block_size(None, None), 3 << 23)
+        self.assertEqual(lzma._parallel_block_size(1, None), 3 << 20)
+        self.assertEqual(
+            lzma._parallel_block_size(9 | lzma.PRESET_EXTREME, None), 3 << 26)
+        filters = [{"id": lzma.FILTER_LZMA2, "dict_size": 1 << 20}]
+        self.assertEqual(lzma._parallel_block_size(None, filters), 3 << 20)
+
     def test_write_append(self):
         part1 = INPUT[:1024]
         part2 = INPUT[1024:1536]
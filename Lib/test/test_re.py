@@ -1,10 +1,14 @@
+from test import support
 from test.support import (gc_collect, bigmemtest, _2G,
                           cpython_only, captured_stdout)
+import io
 import locale
+import marshal
 import re
 import sre_compile
 import string
 import unittest
+import unittest.mock
 import warnings
 from re import Scanner
 from weakref import proxy
@@ -2149,6 +2153,90 @@ class ImplementationTest(unittest.TestCase):
         self.assertEqual(f("abcabdac"), [0, 0, 0, 1, 2, 0, 1, 0])
 
 
+class CacheFileTests(unittest.TestCase):
+
+    def setUp(self):
+        re.purge()
+        self.addCleanup(re.purge)
+
+    def save(self):
+        f = io.BytesIO()
+        re.save_cache(f)
+        re.purge()
+        f.seek(0)
+        return f
+
+    def test_save_load(self):
+        patterns = [(r'(?P<year>\d{4})-(?P<month>\d\d)', 0),
+                    (r'(a)|(b)', re.IGNORECASE),
+                    (b'^[a-z]+(@)', re.MULTILINE),
+                    (r'(?x) a b  # comment', 0)]
+        old = [re.compile(pattern, flags) for pattern, flags in patterns]
+        f = self.save()
+        # Patterns with inline flags are also saved with their final flags.
+        self.assertEqual(re.load_cache(f), len(patterns) + 3)
+        with unittest.mock.patch('sre_compile._compile_args') as compile:
+            new = [re.compile(pattern, flags) for pattern, flags in patterns]
+            compile.assert_not_called()
+        self.assertEqual(new, old)
+        for p, q in zip(old, new):
+            self.assertEqual(q.flags, p.flags)
+            self.assertEqual(q.groups, p.groups)
+            self.assertEqual(q.groupindex, p.groupindex)
+        self.assertEqual(new[0].match('2018-07').group('month'), '07')
+        self.assertEqual(new[1].match('B').lastindex, 2)
+        self.assertEqual(new[2].search(b'x\nab@').span(), (2, 5))
+        # Other flags are compiled as usual.
+        self.assertEqual(re.compile(r'(a)|(b)').match('B'), None)
+
+    def test_save_load_file(self):
+        re.compile('a+b')
+        self.addCleanup(support.unlink, support.TESTFN)
+        re.save_cache(support.TESTFN)
+        re.purge()
+        self.assertEqual(re.load_cache(support.TESTFN), 2)
+        self.assertEqual(re.match('a+b', 'aab').group(), 'aab')
+        # Loaded patterns are saved again.
+        re.save_cache(support.TESTFN)
+        re.purge()
+        self.assertEqual(re.load_cache(support.TESTFN), 2)
+
+    def test_pickling(self):
+        import pickle
+        re.compile('(x)+y')
+        re.load_cache(self.save())
+        with unittest.mock.patch('sre_compile._compile_args') as compile:
+            p = pickle.loads(pickle.dumps(re.compile('(x)+y')))
+            compile.assert_not_called()
+        self.assertEqual(p.match('xxy').group(1), 'x')
+
+    def test_other_version(self):
+        re.compile('a+b')
+        f = self.save()
+        with unittest.mock.patch('re._CACHE_HEADER', ('re', 0, 0, None)):
+            self.assertEqual(re.load_cache(f), 0)
+        self.assertEqual(re._precompiled, {})
+
+    def test_bad_cache(self):
+        for data in (b'', b'abc', marshal.dumps(None),
+                     marshal.dumps((re._CACHE_HEADER, [1]))):
+            with self.subTest(data=data):
+                self.assertRaises(ValueError, re.load_cache, io.BytesIO(data))
+        # Bad code is detected when the pattern is compiled.
+        args = ('a+b', int(re.UNICODE), [1, 2, 3], 0, {}, ())
+        data = marshal.dumps((re._CACHE_HEADER, [(0, args)]))
+        self.assertEqual(re.load_cache(io.BytesIO(data)), 1)
+        self.assertEqual(re.match('a+b', 'aab').group(), 'aab')
+        self.assertEqual(re._precompiled, {})
+
+    def test_debug(self):
+        re.compile('a+b')
+        re.load_cache(self.save())
+        with captured_stdout() as out:
+            re.compile('a+b', re.DEBUG)
+        self.assertTrue(out.getvalue())
+
+
 class ExternalTests(unittest.TestCase):
 
     def test_re_benchmarks(self):
@@ -39,6 +39,14 @@ class byteskeydict(MutableMapping):
         return byteskeydict(self.d)
 
 
+class CountingDict(dict):
+    writes = 0
+
+    def __setitem__(self, key, value):
+        self.writes += 1
+        super().__setitem__(key, value)
+
+
 class TestCase(unittest.TestCase):
 
     fn = "shelftemp.db"
@@ -148,6 +156,63 @@ class TestCase(unittest.TestCase):
         p2 = d[encodedkey]
         self.assertNotEqual(p1, p2)  # Write creates new object in store
 
+    def test_writeback_only_modified(self):
+        d = CountingDict()
+        s = shelve.Shelf(d, writeback=True)
+        s['a'] = [1]
+        s['b'] = [2]
+        d.writes = 0
+        s['a'].append(3)
+        s['b']
+        s.sync()
+        self.assertEqual(d.writes, 1)
+        self.assertEqual(s.cache, {})
+        s['b']
+        s.close()
+        self.assertEqual(d.writes, 1)
+        s = shelve.Shelf(d)
+        self.assertEqual(s['a'], [1, 3])
+        self.assertEqual(s['b'], [2])
+
+    def test_writeback_cachesize(self):
+        d = CountingDict()
+        s = shelve.Shelf(d, writeback=True, cachesize=2)
+        self.assertEqual(s.cachesize, 2)
+        for i in range(5):
+            s[str(i)] = [i]
+        self.assertEqual(list(s.cache), ['3', '4'])
+        d.writes = 0
+        s['0'].append('x')
+        s['3'].append('y')
+        self.assertEqual(list(s.cache), ['0', '3'])
+        s['1'].append('z')
+        # '0' was evicted and written back.
+        self.assertEqual(list(s.cache), ['3', '1'])
+        self.assertEqual(d.writes, 1)
+        s['2']
+        s['4']
+        self.assertEqual(list(s.cache), ['2', '4'])
+        self.assertEqual(d.writes, 3)
+        # Unmodified entries are evicted without being written back.
+        s['0']
+        self.assertEqual(list(s.cache), ['4', '0'])
+        self.assertEqual(d.writes, 3)
+        del s['4']
+        self.assertEqual(list(s.cache), ['0'])
+        s.close()
+        self.assertEqual(d.writes, 3)
+        s = shelve.Shelf(d)
+        self.assertEqual(dict(s), {'0': [0, 'x'], '1': [1, 'z'], '2': [2],
+                                   '3': [3, 'y']})
+
+    def test_invalid_cachesize(self):
+        self.assertRaises(ValueError, shelve.Shelf, {}, writeback=True,
+                          cachesize=-1)
+        s = shelve.Shelf({}, writeback=True, cachesize=0)
+        s['a'] = [1]
+        self.assertEqual(s.cache, {})
+        self.assertEqual(s['a'], [1])
+
     def test_with(self):
         d1 = {}
         with shelve.Shelf(d1, protocol=2, writeback=False) as s:
@@ -891,6 +891,106 @@ class MemberReadTest(ReadTest, unittest.TestCase):
         self._test_member(tarinfo, size=7011, chksum=md5_regtype)
 
 
+class IndexedMemberReadTest(MemberReadTest):
+    # Run the member tests with lookups through an index.
+
+    def setUp(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            self.index = io.BytesIO()
+            tar.save_index(self.index)
+        self.index.seek(0)
+        self.tar = tarfile.open(self.tarname, mode=self.mode,
+                                encoding="iso8859-1", index=self.index)
+
+    def test_no_scan(self):
+        self.tar.getmember("misc/regtype-old-v7")
+        self.assertFalse(self.tar._loaded)
+        self.assertEqual(len(self.tar.members), 1)
+        self.assertRaises(KeyError, self.tar.getmember, "missing")
+        self.assertFalse(self.tar._loaded)
+
+    def test_getnames(self):
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            names = tar.getnames()
+        self.assertEqual(self.tar.getnames(), names)
+        self.assertFalse(self.tar._loaded)
+
+    def test_iteration(self):
+        # Looking members up does not disturb reading the archive in order.
+        self.tar.getmember("misc/regtype-old-v7")
+        first = next(iter(self.tar))
+        self.tar.getmember("gnu/sparse")
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            names = tar.getnames()
+        self.assertEqual([t.name for t in self.tar], names)
+        self.assertEqual(first.name, names[0])
+
+    def test_extract_links(self):
+        with self.tar.extractfile("ustar/lnktype") as f:
+            self.assertEqual(md5sum(f.read()), md5_regtype)
+        with self.tar.extractfile("ustar/symtype") as f:
+            self.assertEqual(md5sum(f.read()), md5_regtype)
+        self.assertFalse(self.tar._loaded)
+
+
+class GzipIndexedMemberReadTest(GzipTest, IndexedMemberReadTest):
+    pass
+
+
+class IndexTest(unittest.TestCase):
+
+    def test_save_to_path(self):
+        indexname = os.path.join(TEMPDIR, "testtar.index")
+        self.addCleanup(support.unlink, indexname)
+        with tarfile.open(tarname) as tar:
+            tar.save_index(pathlib.Path(indexname))
+            names = tar.getnames()
+        with tarfile.open(tarname, index=indexname) as tar:
+            self.assertEqual(tar.getnames(), names)
+            tarinfo = tar.getmember("ustar/regtype")
+            self.assertEqual(tarinfo.size, 7011)
+
+    def test_stale_index(self):
+        with tarfile.open(tmpname, "w") as tar:
+            tar.addfile(tarfile.TarInfo("foo"))
+            tar.addfile(tarfile.TarInfo("bar"))
+        index = io.BytesIO()
+        with tarfile.open(tmpname) as tar:
+            tar.save_index(index)
+        with tarfile.open(tmpname, "w") as tar:
+            tar.addfile(tarfile.TarInfo("baz"))
+            tar.addfile(tarfile.TarInfo("bar"))
+        index.seek(0)
+        with tarfile.open(tmpname, index=index) as tar:
+            with self.assertRaisesRegex(tarfile.ReadError, "does not match"):
+                tar.getmember("foo")
+
+    def test_invalid_index(self):
+        for data in (b"", b"[]", b'{"tarfile_index": 2, "members": []}',
+                     b'{"tarfile_index": 1, "members": [["foo", 0]]}'):
+            with self.subTest(data=data):
+                with self.assertRaises(tarfile.ReadError):
+                    tarfile.open(tarname, index=io.BytesIO(data))
+        index = io.BytesIO(b'{"tarfile_index": 1, '
+                           b'"members": [["foo", 100000000, 0, 0]]}')
+        with tarfile.open(tarname, index=index) as tar:
+            self.assertRaises(tarfile.ReadError, tar.getmember, "foo")
+
+    def test_bad_mode(self):
+        with self.assertRaises(ValueError):
+            tarfile.open(tmpname, "w", index=io.BytesIO())
+        with open(tarname, "rb") as fobj:
+            for mode in ("r|", "r|*"):
+                with self.assertRaises(ValueError):
+                    tarfile.open(fileobj=fobj, mode=mode,
+                                 index=io.BytesIO())
+        with tarfile.open(tmpname, "w") as tar:
+            self.assertRaises(OSError, tar.save_index, io.BytesIO())
+
+
 class LongnameTest:
 
     def test_read_longname(self):
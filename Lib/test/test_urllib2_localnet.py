@@ -659,6 +659,129 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves a fixed body with HTTP/1.1 keep-alive semantics.
+
+    Each connection is recorded by its client port.  A request for
+    /drop is answered normally but the connection is then closed without
+    telling the client, as a server reaping idle connections would.
+    """
+
+    protocol_version = "HTTP/1.1"
+    body = b"keep me alive" * 100
+    connections = []
+
+    def setup(self):
+        super().setup()
+        self.connections.append(self.client_address[1])
+
+    def do_GET(self):
+        self.send_response(200)
+        if self.path == "/chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n"
+                             % (len(self.body), self.body))
+        else:
+            self.send_header("Content-Length", str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body)
+        if self.path == "/drop":
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+class PoolingHTTPHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Ignore proxies for localhost tests.
+        def restore_environ(old_environ):
+            os.environ.clear()
+            os.environ.update(old_environ)
+        self.addCleanup(restore_environ, os.environ.copy())
+        os.environ['NO_PROXY'] = '*'
+        os.environ['no_proxy'] = '*'
+
+        self.handler = KeepAliveRequestHandler
+        self.handler.connections = []
+        self.server = LoopbackHttpServerThread(self.handler)
+        self.handler.protocol_version = "HTTP/1.1"
+        self.addCleanup(self.server.stop)
+        self.server.start()
+        self.server.ready.wait()
+
+    def make_opener(self, **kwargs):
+        pooling_handler = urllib.request.PoolingHTTPHandler(**kwargs)
+        opener = urllib.request.build_opener(pooling_handler)
+        # The single-threaded server only moves on to the next connection
+        # once the client has closed the current one.
+        self.addCleanup(pooling_handler.close)
+        return opener, pooling_handler
+
+    def url(self, path="/"):
+        return "http://localhost:%s%s" % (self.server.port, path)
+
+    def test_default_handler_replaced(self):
+        opener, pooling_handler = self.make_opener()
+        http_handlers = [h for h in opener.handlers
+                         if isinstance(h, urllib.request.HTTPHandler)]
+        self.assertEqual(http_handlers, [pooling_handler])
+
+    def test_connection_reused(self):
+        opener, _ = self.make_opener()
+        for path in ("/", "/chunked", "/"):
+            with opener.open(self.url(path)) as f:
+                self.assertEqual(f.read(), self.handler.body)
+                self.assertEqual(f.status, 200)
+                self.assertEqual(f.geturl(), self.url(path))
+        self.assertEqual(len(self.handler.connections), 1)
+
+    def test_partially_read_response_not_reused(self):
+        opener, pooling_handler = self.make_opener()
+        with opener.open(self.url()) as f:
+            f.read(10)
+        self.assertEqual(pooling_handler._pool._idle, {})
+        with opener.open(self.url()) as f:
+            self.assertEqual(f.read(), self.handler.body)
+        self.assertEqual(len(self.handler.connections), 2)
+
+    def test_idle_timeout(self):
+        opener, _ = self.make_opener(idle_timeout=0)
+        for i in range(2):
+            with opener.open(self.url()) as f:
+                self.assertEqual(f.read(), self.handler.body)
+        self.assertEqual(len(self.handler.connections), 2)
+
+    def test_max_conns(self):
+        opener, pooling_handler = self.make_opener(max_conns=0)
+        with opener.open(self.url()) as f:
+            self.assertEqual(f.read(), self.handler.body)
+        self.assertEqual(pooling_handler._pool._idle, {})
+
+    def test_closed_idle_connection_retried(self):
+        opener, _ = self.make_opener()
+        with opener.open(self.url("/drop")) as f:
+            self.assertEqual(f.read(), self.handler.body)
+        with opener.open(self.url()) as f:
+            self.assertEqual(f.read(), self.handler.body)
+        self.assertEqual(len(self.handler.connections), 2)
+
+    def test_close_clears_pool(self):
+        opener, pooling_handler = self.make_opener()
+        with opener.open(self.url()) as f:
+            f.read()
+        self.assertEqual(len(pooling_handler._pool._idle), 1)
+        pooling_handler.close()
+        self.assertEqual(pooling_handler._pool._idle, {})
+        # The handler remains usable after close().
+        with opener.open(self.url()) as f:
+            self.assertEqual(f.read(), self.handler.body)
+        self.assertEqual(len(self.handler.connections), 2)
+
+
 threads_key = None
 
 def setUpModule():
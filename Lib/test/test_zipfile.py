@@ -1085,6 +1085,34 @@ class ExtractTests(unittest.TestCase):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(extdir)
 
+    def test_extract_all_parallel(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.writestr('emptydir/', '')
+            for fpath, fdata in SMALL_TEST_DATA:
+                zipfp.writestr(fpath, fdata * 1000)
+            with self.assertWarns(UserWarning):
+                zipfp.writestr(SMALL_TEST_DATA[0][0], 'last')
+        self.addCleanup(unlink, TESTFN2)
+        for max_workers in (2, None):
+            with temp_dir() as extdir, \
+                 zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(extdir, max_workers=max_workers)
+                self.assertTrue(os.path.isdir(os.path.join(extdir,
+                                                           'emptydir')))
+                self.check_file(os.path.join(extdir, SMALL_TEST_DATA[0][0]),
+                                b'last')
+                for fpath, fdata in SMALL_TEST_DATA[1:]:
+                    self.check_file(os.path.join(extdir, fpath),
+                                    fdata.encode() * 1000)
+        with temp_dir() as extdir, zipfile.ZipFile(TESTFN2, "r") as zipfp:
+            zipfp.extractall(extdir, members=[SMALL_TEST_DATA[1][0]],
+                             max_workers=4)
+            self.assertEqual(os.listdir(extdir), ['ziptest2dir'])
+            with self.assertRaises(ValueError):
+                zipfp.extractall(extdir, max_workers=0)
+            with self.assertRaises(KeyError):
+                zipfp.extractall(extdir, members=['missing'], max_workers=2)
+
     def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(pathlib.Path(extdir))
@@ -2109,6 +2137,46 @@ class TestsWithMultipleOpens(unittest.TestCase):
             self.assertEqual(data1, self.data1)
             self.assertEqual(data2, self.data2)
 
+    def test_threads(self):
+        # Members can be read concurrently from several threads.
+        import threading
+        for f in get_files(self):
+            self.make_test_archive(f)
+            results = {}
+            with zipfile.ZipFile(f, mode="r") as zipf:
+                def read(name, i):
+                    with zipf.open(name) as zopen:
+                        data = b''
+                        while True:
+                            chunk = zopen.read(100)
+                            if not chunk:
+                                break
+                            data += chunk
+                    results[i] = data
+                threads = [threading.Thread(target=read,
+                                            args=(('ones', 'twos')[i % 2], i))
+                           for i in range(8)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+            self.assertEqual(len(results), 8)
+            for i, data in results.items():
+                self.assertEqual(data, (self.data1, self.data2)[i % 2])
+
+    def test_seek_backwards(self):
+        for f in get_files(self):
+            self.make_test_archive(f)
+            with zipfile.ZipFile(f, mode="r") as zipf:
+                with zipf.open('twos') as zopen:
+                    zopen.read(9000)
+                    zopen.seek(100)
+                    self.assertEqual(zopen.read(10), self.data2[100:110])
+                    zopen.seek(-50, os.SEEK_END)
+                    self.assertEqual(zopen.read(), self.data2[-50:])
+                    zopen.seek(0)
+                    self.assertEqual(zopen.read(), self.data2)
+
     def test_many_opens(self):
         # Verify that read() and open() promptly close the file descriptor,
         # and don't rely on the garbage collector to free resources.
@@ -96,6 +96,7 @@ import sys
 import time
 import tempfile
 import contextlib
+import threading
 import warnings
 
 
@@ -123,8 +124,8 @@ __all__ = [
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
-    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
-    'UnknownHandler', 'HTTPErrorProcessor',
+    'PoolingHTTPHandler', 'FileHandler', 'FTPHandler', 'CacheFTPHandler',
+    'DataHandler', 'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies',
@@ -1285,30 +1286,17 @@ class AbstractHTTPHandler(BaseHandler):
         h = http_class(host, timeout=req.timeout, **http_conn_args)
         h.set_debuglevel(self._debuglevel)
 
-        headers = dict(req.unredirected_hdrs)
-        headers.update({k: v for k, v in req.headers.items()
-                        if k not in headers})
-
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
+        headers, tunnel_headers = self._get_request_headers(req)
 
         # We want to make an HTTP/1.1 request, but the addinfourl
         # class isn't prepared to deal with a persistent connection.
         # It will try to read all remaining data from the socket,
         # which will block while the server waits for the next request.
         # So make sure the connection gets closed after the (only)
-        # request.
+        # request.  PoolingHTTPHandler keeps connections open instead.
         headers["Connection"] = "close"
-        headers = {name.title(): val for name, val in headers.items()}
 
         if req._tunnel_host:
-            tunnel_headers = {}
-            proxy_auth_hdr = "Proxy-Authorization"
-            if proxy_auth_hdr in headers:
-                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
-                # Proxy-Authorization should not be sent to origin
-                # server.
-                del headers[proxy_auth_hdr]
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
         try:
@@ -1338,6 +1326,169 @@ class AbstractHTTPHandler(BaseHandler):
         r.msg = r.reason
         return r
 
+    def _get_request_headers(self, req):
+        """Return the headers to send for req and those for its proxy tunnel."""
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items()
+                        if k not in headers})
+        headers = {name.title(): val for name, val in headers.items()}
+
+        tunnel_headers = {}
+        if req._tunnel_host:
+            proxy_auth_hdr = "Proxy-Authorization"
+            if proxy_auth_hdr in headers:
+                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
+                # Proxy-Authorization should not be sent to origin
+                # server.
+                del headers[proxy_auth_hdr]
+        return headers, tunnel_headers
+
+    def _do_open_pooled(self, pool, http_class, req, **http_conn_args):
+        """Like do_open(), but keep the connection open for reuse.
+
+        The connection is taken from pool if an idle one is available for
+        the same host, proxy tunnel and timeout, and is handed back to pool
+        once the body of the returned response has been read in full.
+        """
+        host = req.host
+        if not host:
+            raise URLError('no host given')
+
+        headers, tunnel_headers = self._get_request_headers(req)
+        key = (host.lower(), req._tunnel_host, req.timeout)
+        method = req.get_method()
+        # A body that is not held in memory may already have been consumed
+        # by the failed attempt, so only such requests are retried.
+        replayable = (req.data is None or
+                      isinstance(req.data, (bytes, bytearray, memoryview)))
+
+        while True:
+            h = pool.get(key)
+            reused = h is not None
+            if not reused:
+                # will parse host:port
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                h.response_class = _PooledHTTPResponse
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            h.set_debuglevel(self._debuglevel)
+
+            # The server may have closed an idle connection at any time;
+            # in that case retry once on a fresh one.  If the request may
+            # have reached the server, only do so for idempotent methods.
+            try:
+                try:
+                    h.request(method, req.selector, req.data, headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err: # timeout error
+                    if reused and replayable and isinstance(err, ConnectionError):
+                        h.close()
+                        continue
+                    raise URLError(err)
+                try:
+                    r = h.getresponse()
+                except ConnectionError:
+                    if (reused and replayable and
+                            method in _IDEMPOTENT_METHODS):
+                        h.close()
+                        continue
+                    raise
+            except:
+                h.close()
+                raise
+            break
+
+        def release(reusable):
+            if reusable:
+                pool.put(key, h)
+            else:
+                h.close()
+        r._release_conn = release
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+
+_IDEMPOTENT_METHODS = frozenset(
+    ['GET', 'HEAD', 'OPTIONS', 'TRACE', 'PUT', 'DELETE'])
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back once it is finished."""
+
+    _release_conn = None
+    _trailer_read = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self._trailer_read = True
+
+    def _close_conn(self):
+        super()._close_conn()
+        release, self._release_conn = self._release_conn, None
+        if release is not None:
+            # The connection can only carry another request if the whole
+            # body has been read off the socket.
+            release(not self.will_close and
+                    (self.length == 0 or self._trailer_read))
+
+
+class _HTTPConnectionPool:
+    """Idle persistent HTTP connections for reuse by PoolingHTTPHandler.
+
+    At most max_conns idle connections are kept for each key; connections
+    left idle for longer than idle_timeout seconds are closed.
+    """
+
+    def __init__(self, max_conns=10, idle_timeout=60.0):
+        if max_conns < 0:
+            raise ValueError("max_conns must be non-negative")
+        self.max_conns = max_conns
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return an idle connection for key, or None."""
+        expired = []
+        conn = None
+        now = time.monotonic()
+        with self._lock:
+            conns = self._idle.get(key)
+            while conns:
+                candidate, expires = conns.pop()
+                if expires > now:
+                    conn = candidate
+                    break
+                expired.append(candidate)
+            if not conns:
+                self._idle.pop(key, None)
+        for c in expired:
+            c.close()
+        return conn
+
+    def put(self, key, conn):
+        """Make conn available for reuse by later requests for key."""
+        extra = None
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            conns.append((conn, time.monotonic() + self.idle_timeout))
+            if len(conns) > self.max_conns:
+                extra, _ = conns.pop(0)
+            if not conns:
+                del self._idle[key]
+        if extra is not None:
+            extra.close()
+
+    def clear(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
 
 class HTTPHandler(AbstractHTTPHandler):
 
@@ -1346,6 +1497,19 @@ class HTTPHandler(AbstractHTTPHandler):
 
     http_request = AbstractHTTPHandler.do_request_
 
+class PoolingHTTPHandler(HTTPHandler):
+    """HTTPHandler that reuses persistent connections across requests."""
+
+    def __init__(self, debuglevel=0, *, max_conns=10, idle_timeout=60.0):
+        HTTPHandler.__init__(self, debuglevel)
+        self._pool = _HTTPConnectionPool(max_conns, idle_timeout)
+
+    def http_open(self, req):
+        return self._do_open_pooled(self._pool, http.client.HTTPConnection, req)
+
+    def close(self):
+        self._pool.clear()
+
 if hasattr(http.client, 'HTTPSConnection'):
 
     class HTTPSHandler(AbstractHTTPHandler):
@@ -1361,7 +1525,23 @@ if hasattr(http.client, 'HTTPSConnection'):
 
         https_request = AbstractHTTPHandler.do_request_
 
-    __all__.append('HTTPSHandler')
+    class PoolingHTTPSHandler(HTTPSHandler):
+        """HTTPSHandler that reuses persistent connections across requests."""
+
+        def __init__(self, debuglevel=0, context=None, check_hostname=None,
+                     *, max_conns=10, idle_timeout=60.0):
+            HTTPSHandler.__init__(self, debuglevel, context, check_hostname)
+            self._pool = _HTTPConnectionPool(max_conns, idle_timeout)
+
+        def https_open(self, req):
+            return self._do_open_pooled(self._pool, http.client.HTTPSConnection,
+                req, context=self._context,
+                check_hostname=self._check_hostname)
+
+        def close(self):
+            self._pool.clear()
+
+    __all__.extend(['HTTPSHandler', 'PoolingHTTPSHandler'])
 
 class HTTPCookieProcessor(BaseHandler):
     def __init__(self, cookiejar=None):
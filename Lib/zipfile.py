@@ -690,26 +690,38 @@ def _get_decompressor(compress_type):
 
 
 class _SharedFile:
-    def __init__(self, file, pos, close, lock, writing):
+    def __init__(self, file, pos, close, lock, writing, fd=None):
         self._file = file
         self._pos = pos
         self._close = close
         self._lock = lock
         self._writing = writing
+        # When set, fd is a descriptor of the archive which is only read, so
+        # reads at an offset can use os.pread() without taking the lock.
+        self._fd = fd
         self.seekable = file.seekable
-        self.tell = file.tell
+
+    def tell(self):
+        return self._pos
 
     def seek(self, offset, whence=0):
+        if self._fd is not None and whence == 0:
+            self._pos = offset
+            return self._pos
         with self._lock:
-            if self.writing():
+            if self._writing():
                 raise ValueError("Can't reposition in the ZIP file while "
                         "there is an open writing handle on it. "
                         "Close the writing handle before trying to read.")
-            self._file.seek(self._pos)
+            self._file.seek(offset, whence)
             self._pos = self._file.tell()
             return self._pos
 
     def read(self, n=-1):
+        if self._fd is not None and n >= 0:
+            data = os.pread(self._fd, n, self._pos)
+            self._pos += len(data)
+            return data
         with self._lock:
             if self._writing():
                 raise ValueError("Can't read from the ZIP file while there "
@@ -724,6 +736,7 @@ class _SharedFile:
         if self._file is not None:
             fileobj = self._file
             self._file = None
+            self._fd = None
             self._close(fileobj)
 
 # Provide the tell method for unseekable stream
@@ -1028,7 +1041,7 @@ class ZipExtFile(io.BufferedIOBase):
             self._left = self._orig_file_size
             self._readbuffer = b''
             self._offset = 0
-            self._decompressor = zipfile._get_decompressor(self._compress_type)
+            self._decompressor = _get_decompressor(self._compress_type)
             self._eof = False
             read_offset = new_pos
 
@@ -1194,10 +1207,15 @@ class ZipFile:
         self._lock = threading.RLock()
         self._seekable = True
         self._writing = False
+        self._readfd = None
 
         try:
             if mode == 'r':
                 self._RealGetContents()
+                if not self._filePassed and hasattr(os, 'pread'):
+                    # Members can be read at their offsets without sharing
+                    # the file position, so threads can read them in parallel.
+                    self._readfd = self.fp.fileno()
             elif mode in ('w', 'x'):
                 # set the modified flag so central directory gets written
                 # even if no files are added to the archive
@@ -1453,9 +1471,11 @@ class ZipFile:
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
-                               self._fpclose, self._lock, lambda: self._writing)
+                               self._fpclose, self._lock, lambda: self._writing,
+                               self._readfd)
         try:
             # Skip the file header:
             fheader = zef_file.read(sizeFileHeader)
@@ -1576,11 +1596,13 @@ class ZipFile:
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, max_workers=1):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). `max_workers' is the number of threads which
+           extract files concurrently; if it is None, the number of CPUs
+           is used.
         """
         if members is None:
             members = self.namelist()
@@ -1590,8 +1612,39 @@ class ZipFile:
         else:
             path = os.fspath(path)
 
-        for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        if max_workers == 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+            return
+
+        # Create the directories first, then extract the files on a thread
+        # pool.  If several members map to the same path, only the last one
+        # is extracted, since it would overwrite the others anyway.
+        files = {}
+        for member in members:
+            if not isinstance(member, ZipInfo):
+                member = self.getinfo(member)
+            targetpath = self._get_targetpath(member, path)
+            if member.is_dir():
+                os.makedirs(targetpath, exist_ok=True)
+            else:
+                upperdirs = os.path.dirname(targetpath)
+                if upperdirs:
+                    os.makedirs(upperdirs, exist_ok=True)
+                files.pop(targetpath, None)
+                files[targetpath] = member
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(self._extract_file, member, targetpath,
+                                       pwd)
+                       for targetpath, member in files.items()]
+        for future in futures:
+            future.result()
 
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
@@ -1615,6 +1668,31 @@ class ZipFile:
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
 
+        targetpath = self._get_targetpath(member, targetpath)
+
+        # Create all upper directories if necessary.
+        upperdirs = os.path.dirname(targetpath)
+        if upperdirs and not os.path.exists(upperdirs):
+            os.makedirs(upperdirs)
+
+        if member.is_dir():
+            if not os.path.isdir(targetpath):
+                os.mkdir(targetpath)
+            return targetpath
+
+        return self._extract_file(member, targetpath, pwd)
+
+    def _extract_file(self, member, targetpath, pwd):
+        with self.open(member, pwd=pwd) as source, \
+             open(targetpath, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        return targetpath
+
+    def _get_targetpath(self, member, targetpath):
+        """Return the path to which the ZipInfo object 'member' is
+           extracted under the directory targetpath.
+        """
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename.replace('/', os.path.sep)
@@ -1632,23 +1710,7 @@ class ZipFile:
             arcname = self._sanitize_windows_name(arcname, os.path.sep)
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
-
-        # Create all upper directories if necessary.
-        upperdirs = os.path.dirname(targetpath)
-        if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
-
-        if member.is_dir():
-            if not os.path.isdir(targetpath):
-                os.mkdir(targetpath)
-            return targetpath
-
-        with self.open(member, pwd=pwd) as source, \
-             open(targetpath, "wb") as target:
-            shutil.copyfileobj(source, target)
-
-        return targetpath
+        return os.path.normpath(targetpath)
 
     def _writecheck(self, zinfo):
         """Check for errors before writing a file to the archive."""
@@ -1890,10 +1952,11 @@ class ZipFile:
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
@@ -102,12 +102,24 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+    PyObject *converters;       /* tuple of per-column converters or NULL */
 } ReaderObj;
 
 static PyTypeObject Reader_Type;
 
 #define ReaderObject_Check(v)   (Py_TYPE(v) == &Reader_Type)
 
+typedef struct {
+    PyObject_HEAD
+
+    ReaderObj *reader;          /* reader producing the rows */
+    PyObject *fieldnames;       /* tuple of keys */
+    PyObject *restkey;          /* key for the fields of long rows */
+    PyObject *restval;          /* value for the missing fields of short rows */
+} DictReaderObj;
+
+static PyTypeObject DictReader_Type;
+
 typedef struct {
     PyObject_HEAD
 
@@ -524,32 +536,123 @@ _call_dialect(PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
-static int
-parse_save_field(ReaderObj *self)
+/* Convert the current field with int(), parsing short decimal integers
+   directly from the field buffer. */
+static PyObject *
+parse_field_as_int(ReaderObj *self)
 {
-    PyObject *field;
+    Py_UCS4 *p = self->field, *end = p + self->field_len;
+    PyObject *field, *result;
+    int negative = 0;
+    long long value = 0;
+
+    if (p < end && (*p == '-' || *p == '+')) {
+        negative = *p == '-';
+        p++;
+    }
+    /* 18 digits cannot overflow a long long. */
+    if (p < end && end - p <= 18) {
+        for (; p < end; p++) {
+            if (*p < '0' || *p > '9')
+                break;
+            value = value * 10 + (*p - '0');
+        }
+        if (p == end)
+            return PyLong_FromLongLong(negative ? -value : value);
+    }
 
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
     if (field == NULL)
-        return -1;
-    self->field_len = 0;
-    if (self->numeric_field) {
-        PyObject *tmp;
+        return NULL;
+    result = PyLong_FromUnicodeObject(field, 10);
+    Py_DECREF(field);
+    return result;
+}
 
-        self->numeric_field = 0;
-        tmp = PyNumber_Float(field);
-        Py_DECREF(field);
-        if (tmp == NULL)
-            return -1;
-        field = tmp;
+/* Convert the current field with float(), parsing short ASCII fields
+   directly from the field buffer. */
+static PyObject *
+parse_field_as_float(ReaderObj *self)
+{
+    char buf[64];
+    char *end;
+    Py_ssize_t i;
+    PyObject *field, *result;
+    double value;
+
+    if (self->field_len > 0 && self->field_len < (Py_ssize_t)sizeof(buf)) {
+        for (i = 0; i < self->field_len; i++) {
+            if (self->field[i] >= 128)
+                break;
+            buf[i] = (char)self->field[i];
+        }
+        if (i == self->field_len) {
+            buf[i] = '\0';
+            value = PyOS_string_to_double(buf, &end, NULL);
+            if (value == -1.0 && PyErr_Occurred())
+                PyErr_Clear();
+            else if (end == buf + i)
+                return PyFloat_FromDouble(value);
+        }
     }
-    if (PyList_Append(self->fields, field) < 0) {
-        Py_DECREF(field);
-        return -1;
+
+    /* Leave whitespace, underscores and errors to float(). */
+    field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                      (void *) self->field, self->field_len);
+    if (field == NULL)
+        return NULL;
+    result = PyFloat_FromString(field);
+    Py_DECREF(field);
+    return result;
+}
+
+static int
+parse_save_field(ReaderObj *self)
+{
+    PyObject *field, *fields, *converter = NULL;
+    Py_ssize_t column = PyList_GET_SIZE(self->fields);
+    int result;
+
+    if (self->converters != NULL &&
+        column < PyTuple_GET_SIZE(self->converters)) {
+        converter = PyTuple_GET_ITEM(self->converters, column);
+        if (converter == Py_None)
+            converter = NULL;
+    }
+    if (converter == (PyObject *)&PyLong_Type)
+        field = parse_field_as_int(self);
+    else if (converter == (PyObject *)&PyFloat_Type ||
+             (converter == NULL && self->numeric_field))
+        field = parse_field_as_float(self);
+    else {
+        field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                          (void *) self->field,
+                                          self->field_len);
+        if (field != NULL && converter != NULL) {
+            /* The converter can run any code, including code using this
+               reader, so the row is held on to across the call. */
+            self->field_len = 0;
+            self->numeric_field = 0;
+            fields = self->fields;
+            Py_INCREF(fields);
+            Py_SETREF(field,
+                      PyObject_CallFunctionObjArgs(converter, field, NULL));
+            if (field != NULL && fields != self->fields) {
+                PyErr_SetString(_csvstate_global->error_obj,
+                                "reader used by its own converter");
+                Py_CLEAR(field);
+            }
+            Py_DECREF(fields);
+        }
     }
+    self->field_len = 0;
+    self->numeric_field = 0;
+    if (field == NULL)
+        return -1;
+    result = PyList_Append(self->fields, field);
     Py_DECREF(field);
-    return 0;
+    return result;
 }
 
 static int
@@ -861,6 +964,7 @@ Reader_dealloc(ReaderObj *self)
     Py_XDECREF(self->dialect);
     Py_XDECREF(self->input_iter);
     Py_XDECREF(self->fields);
+    Py_XDECREF(self->converters);
     if (self->field != NULL)
         PyMem_Free(self->field);
     PyObject_GC_Del(self);
@@ -872,6 +976,7 @@ Reader_traverse(ReaderObj *self, visitproc visit, void *arg)
     Py_VISIT(self->dialect);
     Py_VISIT(self->input_iter);
     Py_VISIT(self->fields);
+    Py_VISIT(self->converters);
     return 0;
 }
 
@@ -881,9 +986,102 @@ Reader_clear(ReaderObj *self)
     Py_CLEAR(self->dialect);
     Py_CLEAR(self->input_iter);
     Py_CLEAR(self->fields);
+    Py_CLEAR(self->converters);
     return 0;
 }
 
+/* Call iternext up to n times (until it is exhausted if n is negative)
+   and return the results as a list. */
+static PyObject *
+read_rows(PyObject *self, iternextfunc iternext, Py_ssize_t n)
+{
+    PyObject *rows, *row;
+
+    rows = PyList_New(0);
+    if (rows == NULL)
+        return NULL;
+    while (n < 0 || PyList_GET_SIZE(rows) < n) {
+        row = iternext(self);
+        if (row == NULL) {
+            if (PyErr_Occurred()) {
+                Py_DECREF(rows);
+                return NULL;
+            }
+            break;
+        }
+        if (PyList_Append(rows, row) < 0) {
+            Py_DECREF(row);
+            Py_DECREF(rows);
+            return NULL;
+        }
+        Py_DECREF(row);
+    }
+    return rows;
+}
+
+PyDoc_STRVAR(Reader_readrows_doc,
+"readrows(n=-1) -> list of rows\n"
+"\n"
+"Read up to n rows, or all remaining rows if n is negative or None.\n"
+"An empty list is returned at the end of the input.");
+
+static PyObject *
+Reader_readrows(ReaderObj *self, PyObject *args)
+{
+    Py_ssize_t n = -1;
+
+    if (!PyArg_ParseTuple(args, "|O&:readrows",
+                          _Py_convert_optional_to_ssize_t, &n))
+        return NULL;
+    return read_rows((PyObject *)self, (iternextfunc)Reader_iternext, n);
+}
+
+static int
+set_converters(ReaderObj *self, PyObject *converters)
+{
+    Py_ssize_t i;
+
+    if (converters == NULL || converters == Py_None) {
+        Py_CLEAR(self->converters);
+        return 0;
+    }
+    converters = PySequence_Tuple(converters);
+    if (converters == NULL) {
+        if (PyErr_ExceptionMatches(PyExc_TypeError))
+            PyErr_SetString(PyExc_TypeError,
+                            "converters must be a sequence");
+        return -1;
+    }
+    for (i = 0; i < PyTuple_GET_SIZE(converters); i++) {
+        PyObject *converter = PyTuple_GET_ITEM(converters, i);
+        if (converter != Py_None && !PyCallable_Check(converter)) {
+            PyErr_Format(PyExc_TypeError,
+                         "converter must be callable or None, not %.200s",
+                         Py_TYPE(converter)->tp_name);
+            Py_DECREF(converters);
+            return -1;
+        }
+    }
+    Py_XSETREF(self->converters, converters);
+    return 0;
+}
+
+static PyObject *
+Reader_get_converters(ReaderObj *self, void *Py_UNUSED(ignored))
+{
+    if (self->converters == NULL)
+        Py_RETURN_NONE;
+    Py_INCREF(self->converters);
+    return self->converters;
+}
+
+static int
+Reader_set_converters(ReaderObj *self, PyObject *value,
+                      void *Py_UNUSED(ignored))
+{
+    return set_converters(self, value);
+}
+
 PyDoc_STRVAR(Reader_Type_doc,
 "CSV reader\n"
 "\n"
@@ -892,6 +1090,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "readrows", (PyCFunction)Reader_readrows,
+        METH_VARARGS, Reader_readrows_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -902,6 +1102,12 @@ static struct PyMemberDef Reader_memberlist[] = {
     { NULL }
 };
 
+static PyGetSetDef Reader_getsetlist[] = {
+    { "converters", (getter)Reader_get_converters,
+        (setter)Reader_set_converters},
+    {NULL},
+};
+
 
 static PyTypeObject Reader_Type = {
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -935,14 +1141,14 @@ static PyTypeObject Reader_Type = {
     (getiterfunc)Reader_iternext,           /*tp_iternext*/
     Reader_methods,                         /*tp_methods*/
     Reader_memberlist,                      /*tp_members*/
-    0,                                      /*tp_getset*/
+    Reader_getsetlist,                      /*tp_getset*/
 
 };
 
 static PyObject *
 csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
 {
-    PyObject * iterator, * dialect = NULL;
+    PyObject * iterator, * dialect = NULL, * converters = NULL;
     ReaderObj * self = PyObject_GC_New(ReaderObj, &Reader_Type);
 
     if (!self)
@@ -954,6 +1160,7 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->converters = NULL;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -971,7 +1178,25 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
         Py_DECREF(self);
         return NULL;
     }
-    self->dialect = (DialectObj *)_call_dialect(dialect, keyword_args);
+    if (keyword_args != NULL) {
+        converters = PyDict_GetItemString(keyword_args, "converters");
+    }
+    if (converters != NULL) {
+        /* The remaining keyword arguments are dialect settings. */
+        keyword_args = PyDict_Copy(keyword_args);
+        if (keyword_args == NULL ||
+            PyDict_DelItemString(keyword_args, "converters") < 0 ||
+            set_converters(self, converters) < 0) {
+            Py_XDECREF(keyword_args);
+            Py_DECREF(self);
+            return NULL;
+        }
+        self->dialect = (DialectObj *)_call_dialect(dialect, keyword_args);
+        Py_DECREF(keyword_args);
+    }
+    else {
+        self->dialect = (DialectObj *)_call_dialect(dialect, keyword_args);
+    }
     if (self->dialect == NULL) {
         Py_DECREF(self);
         return NULL;
@@ -981,6 +1206,188 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     return (PyObject *)self;
 }
 
+/*
+ * DICTREADER
+ */
+static PyObject *
+DictReader_iternext(DictReaderObj *self)
+{
+    PyObject *row, *dict, *key, *value;
+    Py_ssize_t i, nfields, nkeys;
+
+    /* Unlike the basic reader, skip blank rows, which would give a dict
+       full of restval values. */
+    do {
+        row = Reader_iternext(self->reader);
+        if (row == NULL)
+            return NULL;
+        nfields = PyList_GET_SIZE(row);
+        if (nfields == 0)
+            Py_DECREF(row);
+    } while (nfields == 0);
+
+    dict = PyODict_New();
+    if (dict == NULL)
+        goto error;
+    nkeys = PyTuple_GET_SIZE(self->fieldnames);
+    for (i = 0; i < nkeys; i++) {
+        key = PyTuple_GET_ITEM(self->fieldnames, i);
+        value = i < nfields ? PyList_GET_ITEM(row, i) : self->restval;
+        if (PyODict_SetItem(dict, key, value) < 0)
+            goto error;
+    }
+    if (nfields > nkeys) {
+        value = PyList_GetSlice(row, nkeys, nfields);
+        if (value == NULL)
+            goto error;
+        if (PyODict_SetItem(dict, self->restkey, value) < 0) {
+            Py_DECREF(value);
+            goto error;
+        }
+        Py_DECREF(value);
+    }
+    Py_DECREF(row);
+    return dict;
+
+error:
+    Py_XDECREF(dict);
+    Py_DECREF(row);
+    return NULL;
+}
+
+PyDoc_STRVAR(DictReader_readrows_doc,
+"readrows(n=-1) -> list of dicts\n"
+"\n"
+"Read up to n rows, or all remaining rows if n is negative or None.\n"
+"An empty list is returned at the end of the input.");
+
+static PyObject *
+DictReader_readrows(DictReaderObj *self, PyObject *args)
+{
+    Py_ssize_t n = -1;
+
+    if (!PyArg_ParseTuple(args, "|O&:readrows",
+                          _Py_convert_optional_to_ssize_t, &n))
+        return NULL;
+    return read_rows((PyObject *)self, (iternextfunc)DictReader_iternext, n);
+}
+
+static void
+DictReader_dealloc(DictReaderObj *self)
+{
+    PyObject_GC_UnTrack(self);
+    Py_XDECREF(self->reader);
+    Py_XDECREF(self->fieldnames);
+    Py_XDECREF(self->restkey);
+    Py_XDECREF(self->restval);
+    PyObject_GC_Del(self);
+}
+
+static int
+DictReader_traverse(DictReaderObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->reader);
+    Py_VISIT(self->fieldnames);
+    Py_VISIT(self->restkey);
+    Py_VISIT(self->restval);
+    return 0;
+}
+
+static int
+DictReader_clear(DictReaderObj *self)
+{
+    Py_CLEAR(self->reader);
+    Py_CLEAR(self->fieldnames);
+    Py_CLEAR(self->restkey);
+    Py_CLEAR(self->restval);
+    return 0;
+}
+
+static PyObject *
+DictReader_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"reader", "fieldnames", "restkey", "restval",
+                             NULL};
+    PyObject *reader, *fieldnames, *restkey = Py_None, *restval = Py_None;
+    DictReaderObj *self;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!O|OO:dictreader",
+                                     kwlist, &Reader_Type, &reader,
+                                     &fieldnames, &restkey, &restval))
+        return NULL;
+    fieldnames = PySequence_Tuple(fieldnames);
+    if (fieldnames == NULL)
+        return NULL;
+    self = PyObject_GC_New(DictReaderObj, type);
+    if (self == NULL) {
+        Py_DECREF(fieldnames);
+        return NULL;
+    }
+    Py_INCREF(reader);
+    self->reader = (ReaderObj *)reader;
+    self->fieldnames = fieldnames;
+    Py_INCREF(restkey);
+    self->restkey = restkey;
+    Py_INCREF(restval);
+    self->restval = restval;
+    PyObject_GC_Track(self);
+    return (PyObject *)self;
+}
+
+PyDoc_STRVAR(DictReader_Type_doc,
+"dictreader(reader, fieldnames, restkey=None, restval=None)\n"
+"\n"
+"Iterator over the rows of a CSV reader as OrderedDicts keyed by\n"
+"fieldnames.  This implements the iteration of csv.DictReader.");
+
+static struct PyMethodDef DictReader_methods[] = {
+    { "readrows", (PyCFunction)DictReader_readrows,
+        METH_VARARGS, DictReader_readrows_doc},
+    { NULL, NULL }
+};
+
+static PyTypeObject DictReader_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_csv.dictreader",                      /*tp_name*/
+    sizeof(DictReaderObj),                  /*tp_basicsize*/
+    0,                                      /*tp_itemsize*/
+    /* methods */
+    (destructor)DictReader_dealloc,         /*tp_dealloc*/
+    (printfunc)0,                           /*tp_print*/
+    (getattrfunc)0,                         /*tp_getattr*/
+    (setattrfunc)0,                         /*tp_setattr*/
+    0,                                      /*tp_reserved*/
+    (reprfunc)0,                            /*tp_repr*/
+    0,                                      /*tp_as_number*/
+    0,                                      /*tp_as_sequence*/
+    0,                                      /*tp_as_mapping*/
+    (hashfunc)0,                            /*tp_hash*/
+    (ternaryfunc)0,                         /*tp_call*/
+    (reprfunc)0,                            /*tp_str*/
+    0,                                      /*tp_getattro*/
+    0,                                      /*tp_setattro*/
+    0,                                      /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+    DictReader_Type_doc,                    /*tp_doc*/
+    (traverseproc)DictReader_traverse,      /*tp_traverse*/
+    (inquiry)DictReader_clear,              /*tp_clear*/
+    0,                                      /*tp_richcompare*/
+    0,                                      /*tp_weaklistoffset*/
+    PyObject_SelfIter,                      /*tp_iter*/
+    (getiterfunc)DictReader_iternext,       /*tp_iternext*/
+    DictReader_methods,                     /*tp_methods*/
+    0,                                      /*tp_members*/
+    0,                                      /*tp_getset*/
+    0,                                      /*tp_base*/
+    0,                                      /*tp_dict*/
+    0,                                      /*tp_descr_get*/
+    0,                                      /*tp_descr_set*/
+    0,                                      /*tp_dictoffset*/
+    0,                                      /*tp_init*/
+    0,                                      /*tp_alloc*/
+    DictReader_new,                         /*tp_new*/
+};
+
 /*
  * WRITER
  */
@@ -1564,7 +1971,13 @@ PyDoc_STRVAR(csv_reader_doc,
 "provided by the dialect.\n"
 "\n"
 "The returned object is an iterator.  Each iteration returns a row\n"
-"of the CSV file (which can span multiple input lines).\n");
+"of the CSV file (which can span multiple input lines).  Its readrows()\n"
+"method returns a list of several rows at once.\n"
+"\n"
+"The optional \"converters\" keyword argument is a sequence with a\n"
+"callable or None for each column.  Each field is passed to the\n"
+"converter of its column, and None leaves the field as a string.\n"
+"int and float are applied without calling them.\n");
 
 PyDoc_STRVAR(csv_writer_doc,
 "    csv_writer = csv.writer(fileobj [, dialect='excel']\n"
@@ -1648,6 +2061,9 @@ PyInit__csv(void)
     if (PyType_Ready(&Writer_Type) < 0)
         return NULL;
 
+    if (PyType_Ready(&DictReader_Type) < 0)
+        return NULL;
+
     /* Create the module and add the functions */
     module = PyModule_Create(&_csvmodule);
     if (module == NULL)
@@ -1682,6 +2098,12 @@ PyInit__csv(void)
     if (PyModule_AddObject(module, "Dialect", (PyObject *)&Dialect_Type))
         return NULL;
 
+    /* Add the DictReader iterator type */
+    Py_INCREF(&DictReader_Type);
+    if (PyModule_AddObject(module, "dictreader",
+                           (PyObject *)&DictReader_Type))
+        return NULL;
+
     /* Add the CSV exception object to the module. */
     _csvstate(module)->error_obj = PyErr_NewException("_csv.Error", NULL, NULL);
     if (_csvstate(module)->error_obj == NULL)
@@ -44,6 +44,17 @@ static PyMemberDef scanner_members[] = {
     {NULL}
 };
 
+/* The text scanned by a scanner: a str, or a UTF-8 encoded bytes-like object
+   scanned without decoding it first.  JSON syntax is ASCII, so UTF-8 data
+   is read as 1-byte characters and only decoded for string values. */
+typedef struct {
+    PyObject *pystr;
+    const void *data;
+    int kind;
+    int utf8;
+    Py_ssize_t len;
+} ScannerInput;
+
 typedef struct _PyEncoderObject {
     PyObject_HEAD
     PyObject *markers;
@@ -91,7 +102,7 @@ static PyObject *
 py_encode_basestring_ascii(PyObject* self UNUSED, PyObject *pystr);
 void init_json(void);
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr);
+scan_once_unicode(PyScannerObject *s, const ScannerInput *in, Py_ssize_t idx, Py_ssize_t *next_idx_ptr);
 static PyObject *
 _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx);
 static PyObject *
@@ -107,11 +118,11 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level, PyObject *write);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level, PyObject *write);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level, PyObject *write);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -355,6 +366,48 @@ raise_stop_iteration(Py_ssize_t idx)
     }
 }
 
+static int
+input_from_unicode(ScannerInput *in, PyObject *pystr)
+{
+    if (PyUnicode_READY(pystr) == -1)
+        return -1;
+    in->pystr = pystr;
+    in->data = PyUnicode_DATA(pystr);
+    in->kind = PyUnicode_KIND(pystr);
+    in->utf8 = 0;
+    in->len = PyUnicode_GET_LENGTH(pystr);
+    return 0;
+}
+
+static void
+raise_input_errmsg(const char *msg, const ScannerInput *in, Py_ssize_t end)
+{
+    /* Like raise_errmsg(), but for UTF-8 input the document is decoded and
+       end converted to an index in the decoded str.  Invalid UTF-8 raises
+       UnicodeDecodeError, as decoding the input before scanning it would. */
+    PyObject *doc;
+    const unsigned char *p;
+    Py_ssize_t i, pos;
+
+    if (!in->utf8) {
+        raise_errmsg(msg, in->pystr, end);
+        return;
+    }
+    doc = PyUnicode_DecodeUTF8((const char *)in->data, in->len,
+                               "surrogatepass");
+    if (doc == NULL)
+        return;
+    p = (const unsigned char *)in->data;
+    pos = end;
+    for (i = 0; i < end && i < in->len; i++) {
+        /* Continuation bytes don't start a character */
+        if ((p[i] & 0xc0) == 0x80)
+            pos--;
+    }
+    raise_errmsg(msg, doc, pos);
+    Py_DECREF(doc);
+}
+
 static PyObject *
 _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx) {
     /* return (rval, idx) tuple, stealing reference to rval */
@@ -398,9 +451,9 @@ _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx) {
     }
 
 static PyObject *
-scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next_end_ptr)
+scanstring_unicode(const ScannerInput *in, Py_ssize_t end, int strict, Py_ssize_t *next_end_ptr)
 {
-    /* Read the JSON string from PyUnicode pystr.
+    /* Read the JSON string from in.
     end is the index of the first character after the quote.
     if strict is zero then literal control characters are allowed
     *next_end_ptr is a return-by-reference index of the character
@@ -417,12 +470,9 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
     PyObject *chunks = NULL;
     PyObject *chunk = NULL;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return 0;
-
-    len = PyUnicode_GET_LENGTH(pystr);
-    buf = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
+    len = in->len;
+    buf = in->data;
+    kind = in->kind;
 
     if (end < 0 || len < end) {
         PyErr_SetString(PyExc_ValueError, "end is out of bounds");
@@ -437,20 +487,26 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
                 break;
             }
             else if (strict && c <= 0x1f) {
-                raise_errmsg("Invalid control character at", pystr, next);
+                raise_input_errmsg("Invalid control character at", in, next);
                 goto bail;
             }
         }
         if (!(c == '"' || c == '\\')) {
-            raise_errmsg("Unterminated string starting at", pystr, begin);
+            raise_input_errmsg("Unterminated string starting at", in, begin);
             goto bail;
         }
         /* Pick up this chunk if it's not zero length */
         if (next != end) {
             APPEND_OLD_CHUNK
+            if (in->utf8)
+                chunk = PyUnicode_DecodeUTF8(
+                    (const char*)buf + end,
+                    next - end,
+                    "surrogatepass");
+            else
                 chunk = PyUnicode_FromKindAndData(
                     kind,
-                    (char*)buf + kind * end,
+                    (const char*)buf + kind * end,
                     next - end);
             if (chunk == NULL) {
                 goto bail;
@@ -462,7 +518,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
             break;
         }
         if (next == len) {
-            raise_errmsg("Unterminated string starting at", pystr, begin);
+            raise_input_errmsg("Unterminated string starting at", in, begin);
             goto bail;
         }
         c = PyUnicode_READ(kind, buf, next);
@@ -481,7 +537,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
                 default: c = 0;
             }
             if (c == 0) {
-                raise_errmsg("Invalid \\escape", pystr, end - 2);
+                raise_input_errmsg("Invalid \\escape", in, end - 2);
                 goto bail;
             }
         }
@@ -490,7 +546,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
             next++;
             end = next + 4;
             if (end >= len) {
-                raise_errmsg("Invalid \\uXXXX escape", pystr, next - 1);
+                raise_input_errmsg("Invalid \\uXXXX escape", in, next - 1);
                 goto bail;
             }
             /* Decode 4 hex digits */
@@ -508,7 +564,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
                     case 'F':
                         c |= (digit - 'A' + 10); break;
                     default:
-                        raise_errmsg("Invalid \\uXXXX escape", pystr, end - 5);
+                        raise_input_errmsg("Invalid \\uXXXX escape", in, end - 5);
                         goto bail;
                 }
             }
@@ -533,7 +589,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
                         case 'F':
                             c2 |= (digit - 'A' + 10); break;
                         default:
-                            raise_errmsg("Invalid \\uXXXX escape", pystr, end - 5);
+                            raise_input_errmsg("Invalid \\uXXXX escape", in, end - 5);
                             goto bail;
                     }
                 }
@@ -599,7 +655,10 @@ py_scanstring(PyObject* self UNUSED, PyObject *args)
         return NULL;
     }
     if (PyUnicode_Check(pystr)) {
-        rval = scanstring_unicode(pystr, end, strict, &next_end);
+        ScannerInput in;
+        if (input_from_unicode(&in, pystr) < 0)
+            return NULL;
+        rval = scanstring_unicode(&in, end, strict, &next_end);
     }
     else {
         PyErr_Format(PyExc_TypeError,
@@ -698,16 +757,16 @@ scanner_clear(PyObject *self)
 }
 
 static PyObject *
-_parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+_parse_object_unicode(PyScannerObject *s, const ScannerInput *in, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
-    /* Read a JSON object from PyUnicode pystr.
+    /* Read a JSON object from in.
     idx is the index of the first character after the opening curly brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing curly brace.
 
     Returns a new PyObject (usually a dict, but object_hook can change that)
     */
-    void *str;
+    const void *str;
     int kind;
     Py_ssize_t end_idx;
     PyObject *val = NULL;
@@ -716,12 +775,9 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
     Py_ssize_t next_idx;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
-
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = in->data;
+    kind = in->kind;
+    end_idx = in->len - 1;
 
     if (has_pairs_hook)
         rval = PyList_New(0);
@@ -740,10 +796,10 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
 
             /* read key */
             if (idx > end_idx || PyUnicode_READ(kind, str, idx) != '"') {
-                raise_errmsg("Expecting property name enclosed in double quotes", pystr, idx);
+                raise_input_errmsg("Expecting property name enclosed in double quotes", in, idx);
                 goto bail;
             }
-            key = scanstring_unicode(pystr, idx + 1, s->strict, &next_idx);
+            key = scanstring_unicode(in, idx + 1, s->strict, &next_idx);
             if (key == NULL)
                 goto bail;
             memokey = PyDict_GetItem(s->memo, key);
@@ -761,14 +817,14 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
             /* skip whitespace between key and : delimiter, read :, skip whitespace */
             while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
             if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ':') {
-                raise_errmsg("Expecting ':' delimiter", pystr, idx);
+                raise_input_errmsg("Expecting ':' delimiter", in, idx);
                 goto bail;
             }
             idx++;
             while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
             /* read any JSON term */
-            val = scan_once_unicode(s, pystr, idx, &next_idx);
+            val = scan_once_unicode(s, in, idx, &next_idx);
             if (val == NULL)
                 goto bail;
 
@@ -799,7 +855,7 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
             if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == '}')
                 break;
             if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
-                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                raise_input_errmsg("Expecting ',' delimiter", in, idx);
                 goto bail;
             }
             idx++;
@@ -832,31 +888,28 @@ bail:
 }
 
 static PyObject *
-_parse_array_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr) {
-    /* Read a JSON array from PyUnicode pystr.
+_parse_array_unicode(PyScannerObject *s, const ScannerInput *in, Py_ssize_t idx, Py_ssize_t *next_idx_ptr) {
+    /* Read a JSON array from in.
     idx is the index of the first character after the opening brace.
     *next_idx_ptr is a return-by-reference index to the first character after
         the closing brace.
 
     Returns a new PyList
     */
-    void *str;
+    const void *str;
     int kind;
     Py_ssize_t end_idx;
     PyObject *val = NULL;
     PyObject *rval;
     Py_ssize_t next_idx;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
-
     rval = PyList_New(0);
     if (rval == NULL)
         return NULL;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = in->data;
+    kind = in->kind;
+    end_idx = in->len - 1;
 
     /* skip whitespace after [ */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
@@ -866,7 +919,7 @@ _parse_array_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssi
         while (1) {
 
             /* read any JSON term  */
-            val = scan_once_unicode(s, pystr, idx, &next_idx);
+            val = scan_once_unicode(s, in, idx, &next_idx);
             if (val == NULL)
                 goto bail;
 
@@ -883,7 +936,7 @@ _parse_array_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssi
             if (idx <= end_idx && PyUnicode_READ(kind, str, idx) == ']')
                 break;
             if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ',') {
-                raise_errmsg("Expecting ',' delimiter", pystr, idx);
+                raise_input_errmsg("Expecting ',' delimiter", in, idx);
                 goto bail;
             }
             idx++;
@@ -895,7 +948,7 @@ _parse_array_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssi
 
     /* verify that idx < end_idx, PyUnicode_READ(kind, str, idx) should be ']' */
     if (idx > end_idx || PyUnicode_READ(kind, str, idx) != ']') {
-        raise_errmsg("Expecting value", pystr, end_idx);
+        raise_input_errmsg("Expecting value", in, end_idx);
         goto bail;
     }
     *next_idx_ptr = idx + 1;
@@ -933,8 +986,8 @@ _parse_constant(PyScannerObject *s, const char *constant, Py_ssize_t idx, Py_ssi
 }
 
 static PyObject *
-_match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_ssize_t *next_idx_ptr) {
-    /* Read a JSON number from PyUnicode pystr.
+_match_number_unicode(PyScannerObject *s, const ScannerInput *in, Py_ssize_t start, Py_ssize_t *next_idx_ptr) {
+    /* Read a JSON number from in.
     idx is the index of the first character of the number
     *next_idx_ptr is a return-by-reference index to the first character after
         the number.
@@ -943,7 +996,7 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
         PyLong, or PyFloat.
         May return other types if parse_int or parse_float are set
     */
-    void *str;
+    const void *str;
     int kind;
     Py_ssize_t end_idx;
     Py_ssize_t idx = start;
@@ -952,12 +1005,9 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
     PyObject *numstr = NULL;
     PyObject *custom_func;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
-
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    str = in->data;
+    kind = in->kind;
+    end_idx = in->len - 1;
 
     /* read a sign if it's there, make sure it's not the end of the string */
     if (PyUnicode_READ(kind, str, idx) == '-') {
@@ -1020,7 +1070,7 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
     if (custom_func) {
         /* copy the section we determined to be a number */
         numstr = PyUnicode_FromKindAndData(kind,
-                                           (char*)str + kind * start,
+                                           (const char*)str + kind * start,
                                            idx - start);
         if (numstr == NULL)
             return NULL;
@@ -1050,9 +1100,9 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
 }
 
 static PyObject *
-scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
+scan_once_unicode(PyScannerObject *s, const ScannerInput *in, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
-    /* Read one JSON term (of any kind) from PyUnicode pystr.
+    /* Read one JSON term (of any kind) from in.
     idx is the index of the first character of the term
     *next_idx_ptr is a return-by-reference index to the first character after
         the number.
@@ -1060,16 +1110,13 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
     Returns a new PyObject representation of the term.
     */
     PyObject *res;
-    void *str;
+    const void *str;
     int kind;
     Py_ssize_t length;
 
-    if (PyUnicode_READY(pystr) == -1)
-        return NULL;
-
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    length = PyUnicode_GET_LENGTH(pystr);
+    str = in->data;
+    kind = in->kind;
+    length = in->len;
 
     if (idx < 0) {
         PyErr_SetString(PyExc_ValueError, "idx cannot be negative");
@@ -1083,13 +1130,13 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
     switch (PyUnicode_READ(kind, str, idx)) {
         case '"':
             /* string */
-            return scanstring_unicode(pystr, idx + 1, s->strict, next_idx_ptr);
+            return scanstring_unicode(in, idx + 1, s->strict, next_idx_ptr);
         case '{':
             /* object */
             if (Py_EnterRecursiveCall(" while decoding a JSON object "
                                       "from a unicode string"))
                 return NULL;
-            res = _parse_object_unicode(s, pystr, idx + 1, next_idx_ptr);
+            res = _parse_object_unicode(s, in, idx + 1, next_idx_ptr);
             Py_LeaveRecursiveCall();
             return res;
         case '[':
@@ -1097,7 +1144,7 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
             if (Py_EnterRecursiveCall(" while decoding a JSON array "
                                       "from a unicode string"))
                 return NULL;
-            res = _parse_array_unicode(s, pystr, idx + 1, next_idx_ptr);
+            res = _parse_array_unicode(s, in, idx + 1, next_idx_ptr);
             Py_LeaveRecursiveCall();
             return res;
         case 'n':
@@ -1158,7 +1205,7 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
             break;
     }
     /* Didn't find a string, object, array, or named constant. Look for a number. */
-    return _match_number_unicode(s, pystr, idx, next_idx_ptr);
+    return _match_number_unicode(s, in, idx, next_idx_ptr);
 }
 
 static PyObject *
@@ -1177,11 +1224,29 @@ scanner_call(PyObject *self, PyObject *args, PyObject *kwds)
         return NULL;
 
     if (PyUnicode_Check(pystr)) {
-        rval = scan_once_unicode(s, pystr, idx, &next_idx);
+        ScannerInput in;
+        if (input_from_unicode(&in, pystr) < 0)
+            return NULL;
+        rval = scan_once_unicode(s, &in, idx, &next_idx);
+    }
+    else if (PyObject_CheckBuffer(pystr)) {
+        /* UTF-8 encoded bytes-like object */
+        ScannerInput in;
+        Py_buffer view;
+        if (PyObject_GetBuffer(pystr, &view, PyBUF_SIMPLE) < 0)
+            return NULL;
+        in.pystr = pystr;
+        in.data = view.buf;
+        in.kind = PyUnicode_1BYTE_KIND;
+        in.utf8 = 1;
+        in.len = view.len;
+        rval = scan_once_unicode(s, &in, idx, &next_idx);
+        PyBuffer_Release(&view);
     }
     else {
         PyErr_Format(PyExc_TypeError,
-                 "first argument must be a string, not %.80s",
+                 "first argument must be a string or a bytes-like object, "
+                 "not %.80s",
                  Py_TYPE(pystr)->tp_name);
         return NULL;
     }
@@ -1309,6 +1374,12 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return NULL;
     }
+    if (indent != Py_None && !PyUnicode_Check(indent)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 4 must be str or None, "
+                     "not %.200s", Py_TYPE(indent)->tp_name);
+        return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1341,28 +1412,94 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)s;
 }
 
+/* Number of pending strings passed at once to the write() callable of a
+   streaming encoder call */
+#define ENCODER_WRITE_PIECES 8192
+
+static int
+encoder_write(_PyAccu *acc, PyObject *write)
+{
+    /* Pass the accumulated strings to write() and reset the accumulator */
+    PyObject *chunks, *rv;
+    Py_ssize_t i;
+
+    if (acc->large == NULL && PyList_GET_SIZE(acc->small) == 0)
+        return 0;
+    chunks = _PyAccu_FinishAsList(acc);
+    if (chunks == NULL)
+        return -1;
+    for (i = 0; i < PyList_GET_SIZE(chunks); i++) {
+        rv = PyObject_CallFunctionObjArgs(write,
+                                          PyList_GET_ITEM(chunks, i), NULL);
+        if (rv == NULL) {
+            Py_DECREF(chunks);
+            return -1;
+        }
+        Py_DECREF(rv);
+    }
+    Py_DECREF(chunks);
+    return _PyAccu_Init(acc);
+}
+
+static int
+encoder_maybe_write(_PyAccu *acc, PyObject *write)
+{
+    /* Call encoder_write() if enough strings are pending */
+    if (write == NULL || PyList_GET_SIZE(acc->small) < ENCODER_WRITE_PIECES)
+        return 0;
+    return encoder_write(acc, write);
+}
+
 static PyObject *
 encoder_call(PyObject *self, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level", "write", NULL};
     PyObject *obj;
+    PyObject *write = Py_None;
     Py_ssize_t indent_level;
     PyEncoderObject *s;
     _PyAccu acc;
 
     assert(PyEncoder_Check(self));
     s = (PyEncoderObject *)self;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|O:_iterencode", kwlist,
+        &obj, &indent_level, &write))
         return NULL;
+    if (write == Py_None)
+        write = NULL;
     if (_PyAccu_Init(&acc))
         return NULL;
-    if (encoder_listencode_obj(s, &acc, obj, indent_level)) {
+    if (encoder_listencode_obj(s, &acc, obj, indent_level, write)) {
+        _PyAccu_Destroy(&acc);
+        return NULL;
+    }
+    if (write == NULL)
+        return _PyAccu_FinishAsList(&acc);
+    if (encoder_write(&acc, write)) {
         _PyAccu_Destroy(&acc);
         return NULL;
     }
-    return _PyAccu_FinishAsList(&acc);
+    _PyAccu_Destroy(&acc);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+encoder_newline_indent(PyEncoderObject *s, Py_ssize_t indent_level)
+{
+    /* Return '\n' + indent * indent_level */
+    PyObject *newline_indent, *indent;
+
+    newline_indent = PyUnicode_FromOrdinal('\n');
+    if (newline_indent == NULL)
+        return NULL;
+    indent = PySequence_Repeat(s->indent, indent_level);
+    if (indent == NULL) {
+        Py_DECREF(newline_indent);
+        return NULL;
+    }
+    PyUnicode_AppendAndDel(&newline_indent, indent);
+    return newline_indent;
 }
 
 static PyObject *
@@ -1456,7 +1593,8 @@ _steal_accumulate(_PyAccu *acc, PyObject *stolen)
 
 static int
 encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
-                       PyObject *obj, Py_ssize_t indent_level)
+                       PyObject *obj, Py_ssize_t indent_level,
+                       PyObject *write)
 {
     /* Encode Python object obj to a JSON term */
     PyObject *newobj;
@@ -1490,14 +1628,14 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_list(s, acc, obj, indent_level);
+        rv = encoder_listencode_list(s, acc, obj, indent_level, write);
         Py_LeaveRecursiveCall();
         return rv;
     }
     else if (PyDict_Check(obj)) {
         if (Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_dict(s, acc, obj, indent_level);
+        rv = encoder_listencode_dict(s, acc, obj, indent_level, write);
         Py_LeaveRecursiveCall();
         return rv;
     }
@@ -1531,7 +1669,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
             Py_XDECREF(ident);
             return -1;
         }
-        rv = encoder_listencode_obj(s, acc, newobj, indent_level);
+        rv = encoder_listencode_obj(s, acc, newobj, indent_level, write);
         Py_LeaveRecursiveCall();
 
         Py_DECREF(newobj);
@@ -1552,7 +1690,8 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
 
 static int
 encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
-                        PyObject *dct, Py_ssize_t indent_level)
+                        PyObject *dct, Py_ssize_t indent_level,
+                        PyObject *write)
 {
     /* Encode Python dict dct a JSON term */
     static PyObject *open_dict = NULL;
@@ -1563,6 +1702,8 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
     PyObject *it = NULL;
     PyObject *items;
     PyObject *item = NULL;
+    PyObject *newline_indent = NULL;
+    PyObject *separator = NULL;
     Py_ssize_t idx;
 
     if (open_dict == NULL || close_dict == NULL || empty_dict == NULL) {
@@ -1595,13 +1736,19 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         goto bail;
 
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        newline_indent = encoder_newline_indent(s, indent_level);
+        if (newline_indent == NULL)
+            goto bail;
+        separator = PyUnicode_Concat(s->item_separator, newline_indent);
+        if (separator == NULL)
+            goto bail;
+        if (_PyAccu_Accumulate(acc, newline_indent))
+            goto bail;
+    }
+    else {
+        separator = s->item_separator;
+        Py_INCREF(separator);
     }
 
     items = PyMapping_Items(dct);
@@ -1657,7 +1804,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
 
         if (idx) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (_PyAccu_Accumulate(acc, separator))
                 goto bail;
         }
 
@@ -1674,10 +1821,12 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             goto bail;
 
         value = PyTuple_GET_ITEM(item, 1);
-        if (encoder_listencode_obj(s, acc, value, indent_level))
+        if (encoder_listencode_obj(s, acc, value, indent_level, write))
             goto bail;
         idx += 1;
-        Py_DECREF(item);
+        Py_CLEAR(item);
+        if (encoder_maybe_write(acc, write))
+            goto bail;
     }
     if (PyErr_Occurred())
         goto bail;
@@ -1688,12 +1837,16 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             goto bail;
         Py_CLEAR(ident);
     }
-    /* TODO DOES NOT RUN; dead code
     if (s->indent != Py_None) {
-        indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        Py_CLEAR(newline_indent);
+        newline_indent = encoder_newline_indent(s, indent_level - 1);
+        if (newline_indent == NULL)
+            goto bail;
+        if (_PyAccu_Accumulate(acc, newline_indent))
+            goto bail;
+        Py_CLEAR(newline_indent);
+    }
+    Py_CLEAR(separator);
     if (_PyAccu_Accumulate(acc, close_dict))
         goto bail;
     return 0;
@@ -1703,13 +1856,16 @@ bail:
     Py_XDECREF(item);
     Py_XDECREF(kstr);
     Py_XDECREF(ident);
+    Py_XDECREF(newline_indent);
+    Py_XDECREF(separator);
     return -1;
 }
 
 
 static int
 encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
-                        PyObject *seq, Py_ssize_t indent_level)
+                        PyObject *seq, Py_ssize_t indent_level,
+                        PyObject *write)
 {
     /* Encode Python list seq to a JSON term */
     static PyObject *open_array = NULL;
@@ -1717,6 +1873,8 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
     static PyObject *empty_array = NULL;
     PyObject *ident = NULL;
     PyObject *s_fast = NULL;
+    PyObject *newline_indent = NULL;
+    PyObject *separator = NULL;
     Py_ssize_t i;
 
     if (open_array == NULL || close_array == NULL || empty_array == NULL) {
@@ -1754,21 +1912,29 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
     if (_PyAccu_Accumulate(acc, open_array))
         goto bail;
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        newline_indent = encoder_newline_indent(s, indent_level);
+        if (newline_indent == NULL)
+            goto bail;
+        separator = PyUnicode_Concat(s->item_separator, newline_indent);
+        if (separator == NULL)
+            goto bail;
+        if (_PyAccu_Accumulate(acc, newline_indent))
+            goto bail;
+    }
+    else {
+        separator = s->item_separator;
+        Py_INCREF(separator);
     }
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (_PyAccu_Accumulate(acc, separator))
                 goto bail;
         }
-        if (encoder_listencode_obj(s, acc, obj, indent_level))
+        if (encoder_listencode_obj(s, acc, obj, indent_level, write))
+            goto bail;
+        if (encoder_maybe_write(acc, write))
             goto bail;
     }
     if (ident != NULL) {
@@ -1777,12 +1943,16 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         Py_CLEAR(ident);
     }
 
-    /* TODO: DOES NOT RUN
     if (s->indent != Py_None) {
-        indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        Py_CLEAR(newline_indent);
+        newline_indent = encoder_newline_indent(s, indent_level - 1);
+        if (newline_indent == NULL)
+            goto bail;
+        if (_PyAccu_Accumulate(acc, newline_indent))
+            goto bail;
+        Py_CLEAR(newline_indent);
+    }
+    Py_CLEAR(separator);
     if (_PyAccu_Accumulate(acc, close_array))
         goto bail;
     Py_DECREF(s_fast);
@@ -1790,6 +1960,8 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
 
 bail:
     Py_XDECREF(ident);
+    Py_XDECREF(newline_indent);
+    Py_XDECREF(separator);
     Py_DECREF(s_fast);
     return -1;
 }
@@ -1834,7 +2006,7 @@ encoder_clear(PyObject *self)
     return 0;
 }
 
-PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level) -> iterable");
+PyDoc_STRVAR(encoder_doc, "_iterencode(obj, _current_indent_level, write=None) -> iterable");
 
 static
 PyTypeObject PyEncoderType = {
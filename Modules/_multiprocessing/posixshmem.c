@@ -0,0 +1,114 @@
+/*
+ * posixshmem.c - POSIX shared memory support for multiprocessing.
+ *
+ * Provides thin wrappers around shm_open() and shm_unlink(); the mapping
+ * itself is done by the mmap module.
+ */
+
+#define PY_SSIZE_T_CLEAN
+
+#include "Python.h"
+
+/* for shm_open() and shm_unlink() */
+#include <sys/mman.h>
+
+/*[clinic input]
+module _posixshmem
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=a416734e49164bf8]*/
+
+/*[clinic input]
+_posixshmem.shm_open -> int
+
+    path: unicode
+    flags: int
+    mode: int = 0o777
+
+Open a shared memory object.  Returns a file descriptor (integer).
+[clinic start generated code]*/
+
+static int
+_posixshmem_shm_open_impl(PyObject *module, PyObject *path, int flags,
+                          int mode)
+/*[clinic end generated code: output=8d110171a4fa20df input=40cc9d242b3423b0]*/
+{
+    int fd;
+    int async_err = 0;
+    const char *name = PyUnicode_AsUTF8(path);
+    if (name == NULL) {
+        return -1;
+    }
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        fd = shm_open(name, flags, mode);
+        Py_END_ALLOW_THREADS
+    } while (fd < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (fd < 0) {
+        if (!async_err)
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return -1;
+    }
+
+    return fd;
+}
+
+/*[clinic input]
+_posixshmem.shm_unlink
+
+    path: unicode
+
+Remove a shared memory object (similar to unlink()).
+
+Remove a shared memory object name, and, once all processes have unmapped
+the object, de-allocate and destroy the contents of the associated memory
+region.
+[clinic start generated code]*/
+
+static PyObject *
+_posixshmem_shm_unlink_impl(PyObject *module, PyObject *path)
+/*[clinic end generated code: output=42f8b23d134b9ff5 input=18d10f9220703156]*/
+{
+    int rv;
+    int async_err = 0;
+    const char *name = PyUnicode_AsUTF8(path);
+    if (name == NULL) {
+        return NULL;
+    }
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        rv = shm_unlink(name);
+        Py_END_ALLOW_THREADS
+    } while (rv < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (rv < 0) {
+        if (!async_err)
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+#include "clinic/posixshmem.c.h"
+
+static PyMethodDef module_methods[] = {
+    _POSIXSHMEM_SHM_OPEN_METHODDEF
+    _POSIXSHMEM_SHM_UNLINK_METHODDEF
+    {NULL, NULL}
+};
+
+
+static struct PyModuleDef posixshmem_module = {
+    PyModuleDef_HEAD_INIT,
+    "_posixshmem",
+    "POSIX shared memory module",
+    -1,
+    module_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__posixshmem(void)
+{
+    return PyModule_Create(&posixshmem_module);
+}
@@ -131,6 +131,10 @@ static const char usage_5[] =
 "PYTHONHOME   : alternate <prefix> directory (or <prefix>%lc<exec_prefix>).\n"
 "               The default module search path uses %s.\n"
 "PYTHONCASEOK : ignore case in 'import' statements (Windows).\n"
+"PYTHONIMPORTCACHE: import cache file written by\n"
+"               importlib.util.write_import_cache().\n"
+"PYTHONPATHCACHE: only check import path directories once; file\n"
+"               written by importlib.util.save_path_cache().\n"
 "PYTHONIOENCODING: Encoding[:errors] used for stdin/stdout/stderr.\n"
 "PYTHONFAULTHANDLER: dump the Python traceback on fatal errors.\n";
 static const char usage_6[] =
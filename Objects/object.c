@@ -1878,6 +1878,9 @@ _Py_ReadyTypes(void)
 
     if (PyType_Ready(&_PyCoroWrapper_Type) < 0)
         Py_FatalError("Can't initialize coroutine wrapper type");
+
+    if (PyType_Ready(&PyPickleBuffer_Type) < 0)
+        Py_FatalError("Can't initialize pickle buffer type");
 }
 
 
@@ -9,6 +9,7 @@ import decimal
 import imp
 import importlib
 import importlib.machinery
+import importlib.util
 import json
 import os
 import py_compile
@@ -17,10 +18,12 @@ import tabnanny
 import timeit
 
 
-def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3):
+def bench(name, cleanup=lambda: None, *, seconds=1, repeat=3, attr=None):
     """Bench the given statement as many times as necessary until total
     executions take one second."""
     stmt = "__import__({!r})".format(name)
+    if attr is not None:
+        stmt += ".{}".format(attr)
     timer = timeit.Timer(stmt)
     for x in range(repeat):
         total_time = 0
@@ -162,6 +165,28 @@ tabnanny_using_bytecode = _using_bytecode(tabnanny)
 decimal_using_bytecode = _using_bytecode(decimal)
 
 
+def _lazy(module, attr=None):
+    name = module.__name__
+    def lazy_benchmark(seconds, repeat):
+        """Lazy source w/ bytecode{}: {}"""
+        py_compile.compile(module.__file__)
+        importlib.util.enable_lazy_imports(name)
+        try:
+            yield from bench(name, lambda: sys.modules.pop(name),
+                             repeat=repeat, seconds=seconds, attr=attr)
+        finally:
+            importlib.util.disable_lazy_imports()
+
+    lazy_benchmark.__doc__ = lazy_benchmark.__doc__.format(
+                        '' if attr is None else ', first access', name)
+    return lazy_benchmark
+
+tabnanny_lazy = _lazy(tabnanny)
+tabnanny_lazy_access = _lazy(tabnanny, 'check')
+decimal_lazy = _lazy(decimal)
+decimal_lazy_access = _lazy(decimal, 'Decimal')
+
+
 def main(import_, options):
     if options.source_file:
         with options.source_file:
@@ -176,6 +201,8 @@ def main(import_, options):
                   tabnanny_wo_bytecode, tabnanny_using_bytecode,
                   decimal_writing_bytecode,
                   decimal_wo_bytecode, decimal_using_bytecode,
+                  tabnanny_lazy, tabnanny_lazy_access,
+                  decimal_lazy, decimal_lazy_access,
                 )
     if options.benchmark:
         for b in benchmarks:
@@ -1589,6 +1589,18 @@ class PyBuildExt(build_ext):
         exts.append ( Extension('_multiprocessing', multiprocessing_srcs,
                                 define_macros=list(macros.items()),
                                 include_dirs=["Modules/_multiprocessing"]))
+
+        # POSIX shared memory, used by multiprocessing.shared_memory
+        if (host_platform != 'win32' and
+            find_file('sys/mman.h', inc_dirs, []) is not None):
+            posixshmem_libs = []
+            if self.compiler.find_library_file(lib_dirs, 'rt'):
+                # shm_open() lives in librt on older glibc and others
+                posixshmem_libs.append('rt')
+            exts.append( Extension('_posixshmem',
+                                   ['_multiprocessing/posixshmem.c'],
+                                   libraries=posixshmem_libs,
+                                   include_dirs=["Modules/_multiprocessing"]))
         # End multiprocessing
 
         # Platform-specific libraries